@@ -0,0 +1,9 @@
+from agentic_ai.cache.result_cache import ResultCache, content_hash, result_cache
+from agentic_ai.cache.single_flight import SingleFlight
+
+__all__ = [
+    "ResultCache",
+    "SingleFlight",
+    "content_hash",
+    "result_cache",
+]
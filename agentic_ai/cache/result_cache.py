@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Any, Dict, Optional
+
+from agentic_ai.config.settings import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS crew_results (
+    kind TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    PRIMARY KEY (kind, subject, content_hash)
+);
+CREATE INDEX IF NOT EXISTS ix_crew_results_last_used_at ON crew_results (last_used_at);
+"""
+
+
+def content_hash(payload: Any) -> str:
+    """Stable digest of a JSON-like payload (key order does not matter)."""
+    raw = json.dumps(payload, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Crew outputs on disk (SQLite), keyed by ``(kind, subject, content_hash)``:
+    a summary is reused only while the data it was computed from is unchanged.
+    Entries expire after ``ttl`` seconds; beyond ``max_entries`` the least
+    recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.path = path or settings.RESULT_CACHE_PATH
+        self.ttl = settings.RESULT_CACHE_TTL if ttl is None else ttl
+        self.max_entries = settings.RESULT_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._ready:
+            conn.executescript(_SCHEMA)
+            self._ready = True
+        return conn
+
+    def _get(self, kind: str, subject: str, digest: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                """
+                SELECT value FROM crew_results
+                WHERE kind = ? AND subject = ? AND content_hash = ? AND expires_at > ?
+                """,
+                (kind, subject, digest, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                """
+                UPDATE crew_results SET last_used_at = ?
+                WHERE kind = ? AND subject = ? AND content_hash = ?
+                """,
+                (now, kind, subject, digest),
+            )
+        return json.loads(row[0])
+
+    def _set(self, kind: str, subject: str, digest: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            # Older versions of this subject can never be hit again.
+            conn.execute(
+                "DELETE FROM crew_results WHERE kind = ? AND subject = ? AND content_hash <> ?",
+                (kind, subject, digest),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO crew_results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, subject, digest, json.dumps(value, default=str), now, now + self.ttl, now),
+            )
+            conn.execute("DELETE FROM crew_results WHERE expires_at <= ?", (now,))
+            conn.execute(
+                """
+                DELETE FROM crew_results WHERE rowid IN (
+                    SELECT rowid FROM crew_results
+                    ORDER BY last_used_at DESC
+                    LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_entries,),
+            )
+
+    async def get(self, kind: str, subject: str, digest: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, kind, subject, digest)
+
+    async def set(self, kind: str, subject: str, digest: str, value: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._set, kind, subject, digest, value)
+
+
+result_cache = ResultCache()
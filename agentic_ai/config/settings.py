@@ -1,3 +1,5 @@
+from typing import Dict
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -40,6 +42,39 @@ class Settings(BaseSettings):
         description="Protocol for OpenTelemetry traces exporter.",
     )
 
+    RESULT_CACHE_PATH: str = Field(
+        default=".cache/crew_results.sqlite3",
+        description="SQLite file holding cached project and role summaries.",
+    )
+    RESULT_CACHE_TTL: float = Field(
+        default=86400,
+        description="Seconds a cached summary is served for unchanged data.",
+    )
+    RESULT_CACHE_MAX_ENTRIES: int = Field(
+        default=1000,
+        description="Cached summaries kept; the least recently used are evicted first.",
+    )
+
+    CYCLE_SLA_DAYS: Dict[str, int] = Field(
+        default_factory=dict,
+        description='Per-cycle SLA in days keyed by "Start → End" agent names; other cycles use 20.',
+    )
+
+    PROJECT_SUMMARY_PARALLEL: bool = Field(
+        default=True,
+        description="Run independent project-summary tasks concurrently instead of one by one.",
+    )
+
+    ROLE_SUMMARY_PARALLEL: bool = Field(
+        default=True,
+        description="Run the five role-summary section tasks concurrently before composing.",
+    )
+
+    PROMPT_TOKEN_BUDGET: int = Field(
+        default=1500,
+        description="Approximate token budget for each compacted overview view put into a task prompt.",
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env", env_file_encoding="utf-8", extra="allow"
     )
@@ -4,11 +4,22 @@ from agentic_ai.src.real_estate_query import RealEsateFlow
 from agentic_ai.src.construction_query import ConstructionQueryFlow
 from agentic_ai.src.project_activities import ProjectSummaryFlow
 from agentic_ai.src.role_based_agents import RoleSummaryFlow  # ✅ add
+from agentic_ai.cache import SingleFlight
 from agentic_ai.exceptions import APIError
 import json
 
+# Identical requests that arrive while a crew is already running for them
+# share that run (and its result or error) instead of starting another.
+_in_flight = SingleFlight()
+
 
 async def sql_query_generator(user_prompt: str) -> None:
+    return await _in_flight.do(
+        ("query", user_prompt.strip()), lambda: _run_sql_query(user_prompt)
+    )
+
+
+async def _run_sql_query(user_prompt: str):
     try:
         flow = SQLQueryGeneratorFlow()
         result = await flow.kickoff_async(inputs={"user_prompt": user_prompt})
@@ -33,13 +44,23 @@ async def construction_query_generator(user_prompt: str) -> None:
         raise
 
 
-async def project_summary_generator(project_id: str):
+async def project_summary_generator(project_id: str, force_refresh: bool = False):
     """
-    Kick off the ProjectSummaryFlow to analyze a project.
+    Kick off the ProjectSummaryFlow to analyze a project. The crew only runs
+    when the project's data changed since the cached summary (or ``force_refresh``).
     """
+    return await _in_flight.do(
+        ("project_summary", project_id, force_refresh),
+        lambda: _run_project_summary(project_id, force_refresh),
+    )
+
+
+async def _run_project_summary(project_id: str, force_refresh: bool):
     try:
         flow = ProjectSummaryFlow()
-        result = await flow.kickoff_async(inputs={"project_id": project_id})
+        result = await flow.kickoff_async(
+            inputs={"project_id": project_id, "force_refresh": force_refresh}
+        )
         return result
     except APIError as e:
         # Parse APIError message if it's JSON
@@ -51,14 +72,24 @@ async def project_summary_generator(project_id: str):
         raise APIError(status_code=e.status_code, message=detail)
 
 
-async def role_summary_generator(role: str):
+async def role_summary_generator(role: str, force_refresh: bool = False):
     """
     Kick off the RoleSummaryFlow to analyze an agent role (status, delays, anomalies, etc.).
+    Cached like project summaries.
     """
+    role = unquote(role)
+    return await _in_flight.do(
+        ("role_summary", role, force_refresh),
+        lambda: _run_role_summary(role, force_refresh),
+    )
+
+
+async def _run_role_summary(role: str, force_refresh: bool):
     try:
         flow = RoleSummaryFlow()
-        role = unquote(role)
-        result = await flow.kickoff_async(inputs={"role": role})
+        result = await flow.kickoff_async(
+            inputs={"role": role, "force_refresh": force_refresh}
+        )
         return result
     except APIError as e:
         try:
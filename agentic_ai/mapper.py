@@ -73,7 +73,7 @@ AGENTS = {
             "Merge outputs from diagnostics, anomaly triage, cycles, zoning focus, and vendor attribution into a single concise narrative with prioritized actions."
         ),
         "backstory": (
-            "You write for busy leaders: crisp headline, top 3 risks, next 3 actions, and a simple ETA outlook with confidence."
+            "You write for busy leaders: crisp headline, top 3 risks, next 3 actions, and an ETA outlook quoted from the simulated forecast."
         ),
         "verbose": True,
     },
@@ -83,13 +83,14 @@ AGENTS = {
 TASKS = {
     "fetch_project_summary_task": {
         "description": (
-            "Call the backend projects/{project_id}/summary endpoint and return the structured payload as overview. Do not mutate fields. "
-            "If any top-level key is missing, include a notes key to highlight gaps."
+            "Return the compacted projects/{project_id}/summary payload as overview. Do not mutate fields. "
+            "If any top-level key is missing, include a notes key to highlight gaps. Entries with an omitted count summarize list items "
+            "left out to keep the payload within budget."
         ),
         "steps": [
-            "Invoke GET /projects/{project_id}/summary",
+            "Read the compacted project overview",
             "Validate presence of project, milestones, anomalies, cycles",
-            "Return the raw JSON as overview plus a notes list for any gaps"
+            "Return it as overview plus a notes list for any gaps"
         ],
         "expected_output": "{ overview: {...}, notes: [] }",
         "agent": "project_overview_agent",
@@ -102,16 +103,15 @@ TASKS = {
     },
     "milestone_analysis_task": {
         "description": (
-            "Transform the milestones section into analytics-ready signals: counts, delayed clusters by agent and milestone name, "
-            "top 5 late items with days, and early hypotheses on root cause using dependency hints."
+            "Explain the precomputed milestone signals (counts, delayed clusters by milestone name, top 5 late items with days, weird cases) "
+            "and add early hypotheses on root cause using dependency hints. The numbers are exact; quote them, do not recompute them."
         ),
         "steps": [
-            "Separate healthy vs delayed from overview.milestones",
-            "Group delayed by agent_id and milestone name",
-            "Select top 5 delayed by duration_days",
-            "Flag weird cases (negative duration, missing actual_date for past planned_date)"
+            "Read summary, delayed_by_name, top_late and weird_cases from the milestone signals",
+            "Explain what the largest delay clusters and late items mean",
+            "Add root-cause hypotheses; keep every number as given"
         ],
-        "expected_output": "{ summary: {...}, delayed_by_agent: [...], top_late: [...], weird_cases: [...] }",
+        "expected_output": "{ summary: {...}, delayed_by_name: [...], top_late: [...], weird_cases: [...], narrative: ... }",
         "agent": "milestone_diagnostic_agent",
         "previous": ["fetch_project_summary_task"],
         "next": [
@@ -121,15 +121,15 @@ TASKS = {
     },
     "anomaly_triage_task": {
         "description": (
-            "Build a risk register from overview.anomalies.details. Prioritize High, summarize by type, and produce a crisp so-what for leadership."
+            "Turn the precomputed anomaly signals (severity and type counts, risk score with High=3, Medium=2, Low=1, top risks) "
+            "into a risk register with a crisp so-what for leadership, High severity first. Quote the numbers, do not recompute them."
         ),
         "steps": [
-            "Group by severity and type",
-            "Pull top examples for High severity (e.g. Zoning Missing Date)",
-            "Create a risk_score heuristic: High=3, Medium=2, Low=1",
-            "Compute total risk_score and top_risks list"
+            "Read counts_by_severity, counts_by_type, risk_score and top_risks from the anomaly signals",
+            "Explain the High severity items first (e.g. Zoning Missing Date)",
+            "Write the so-what; keep every number as given"
         ],
-        "expected_output": "{ counts_by_severity: {...}, counts_by_type: {...}, risk_score: N, top_risks: [...] }",
+        "expected_output": "{ counts_by_severity: {...}, counts_by_type: {...}, risk_score: N, top_risks: [...], so_what: ... }",
         "agent": "anomaly_triage_agent",
         "previous": ["fetch_project_summary_task"],
         "next": [
@@ -139,15 +139,14 @@ TASKS = {
     },
     "cycle_benchmark_task": {
         "description": (
-            "Analyze cycles array. For each cycle, compute breach variance (SLA_days), where SLA defaults to 20 unless per-label SLA is provided. "
-            "Return a compact table plus highlights."
+            "Highlight what the precomputed cycle benchmark means. Each cycle's SLA (20 days unless CYCLE_SLA_DAYS sets one for its Start → End label), "
+            "breach flag (variance > SLA) and the breach count are exact; quote them, do not recompute them."
         ),
         "steps": [
-            "For each cycle, lookup SLA or default 20",
-            "Compute breach variance from SLA",
-            "Return list of label, planned, actual, variance, SLA, breach"
+            "Read the cycles table and breaches count from the cycle benchmark",
+            "Call out the breaching cycles and how far over SLA they are"
         ],
-        "expected_output": "{ cycles: [...], breaches: N }",
+        "expected_output": "{ cycles: [...], breaches: N, highlights: [...] }",
         "agent": "cycle_benchmark_agent",
         "previous": ["fetch_project_summary_task"],
         "next": ["final_composition_task"],
@@ -155,10 +154,10 @@ TASKS = {
     "zoning_focus_task": {
         "description": (
             "Perform a zoning-first review. If anomalies refer to Zoning or milestones named Zoning Submitted/Approved are delayed or missing actuals, "
-            "capture blockers and recommend the next best action."
+            "capture blockers and recommend the next best action. Only Zoning and Leasing milestones and the anomalies touching them are given."
         ),
         "steps": [
-            "Scan delayed milestones for names containing Zoning",
+            "Scan milestones for names containing Zoning",
             "Scan anomalies for Zoning in description or type",
             "If leasing milestone delays exist, link as upstream blocker",
             "Produce action plan with concrete owners and timestamps"
@@ -176,12 +175,11 @@ TASKS = {
     },
     "vendor_attribution_task": {
         "description": (
-            "Attribute delays to vendors where possible, using milestone names and known mappings (Transport, Construction, Leasing). "
-            "Output a vendor risk table ranked by delayed milestone count and narrative asks."
+            "Turn the precomputed vendor attribution (delayed milestones per vendor domain: Transport, Construction, Leasing, "
+            "mapped from milestone names) into a vendor risk table and narrative asks. Quote the counts, do not recount them."
         ),
         "steps": [
-            "Map milestone to vendor domain (Transport, Construction, Leasing)",
-            "Count delayed milestones per vendor domain",
+            "Read by_vendor_domain from the vendor attribution",
             "Draft asks for top offenders (e.g. delivery date, crew allocation)"
         ],
         "expected_output": "{ by_vendor_domain: [...], asks: [...] }",
@@ -197,14 +195,16 @@ TASKS = {
     "final_composition_task": {
         "description": (
             "Integrate milestone, anomaly, cycle, zoning, and vendor attribution into a single executive summary. "
-            "Include a headline, top 3 risks, and next 3 actions."
+            "Include a headline, top 3 risks, and next 3 actions. "
+            "For the ETA outlook, quote the simulated forecast (P50/P80/P95 dates and on_time_probability) instead of estimating one."
         ),
         "steps": [
             "Synthesize signals into 3 bullets for risks and 3 for actions",
+            "Quote P50/P80/P95 and on_time_probability from eta_forecast as the ETA outlook",
             "Reference concrete milestones and anomaly IDs where relevant",
             "Be concise and executive-friendly"
         ],
-        "expected_output": "{ headline: ..., top_risks: [...], next_actions: [...] }",
+        "expected_output": "{ headline: ..., top_risks: [...], next_actions: [...], eta_outlook: ... }",
         "agent": "meta_summary_agent",
         "previous": [
             "milestone_analysis_task",
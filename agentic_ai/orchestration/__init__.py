@@ -0,0 +1,11 @@
+from agentic_ai.orchestration.task_graph import (
+    execution_stages,
+    kickoff_task_graph,
+    task_dependencies,
+)
+
+__all__ = [
+    "execution_stages",
+    "kickoff_task_graph",
+    "task_dependencies",
+]
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from crewai import Crew, Process, Task
+from crewai.crews.crew_output import CrewOutput
+from crewai.types.usage_metrics import UsageMetrics
+
+
+def task_dependencies(
+    graph: Mapping[str, Mapping[str, Any]], names: Sequence[str]
+) -> Dict[str, List[str]]:
+    """``{task: [prerequisites]}`` from a mapper-style ``TASKS`` dict (its ``previous`` lists)."""
+    return {name: list(graph[name].get("previous") or []) for name in names}
+
+
+def execution_stages(dependencies: Mapping[str, Sequence[str]]) -> List[List[str]]:
+    """
+    Group tasks into stages whose members only depend on earlier stages.
+    The number of stages is the length of the critical path in task runs.
+    """
+    unknown = {d for deps in dependencies.values() for d in deps} - set(dependencies)
+    if unknown:
+        raise ValueError(f"Unknown prerequisite tasks: {', '.join(sorted(unknown))}")
+
+    remaining = {name: set(deps) for name, deps in dependencies.items()}
+    stages: List[List[str]] = []
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Task graph has a cycle among: {', '.join(sorted(remaining))}")
+        stages.append(ready)
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+    return stages
+
+
+async def kickoff_task_graph(
+    tasks: Mapping[str, Task],
+    dependencies: Mapping[str, Sequence[str]],
+    inputs: Optional[Dict[str, Any]] = None,
+    verbose: bool = True,
+) -> CrewOutput:
+    """
+    Run every task as its own one-task crew, starting each one as soon as its
+    prerequisites have finished (independent tasks run concurrently). The
+    prerequisites become the task's context, as in a sequential crew.
+
+    Returns a ``CrewOutput`` like ``Crew.kickoff`` would: ``tasks_output`` in
+    the order of ``tasks`` and ``raw`` from the last one.
+    """
+    execution_stages(dependencies)
+    for name, task in tasks.items():
+        if dependencies[name]:
+            task.context = [tasks[d] for d in dependencies[name]]
+
+    runs: Dict[str, "asyncio.Task[CrewOutput]"] = {}
+
+    async def run(name: str) -> CrewOutput:
+        await asyncio.gather(*(runs[d] for d in dependencies[name]))
+        task = tasks[name]
+        crew = Crew(
+            agents=[task.agent], tasks=[task], process=Process.sequential, verbose=verbose
+        )
+        return await crew.kickoff_async(inputs=inputs)
+
+    for name in tasks:
+        runs[name] = asyncio.create_task(run(name), name=name)
+    try:
+        results = await asyncio.gather(*runs.values())
+    except BaseException:
+        for pending in runs.values():
+            pending.cancel()
+        raise
+
+    usage = UsageMetrics()
+    for result in results:
+        usage.add_usage_metrics(result.token_usage)
+    last = results[-1]
+    return CrewOutput(
+        raw=last.raw,
+        pydantic=last.pydantic,
+        json_dict=last.json_dict,
+        tasks_output=[output for result in results for output in result.tasks_output],
+        token_usage=usage,
+    )
@@ -0,0 +1,167 @@
+"""
+Compact, per-task views of the /projects/{id}/summary payload.
+
+Each task gets only the sections it reads, without fields that repeat
+information found elsewhere, and within a token budget: list items beyond the
+budget are replaced by a one-line summary of what was left out.
+"""
+import json
+from collections import Counter
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from agentic_ai.config.settings import settings
+
+# Rough size of a token in JSON text; good enough to keep prompts bounded.
+CHARS_PER_TOKEN = 4
+# Share of a view's budget each section is guaranteed, whatever comes before it.
+MIN_SECTION_SHARE = 0.15
+ZONING_KEYWORDS = ("Zoning", "Leasing")
+
+
+def estimate_tokens(value: Any) -> int:
+    text = value if isinstance(value, str) else json.dumps(value, default=str, separators=(",", ":"))
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def compact_milestone(m: Mapping[str, Any], keep_status: bool = False) -> Dict[str, Any]:
+    """Drop the generated ``description`` ("<name> for <market>"), empty fields and, inside a
+    healthy/delayed list, the status the list already implies."""
+    dropped = {"description"} if keep_status else {"description", "status"}
+    return {k: v for k, v in m.items() if k not in dropped and v is not None}
+
+
+def compact_anomaly(a: Mapping[str, Any]) -> Dict[str, Any]:
+    out = {k: v for k, v in a.items() if v is not None and k != "detected_on"}
+    if a.get("detected_on"):
+        out["detected_on"] = a["detected_on"][:10]
+    return out
+
+
+def summarize_milestones(items: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    planned = sorted(m["planned_date"] for m in items if m.get("planned_date"))
+    return {
+        "by_name": dict(Counter(m.get("name") for m in items).most_common()),
+        "planned_between": [planned[0], planned[-1]] if planned else None,
+    }
+
+
+def summarize_anomalies(items: Sequence[Mapping[str, Any]]) -> Dict[str, Any]:
+    return {
+        "by_severity": dict(Counter(a.get("severity") for a in items)),
+        "by_type": dict(Counter(a.get("type") for a in items)),
+    }
+
+
+def fit_to_budget(
+    items: Sequence[Any],
+    budget: int,
+    summarize: Callable[[Sequence[Any]], Dict[str, Any]],
+) -> List[Any]:
+    """Keep items in order while they fit ``budget`` tokens; summarize the rest in one entry."""
+    kept: List[Any] = []
+    used = 0
+    for i, item in enumerate(items):
+        cost = estimate_tokens(item)
+        if used + cost > budget:
+            rest = items[i:]
+            return kept + [{"omitted": len(rest), **summarize(rest)}]
+        kept.append(item)
+        used += cost
+    return kept
+
+
+def _budgeted_sections(
+    sections: Sequence[tuple], budget: int
+) -> Dict[str, List[Any]]:
+    """
+    Fill ``(name, items, summarize)`` sections in priority order from one
+    shared budget. Each later section keeps a reserve of ``MIN_SECTION_SHARE``
+    of the budget (or what it needs, if less), so a long first section cannot
+    crowd the others out entirely.
+    """
+    floor = int(budget * MIN_SECTION_SHARE)
+    reserves = [min(floor, estimate_tokens(items)) for _, items, _ in sections]
+    out: Dict[str, List[Any]] = {}
+    for i, (name, items, summarize) in enumerate(sections):
+        allowance = max(budget - sum(reserves[i + 1 :]), reserves[i], 0)
+        out[name] = fit_to_budget(items, allowance, summarize)
+        budget -= estimate_tokens(out[name])
+    return out
+
+
+def project_view(overview: Mapping[str, Any], budget: int) -> Dict[str, Any]:
+    """Everything, compacted: delayed milestones and anomalies take the budget before healthy ones."""
+    milestones = overview.get("milestones") or {}
+    head = {
+        "project": {k: v for k, v in (overview.get("project") or {}).items() if v is not None},
+        "counts": {
+            "milestones": milestones.get("total", 0),
+            "delayed": milestones.get("delayed", 0),
+            "anomalies": (overview.get("anomalies") or {}).get("count", 0),
+            "cycles": len(overview.get("cycles") or []),
+        },
+        "missing_sections": [
+            key for key in ("project", "milestones", "anomalies", "cycles") if key not in overview
+        ],
+    }
+    sections = _budgeted_sections(
+        [
+            ("delayed_milestones", [compact_milestone(m) for m in milestones.get("delayed_milestones") or []], summarize_milestones),
+            ("anomalies", [compact_anomaly(a) for a in (overview.get("anomalies") or {}).get("details") or []], summarize_anomalies),
+            ("cycles", overview.get("cycles") or [], lambda rest: {}),
+            ("healthy_milestones", [compact_milestone(m) for m in milestones.get("healthy_milestones") or []], summarize_milestones),
+        ],
+        budget - estimate_tokens(head),
+    )
+    return {**head, **sections}
+
+
+def zoning_view(overview: Mapping[str, Any], budget: int) -> Dict[str, Any]:
+    """Zoning and (upstream) leasing milestones, and the anomalies that touch them."""
+    milestones = overview.get("milestones") or {}
+    relevant = [
+        compact_milestone(m, keep_status=True)
+        for m in [*(milestones.get("delayed_milestones") or []), *(milestones.get("healthy_milestones") or [])]
+        if any(k in (m.get("name") or "") for k in ZONING_KEYWORDS)
+    ]
+    ids = {m.get("milestone_id") for m in relevant}
+    anomalies = [
+        compact_anomaly(a)
+        for a in (overview.get("anomalies") or {}).get("details") or []
+        if a.get("milestone_id") in ids
+        or any("Zoning" in (a.get(k) or "") for k in ("type", "description"))
+    ]
+    return _budgeted_sections(
+        [
+            ("milestones", relevant, summarize_milestones),
+            ("anomalies", anomalies, summarize_anomalies),
+        ],
+        budget,
+    )
+
+
+def vendor_view(overview: Mapping[str, Any], budget: int) -> Dict[str, Any]:
+    """Delayed milestones only; the exact per-domain counts come from the precomputed vendor signals."""
+    delayed = (overview.get("milestones") or {}).get("delayed_milestones") or []
+    return _budgeted_sections(
+        [("delayed_milestones", [compact_milestone(m) for m in delayed], summarize_milestones)],
+        budget,
+    )
+
+
+# Prompt placeholder -> view builder; milestone, anomaly and cycle analysis
+# read the precomputed signals instead.
+TASK_VIEWS: Dict[str, Callable[[Mapping[str, Any], int], Dict[str, Any]]] = {
+    "project_overview": project_view,
+    "zoning_overview": zoning_view,
+    "vendor_overview": vendor_view,
+}
+
+
+def compact_task_inputs(overview: Mapping[str, Any], budget: Optional[int] = None) -> Dict[str, str]:
+    """JSON text for every view placeholder, each within ``budget`` tokens (about)."""
+    budget = settings.PROMPT_TOKEN_BUDGET if budget is None else budget
+    return {
+        name: json.dumps(build(overview, budget), default=str, separators=(",", ":"))
+        for name, build in TASK_VIEWS.items()
+    }
@@ -1,6 +1,10 @@
 from crewai import LLM, Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.crews.crew_output import CrewOutput
+
+from agentic_ai.mapper import TASKS
+from agentic_ai.orchestration import execution_stages, kickoff_task_graph, task_dependencies
 
 
 @CrewBase
@@ -138,19 +142,38 @@ class ProjectSummaryCrew:
 
     # ------------------ CREW ------------------
 
+    def pipeline_tasks(self) -> list[Task]:
+        return [
+            self.fetch_project_summary_task(),
+            self.milestone_analysis_task(),
+            self.anomaly_triage_task(),
+            self.cycle_benchmark_task(),
+            self.zoning_focus_task(),
+            self.vendor_attribution_task(),
+            self.final_composition_task(),
+        ]
+
+    def dependencies(self) -> dict[str, list[str]]:
+        """Prerequisites of each task, from the previous/next graph in mapper.TASKS."""
+        return task_dependencies(TASKS, [t.name for t in self.pipeline_tasks()])
+
+    def stages(self) -> list[list[str]]:
+        return execution_stages(self.dependencies())
+
     @crew
     def crew(self) -> Crew:
         return Crew(
             agents=self.agents,
-            tasks=[
-                self.fetch_project_summary_task(),
-                self.milestone_analysis_task(),
-                self.anomaly_triage_task(),
-                self.cycle_benchmark_task(),
-                self.zoning_focus_task(),
-                self.vendor_attribution_task(),
-                self.final_composition_task(),
-            ],
+            tasks=self.pipeline_tasks(),
             process=Process.sequential,
             verbose=True,
         )
+
+    async def kickoff_parallel(self, inputs: dict) -> CrewOutput:
+        """
+        Same tasks as ``crew()``, but each starts once its declared
+        prerequisites are done, so independent analyses run side by side and
+        the run takes about as long as its longest chain (four LLM calls).
+        """
+        tasks = {t.name: t for t in self.pipeline_tasks()}
+        return await kickoff_task_graph(tasks, self.dependencies(), inputs)
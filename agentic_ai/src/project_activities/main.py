@@ -4,9 +4,12 @@ from datetime import datetime, timezone
 from typing import List
 
 from crewai.flow import Flow, listen, start
+from agentic_ai.cache import content_hash, result_cache
 from agentic_ai.config.settings import settings
 from agentic_ai.exceptions import APIError
 from agentic_ai.src.project_activities.crews.project_summary.project_summary_crew import ProjectSummaryCrew
+from agentic_ai.src.project_activities.compaction import compact_task_inputs
+from agentic_ai.src.project_activities.precompute import precompute_signals
 from agentic_ai.src.project_activities.schemas.flow.project_summary import (
     ProjectSummaryState, ProjectSummaryResult, AgentRun
 )
@@ -34,15 +37,63 @@ class ProjectSummaryFlow(Flow[ProjectSummaryState]):
                 data = await response.json()
                 data.setdefault("project_id", self.state.project_id)
                 self.state.raw_project_summary = data
-                return data
+
+            self.state.eta_forecast = await self._fetch_eta_forecast(session)
+            eta = {k: v for k, v in (self.state.eta_forecast or {}).items() if k != "cached"}
+            self.state.content_hash = content_hash(
+                {"overview": data, "eta_forecast": eta, "cycle_sla_days": settings.CYCLE_SLA_DAYS}
+            )
+            return data
+
+    async def _fetch_eta_forecast(self, session: aiohttp.ClientSession):
+        # The simulated ETA is optional: without it the summary still runs and says so.
+        url = f"{settings.API_BASE_URL}/api/v1/projects/{self.state.project_id}/eta-forecast"
+        try:
+            async with session.get(url) as response:
+                if response.status == 200:
+                    return await response.json()
+                _log(self.state, "fetch_eta_forecast:error", "Non-200 from backend",
+                     {"status": response.status, "body": await response.text()})
+        except aiohttp.ClientError as exc:
+            _log(self.state, "fetch_eta_forecast:error", "ETA forecast request failed", {"error": str(exc)})
+        return None
 
     @listen("fetch_project_summary")
+    async def precompute_project_signals(self, overview):
+        # Counting, ranking and SLA checks in code; the agents only narrate them.
+        self.state.signals = precompute_signals(overview, cycle_sla_days=settings.CYCLE_SLA_DAYS)
+        _log(self.state, "precompute:done", "Deterministic signals ready",
+             {"sections": list(self.state.signals)})
+        return overview
+
+    @listen("precompute_project_signals")
     async def run_project_summary_pipeline(self, overview):
-        _log(self.state, "crew:start", "Starting ProjectSummaryCrew")
+        if not self.state.force_refresh:
+            cached = await result_cache.get("project", self.state.project_id, self.state.content_hash)
+            if cached is not None:
+                self.state.agents_debug = [AgentRun(**run) for run in cached["agents"]]
+                self.state.cached = True
+                _log(self.state, "cache:hit", "Reusing summary for unchanged project data",
+                     {"content_hash": self.state.content_hash})
+                return cached["raw"]
+
         crew = ProjectSummaryCrew()
-        result = await crew.crew().kickoff_async(
-            inputs={"project_id": self.state.project_id, "overview": overview}
-        )
+        inputs = {
+            "project_id": self.state.project_id,
+            **compact_task_inputs(overview),
+            "eta_forecast": json.dumps(self.state.eta_forecast) if self.state.eta_forecast else "unavailable",
+            "milestone_signals": json.dumps(self.state.signals["milestone_analysis"]),
+            "anomaly_signals": json.dumps(self.state.signals["anomaly_analysis"]),
+            "cycle_signals": json.dumps(self.state.signals["cycle_benchmark"]),
+            "vendor_signals": json.dumps(self.state.signals["vendor_attribution"]),
+        }
+        if settings.PROJECT_SUMMARY_PARALLEL:
+            _log(self.state, "crew:start", "Starting ProjectSummaryCrew (parallel stages)",
+                 {"stages": crew.stages()})
+            result = await crew.kickoff_parallel(inputs)
+        else:
+            _log(self.state, "crew:start", "Starting ProjectSummaryCrew")
+            result = await crew.crew().kickoff_async(inputs=inputs)
 
         runs: List[AgentRun] = []
         for idx, out in enumerate(getattr(result, "tasks_output", []) or []):
@@ -61,7 +112,13 @@ class ProjectSummaryFlow(Flow[ProjectSummaryState]):
 
         self.state.agents_debug = runs
         _log(self.state, "crew:done", "Crew finished", {"tasks": len(runs)})
-        return getattr(result, "raw", result)
+        raw = getattr(result, "raw", result)
+        if isinstance(raw, str):
+            await result_cache.set(
+                "project", self.state.project_id, self.state.content_hash,
+                {"raw": raw, "agents": [run.model_dump() for run in runs]},
+            )
+        return raw
 
     @listen("run_project_summary_pipeline")
     async def complete_project_summary(self, previous_result) -> ProjectSummaryResult:
@@ -90,8 +147,11 @@ class ProjectSummaryFlow(Flow[ProjectSummaryState]):
             raw_output=raw_text,
             trace=self.state.trace,
             agents=self.state.agents_debug,
+            eta_forecast=self.state.eta_forecast,
+            signals=self.state.signals,
+            cached=self.state.cached,
         )
 
-async def project_summary_generator(project_id: str) -> ProjectSummaryResult:
+async def project_summary_generator(project_id: str, force_refresh: bool = False) -> ProjectSummaryResult:
     flow = ProjectSummaryFlow()
-    return await flow.kickoff_async(inputs={"project_id": project_id})
+    return await flow.kickoff_async(inputs={"project_id": project_id, "force_refresh": force_refresh})
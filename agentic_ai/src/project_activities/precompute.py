@@ -0,0 +1,169 @@
+"""
+Deterministic analysis of the /projects/{id}/summary payload.
+
+Counting, ranking and SLA arithmetic are done here, exactly, before the crew
+runs; the agents receive the finished structures and only write the narrative.
+"""
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, List, Mapping, Optional
+
+SEVERITY_WEIGHTS = {"High": 3, "Medium": 2, "Low": 1}
+DEFAULT_CYCLE_SLA_DAYS = 20
+TOP_LATE_LIMIT = 5
+TOP_RISK_LIMIT = 5
+# Vendor domain per milestone-name keyword; other milestones are unattributed.
+VENDOR_DOMAINS = {
+    "Transport": ("Transport",),
+    "Leasing": ("Leasing",),
+    "Construction": ("REC", "RER", "RTC", "PCC"),
+}
+UNATTRIBUTED = "Unattributed"
+
+
+def _date(value: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def milestone_signals(milestones: Mapping[str, Any], as_of: Optional[date] = None) -> Dict[str, Any]:
+    """Counts, delayed clusters by milestone name, the top late items and data oddities."""
+    as_of = as_of or date.today()
+    healthy = milestones.get("healthy_milestones") or []
+    delayed = milestones.get("delayed_milestones") or []
+
+    late = []
+    for m in delayed:
+        planned, actual = _date(m.get("planned_date")), _date(m.get("actual_date"))
+        # Open milestones are late by as much as they are overdue today.
+        delay_days = ((actual or as_of) - planned).days if planned else None
+        late.append(
+            {
+                "milestone_id": m.get("milestone_id"),
+                "name": m.get("name"),
+                "delay_days": delay_days,
+                "duration_days": m.get("duration_days"),
+                "open": actual is None,
+            }
+        )
+    late.sort(key=lambda m: (m["delay_days"] is None, -(m["delay_days"] or 0), m["milestone_id"] or 0))
+
+    weird_cases = []
+    for m in [*healthy, *delayed]:
+        planned, actual = _date(m.get("planned_date")), _date(m.get("actual_date"))
+        if (m.get("duration_days") or 0) < 0:
+            weird_cases.append({"milestone_id": m.get("milestone_id"), "reason": "Negative duration"})
+        if actual is None and planned is not None and planned < as_of:
+            weird_cases.append(
+                {"milestone_id": m.get("milestone_id"), "reason": "Missing actual_date past plan"}
+            )
+
+    return {
+        "summary": {
+            "total": milestones.get("total", len(healthy) + len(delayed)),
+            "delayed": milestones.get("delayed", len(delayed)),
+            "healthy": len(healthy),
+        },
+        "delayed_by_name": [
+            {"name": name, "count": count}
+            for name, count in Counter(m.get("name") for m in delayed).most_common()
+        ],
+        "top_late": late[:TOP_LATE_LIMIT],
+        "weird_cases": weird_cases,
+    }
+
+
+def anomaly_signals(anomalies: Mapping[str, Any]) -> Dict[str, Any]:
+    """Severity and type counts, the weighted risk score and the highest-severity anomalies."""
+    details = anomalies.get("details") or []
+    by_severity = Counter(a.get("severity") for a in details)
+    ranked = sorted(
+        details,
+        key=lambda a: (-SEVERITY_WEIGHTS.get(a.get("severity"), 0), a.get("anomaly_id") or 0),
+    )
+    return {
+        "counts_by_severity": {s: by_severity.get(s, 0) for s in SEVERITY_WEIGHTS},
+        "counts_by_type": dict(Counter(a.get("type") for a in details).most_common()),
+        "risk_score": sum(SEVERITY_WEIGHTS.get(s, 0) * n for s, n in by_severity.items()),
+        "risk_weights": SEVERITY_WEIGHTS,
+        "top_risks": [
+            {
+                "anomaly_id": a.get("anomaly_id"),
+                "milestone_id": a.get("milestone_id"),
+                "type": a.get("type"),
+                "severity": a.get("severity"),
+            }
+            for a in ranked[:TOP_RISK_LIMIT]
+        ],
+    }
+
+
+def vendor_domain(name: Optional[str]) -> str:
+    for domain, keywords in VENDOR_DOMAINS.items():
+        if any(k in (name or "") for k in keywords):
+            return domain
+    return UNATTRIBUTED
+
+
+def vendor_signals(milestones: Mapping[str, Any]) -> Dict[str, Any]:
+    """Delayed milestones per vendor domain, most delayed first, with the names behind each count."""
+    by_domain: Dict[str, Counter] = {}
+    for m in milestones.get("delayed_milestones") or []:
+        by_domain.setdefault(vendor_domain(m.get("name")), Counter())[m.get("name")] += 1
+    return {
+        "by_vendor_domain": sorted(
+            (
+                {"domain": domain, "delayed": sum(names.values()), "by_name": dict(names.most_common())}
+                for domain, names in by_domain.items()
+            ),
+            key=lambda d: (d["domain"] == UNATTRIBUTED, -d["delayed"], d["domain"]),
+        ),
+        "mapping": VENDOR_DOMAINS,
+    }
+
+
+def cycle_label(cycle: Mapping[str, Any]) -> str:
+    """``"Start → End"`` agent names, as in the cycle-time analytics (ids if names are missing)."""
+    start = cycle.get("agent_start_name") or cycle.get("agent_start_id")
+    end = cycle.get("agent_end_name") or cycle.get("agent_end_id")
+    return f"{start} → {end}"
+
+
+def cycle_signals(
+    cycles: List[Mapping[str, Any]], sla_days: Optional[Mapping[str, int]] = None
+) -> Dict[str, Any]:
+    """
+    Per-cycle SLA check: a cycle breaches when its variance exceeds its SLA,
+    looked up in ``sla_days`` by label (default 20 days).
+    """
+    sla_days = sla_days or {}
+    rows = []
+    for c in cycles:
+        label = cycle_label(c)
+        sla = sla_days.get(label, DEFAULT_CYCLE_SLA_DAYS)
+        variance = c.get("variance")
+        rows.append(
+            {
+                "cycle_id": c.get("cycle_id"),
+                "label": label,
+                "planned": c.get("planned"),
+                "actual": c.get("actual"),
+                "variance": variance,
+                "sla": sla,
+                "breach": variance is not None and variance > sla,
+                "over_sla_days": max(variance - sla, 0) if variance is not None else None,
+            }
+        )
+    return {"cycles": rows, "breaches": sum(r["breach"] for r in rows)}
+
+
+def precompute_signals(
+    overview: Mapping[str, Any],
+    as_of: Optional[date] = None,
+    cycle_sla_days: Optional[Mapping[str, int]] = None,
+) -> Dict[str, Any]:
+    return {
+        "milestone_analysis": milestone_signals(overview.get("milestones") or {}, as_of),
+        "anomaly_analysis": anomaly_signals(overview.get("anomalies") or {}),
+        "cycle_benchmark": cycle_signals(overview.get("cycles") or [], cycle_sla_days),
+        "vendor_attribution": vendor_signals(overview.get("milestones") or {}),
+    }
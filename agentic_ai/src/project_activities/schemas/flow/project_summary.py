@@ -14,6 +14,11 @@ class AgentRun(BaseModel):
 class ProjectSummaryState(BaseModel):
     project_id: Optional[str] = None
     raw_project_summary: Optional[Dict[str, Any]] = None
+    eta_forecast: Optional[Dict[str, Any]] = None
+    signals: Optional[Dict[str, Any]] = None
+    force_refresh: bool = False
+    content_hash: Optional[str] = None
+    cached: bool = False
     trace: List[Dict[str, Any]] = Field(default_factory=list)
     agents_debug: List[AgentRun] = Field(default_factory=list)   # 👈 NEW
 
@@ -23,6 +28,9 @@ class ProjectSummaryResult(BaseModel):
     risks: List[str] = []
     actions: List[str] = []
     raw_output: Any = None
+    eta_forecast: Optional[Dict[str, Any]] = None
+    signals: Optional[Dict[str, Any]] = None
+    cached: bool = False
     trace: List[Dict[str, Any]] = Field(default_factory=list)
     agents: List[AgentRun] = Field(default_factory=list)         # 👈 NEW
 
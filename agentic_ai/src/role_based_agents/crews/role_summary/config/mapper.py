@@ -57,6 +57,8 @@ AGENTS = {
 }
 
 # --- Task Definitions ---
+# Each section task reads one key ("section") of the /alerts/{role} payload;
+# the composer fans in all of them.
 TASKS = {
     "status_summary_task": {
         "description": "Summarize milestone statuses for the selected role.",
@@ -65,6 +67,9 @@ TASKS = {
             "status_counts": {...},
         },
         "agent": "status_summary_agent",
+        "section": "status",
+        "previous": None,
+        "next": ["final_composition_task"],
     },
     "delay_analysis_task": {
         "description": (
@@ -76,6 +81,9 @@ TASKS = {
             "delays": [...],
         },
         "agent": "delay_analysis_agent",
+        "section": "delays",
+        "previous": None,
+        "next": ["final_composition_task"],
     },
     "anomaly_triage_task": {
         "description": (
@@ -87,6 +95,9 @@ TASKS = {
             "anomalies": [...],
         },
         "agent": "anomaly_triage_agent",
+        "section": "anomalies",
+        "previous": None,
+        "next": ["final_composition_task"],
     },
     "vendor_attribution_task": {
         "description": (
@@ -98,6 +109,9 @@ TASKS = {
             "impacts": [...],
         },
         "agent": "vendor_attribution_agent",
+        "section": "impacts",
+        "previous": None,
+        "next": ["final_composition_task"],
     },
     "dependency_task": {
         "description": (
@@ -109,6 +123,9 @@ TASKS = {
             "dependencies": [...],
         },
         "agent": "dependency_mapping_agent",
+        "section": "dependencies",
+        "previous": None,
+        "next": ["final_composition_task"],
     },
     "final_composition_task": {
         "description": (
@@ -121,6 +138,14 @@ TASKS = {
             "next_actions": [...],
         },
         "agent": "meta_summary_agent",
+        "previous": [
+            "status_summary_task",
+            "delay_analysis_task",
+            "anomaly_triage_task",
+            "vendor_attribution_task",
+            "dependency_task",
+        ],
+        "next": None,
     },
 }
 
@@ -1,8 +1,14 @@
 # backend/app/crews/role_summary_crew.py
 
+import json
+
 from crewai import LLM, Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
+from crewai.crews.crew_output import CrewOutput
+
+from agentic_ai.orchestration import kickoff_task_graph, task_dependencies
+from agentic_ai.src.role_based_agents.crews.role_summary.config.mapper import TASKS
 
 
 @CrewBase
@@ -125,19 +131,39 @@ class RoleSummaryCrew:
 
     # ------------------ CREW ------------------
 
+    def pipeline_tasks(self) -> list[Task]:
+        return [
+            self.status_summary_task(),
+            self.delay_analysis_task(),
+            self.anomaly_triage_task(),
+            self.vendor_attribution_task(),
+            self.dependency_task(),
+            self.final_composition_task(),
+        ]
+
+    @staticmethod
+    def section_inputs(overview: dict) -> dict:
+        """One ``{<section>_section}`` input per section task: only its slice of the payload."""
+        return {
+            f"{details['section']}_section": json.dumps(overview.get(details["section"]), default=str)
+            for details in TASKS.values()
+            if details.get("section")
+        }
+
     @crew
     def crew(self) -> Crew:
         """Defines the full pipeline for Role Summary"""
         return Crew(
             agents=self.agents,
-            tasks=[
-                self.status_summary_task(),
-                self.delay_analysis_task(),
-                self.anomaly_triage_task(),
-                self.vendor_attribution_task(),
-                self.dependency_task(),
-                self.final_composition_task(),
-            ],
+            tasks=self.pipeline_tasks(),
             process=Process.sequential,  # Run in strict order
             verbose=True,
         )
+
+    async def kickoff_parallel(self, inputs: dict) -> CrewOutput:
+        """
+        Fan-out/fan-in: the five section tasks run concurrently, then the
+        composer merges their outputs.
+        """
+        tasks = {t.name: t for t in self.pipeline_tasks()}
+        return await kickoff_task_graph(tasks, task_dependencies(TASKS, list(tasks)), inputs)
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import List
 
 from crewai.flow import Flow, listen, start
+from agentic_ai.cache import content_hash, result_cache
 from agentic_ai.config.settings import settings
 from agentic_ai.exceptions import APIError
 from agentic_ai.src.role_based_agents.crews.role_summary import RoleSummaryCrew
@@ -55,15 +56,36 @@ class RoleSummaryFlow(Flow[RoleSummaryState]):
                 data = await response.json()
                 data.setdefault("role", self.state.role)
                 self.state.raw_role_summary = data
+                self.state.content_hash = content_hash(data)
                 return data
 
     @listen("fetch_role_summary")
     async def run_role_summary_pipeline(self, overview):
-        _log(self.state, "crew:start", "Starting RoleSummaryCrew")
+        if not self.state.force_refresh:
+            cached = await result_cache.get("role", self.state.role, self.state.content_hash)
+            if cached is not None:
+                self.state.agents_debug = [AgentRun(**run) for run in cached["agents"]]
+                self.state.cached = True
+                _log(
+                    self.state,
+                    "cache:hit",
+                    "Reusing summary for unchanged role data",
+                    {"content_hash": self.state.content_hash},
+                )
+                return cached["raw"]
+
         crew = RoleSummaryCrew()
-        result = await crew.crew().kickoff_async(
-            inputs={"role": self.state.role, "overview": overview}
-        )
+        inputs = {
+            "role": self.state.role,
+            "overview": overview,
+            **crew.section_inputs(overview),
+        }
+        if settings.ROLE_SUMMARY_PARALLEL:
+            _log(self.state, "crew:start", "Starting RoleSummaryCrew (section tasks in parallel)")
+            result = await crew.kickoff_parallel(inputs)
+        else:
+            _log(self.state, "crew:start", "Starting RoleSummaryCrew")
+            result = await crew.crew().kickoff_async(inputs=inputs)
 
         runs: List[AgentRun] = []
         for idx, out in enumerate(getattr(result, "tasks_output", []) or []):
@@ -84,7 +106,15 @@ class RoleSummaryFlow(Flow[RoleSummaryState]):
 
         self.state.agents_debug = runs
         _log(self.state, "crew:done", "Crew finished", {"tasks": len(runs)})
-        return getattr(result, "raw", result)
+        raw = getattr(result, "raw", result)
+        if isinstance(raw, str):
+            await result_cache.set(
+                "role",
+                self.state.role,
+                self.state.content_hash,
+                {"raw": raw, "agents": [run.model_dump() for run in runs]},
+            )
+        return raw
 
     @listen("run_role_summary_pipeline")
     async def complete_role_summary(self, previous_result) -> RoleSummaryResult:
@@ -134,12 +164,13 @@ class RoleSummaryFlow(Flow[RoleSummaryState]):
             raw_output=raw_text,
             trace=self.state.trace,
             agents=self.state.agents_debug,
+            cached=self.state.cached,
         )
 
 
 # -------------------------------
 # Entrypoint function
 # -------------------------------
-async def role_summary_generator(role: str) -> RoleSummaryResult:
+async def role_summary_generator(role: str, force_refresh: bool = False) -> RoleSummaryResult:
     flow = RoleSummaryFlow()
-    return await flow.kickoff_async(inputs={"role": role})
+    return await flow.kickoff_async(inputs={"role": role, "force_refresh": force_refresh})
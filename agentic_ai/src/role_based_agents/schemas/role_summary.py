@@ -58,6 +58,9 @@ class AgentRun(BaseModel):
 class RoleSummaryState(BaseModel):
     role: Optional[str] = None
     raw_role_summary: Optional[Dict[str, Any]] = None
+    force_refresh: bool = False
+    content_hash: Optional[str] = None
+    cached: bool = False
     trace: List[Dict[str, Any]] = Field(default_factory=list)
     agents_debug: List[AgentRun] = Field(default_factory=list)
 
@@ -74,6 +77,7 @@ class RoleSummaryResult(BaseModel):
     risks: List[str] = []
     actions: List[ActionItem] = []   # 👈 allow dicts
     raw_output: Any = None
+    cached: bool = False
     trace: List[Dict[str, Any]] = Field(default_factory=list)
     agents: List[AgentRun] = Field(default_factory=list)
 
@@ -7,8 +7,21 @@ from backend.app.api.endpoints.anomalies import router as anomalies_router
 from backend.app.api.endpoints.projects import router as projects_router
 from backend.app.api.endpoints.vendors import router as vendors_router
 from backend.app.api.endpoints.common import router as common_router
+from backend.app.api.endpoints.health import router as health_router
+from backend.app.api.endpoints.jobs import router as jobs_router
+from backend.app.middlewares import CacheRule, path_only_key
 
-
+# Hot read-only routes served through ResponseCacheMiddleware (paths are
+# relative to the API prefix). Streamlit reruns re-request these constantly.
+RESPONSE_CACHE_RULES = [
+    CacheRule("/agents/", ttl=300, key=path_only_key),
+    CacheRule("/alerts/agents/all", ttl=300, key=path_only_key),
+    CacheRule("/alerts/markets", ttl=300, key=path_only_key),
+    CacheRule("/projects/{project_id}/timeline", ttl=60, key=path_only_key),
+    CacheRule(
+        "/analytics/agent/{agent_name}/delay-metrics", ttl=120, key=path_only_key
+    ),
+]
 
 
 def init_routers(router: APIRouter) -> None:
@@ -20,8 +33,11 @@ def init_routers(router: APIRouter) -> None:
     router.include_router(projects_router)
     router.include_router(vendors_router)
     router.include_router(common_router)
+    router.include_router(health_router)
+    router.include_router(jobs_router)
 
 
 __all__ = [
     "init_routers",
+    "RESPONSE_CACHE_RULES",
 ]
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from backend.app.dependencies.agents import get_agent_id
 from backend.app.dependencies.db import get_db
 from backend.app.models.entities import Agent, Milestone, Project, Anomaly
 from backend.app.schemas.common import Agent as AgentSchema
@@ -16,12 +17,13 @@ async def list_agents(db: AsyncSession = Depends(get_db)):
 
 # Projects for an agent
 @router.get("/{agent_name}/projects")
-async def agent_projects(agent_name: str, db: AsyncSession = Depends(get_db)):
+async def agent_projects(
+    agent_id: int = Depends(get_agent_id), db: AsyncSession = Depends(get_db)
+):
     stmt = (
         select(Project.project_id, Project.market, Project.site_type)
         .join(Milestone, Milestone.project_id == Project.project_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .filter(Agent.agent_name == agent_name)
+        .filter(Milestone.agent_id == agent_id)
         .distinct()
     )
     result = await db.execute(stmt)
@@ -29,12 +31,13 @@ async def agent_projects(agent_name: str, db: AsyncSession = Depends(get_db)):
 
 # Anomalies for an agent
 @router.get("/{agent_name}/anomalies")
-async def agent_anomalies(agent_name: str, db: AsyncSession = Depends(get_db)):
+async def agent_anomalies(
+    agent_id: int = Depends(get_agent_id), db: AsyncSession = Depends(get_db)
+):
     stmt = (
         select(Anomaly)
         .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .filter(Agent.agent_name == agent_name)
+        .filter(Milestone.agent_id == agent_id)
     )
     result = await db.execute(stmt)
     anomalies = result.scalars().all()
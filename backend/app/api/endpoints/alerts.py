@@ -1,23 +1,109 @@
 # backend/app/api/routers/agents_router.py
+import json
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Dict, Literal
 from urllib.parse import unquote
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from sqlalchemy.orm import aliased
+from backend.app.core.config import settings
+from backend.app.db.parallel import fetch_all
+from backend.app.db.session import AsyncSessionLocal
 from backend.app.dependencies.db import get_db
-from backend.app.models.entities import (
-    Project,
-    Agent,
-    Milestone,
-    Anomaly,
-    Dependency,
-    Vendor,
-    MilestoneVendor,
+from backend.app.models.entities import Project, Agent
+from backend.app.services.agent_index import agent_index
+from backend.app.services.agent_summary_service import agent_summary_statements
+from backend.app.services.alert_service import (
+    REPORT_THRESHOLDS,
+    AlertService,
+    VendorDurations,
 )
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
+REPORT_MEDIA_TYPES = {"json": "application/json", "ndjson": "application/x-ndjson"}
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
+
+
+async def _portfolio_report_chunks(
+    filters: Dict[str, Any], batch_size: int, fmt: str
+) -> AsyncIterator[str]:
+    header = {
+        "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "thresholds": REPORT_THRESHOLDS,
+        "filters": filters,
+    }
+    if fmt == "ndjson":
+        yield _dumps({"header": header}) + "\n"
+    else:
+        yield _dumps(header)[:-1] + ', "projects": ['
+
+    vendor_durations = VendorDurations()
+    count = 0
+    # The session lives as long as the stream, not the request handler.
+    async with AsyncSessionLocal() as db:
+        async for batch in AlertService(db).iter_report_batches(
+            vendor_durations, batch_size, filters
+        ):
+            if fmt == "ndjson":
+                yield "".join(_dumps(project) + "\n" for project in batch)
+            else:
+                yield ("," if count else "") + ",".join(map(_dumps, batch))
+            count += len(batch)
+
+    trailer = {
+        "count": count,
+        "aggregates": {
+            "vendors": [
+                {"name": vendor, **stats}
+                for vendor, stats in vendor_durations.aggregates().items()
+            ]
+        },
+    }
+    if fmt == "ndjson":
+        yield _dumps({"trailer": trailer}) + "\n"
+    else:
+        yield "], " + _dumps(trailer)[1:]
+
+
+# -------------------------------
+# PORTFOLIO RISK REPORT
+# -------------------------------
+@router.get("", status_code=status.HTTP_200_OK)
+async def portfolio_risk_report(
+    local_market: str | None = None,
+    project_status: str | None = None,
+    vendor: str | None = Query(None, description="vendor_site_acquisition"),
+    format: Literal["json", "ndjson"] = "json",
+    batch_size: int = Query(settings.ALERT_REPORT_BATCH_SIZE, ge=100, le=50000),
+):
+    """
+    Stream the projects_encoded risk report as it is computed, one batch at a time.
+
+    - ``json``: ``{"generated_at", "thresholds", "filters", "projects": [...],
+      "count", "aggregates"}`` in a single chunked document.
+    - ``ndjson``: a ``{"header": ...}`` line, one line per project, then a
+      ``{"trailer": {"count", "aggregates"}}`` line.
+
+    Vendor statistics need every row, so they are only sent in the trailer
+    (``aggregates.vendors``); per-project ``aggregates`` are empty.
+    """
+    filters = {
+        "local_market": local_market,
+        "project_status": project_status,
+        "vendor_site_acquisition": vendor,
+    }
+    filters = {k: v for k, v in filters.items() if v is not None}
+    return StreamingResponse(
+        _portfolio_report_chunks(filters, batch_size, format),
+        media_type=REPORT_MEDIA_TYPES[format],
+    )
+
 
 # -------------------------------
 # GET ALL AGENTS
@@ -57,39 +143,34 @@ async def get_agent_summary(role: str, db: AsyncSession = Depends(get_db)):
     - anomalies
     - impacted projects
     - dependencies
+
+    The agent id comes from the in-memory agent index (404 for unknown roles);
+    the five sections are then fetched concurrently, each on its own pooled
+    connection (five checkouts per request), or sequentially on this request's
+    session when the pool is near saturation.
     """
     role = unquote(role)
 
+    agent_id = await agent_index.resolve(db, role)
+    if agent_id is None:
+        raise HTTPException(status_code=404, detail=f"Unknown agent: {role}")
+
+    (
+        rows_status,
+        rows_delays,
+        rows_anomalies,
+        rows_impacts,
+        rows_dependencies,
+    ) = await fetch_all(db, *agent_summary_statements(agent_id).values())
+
     # -------------------------------
     # STATUS
     # -------------------------------
-    stmt_status = (
-        select(Milestone.status, func.count(Milestone.milestone_id))
-        .join(Project, Project.project_id == Milestone.project_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .where(Agent.agent_name == role)
-        .group_by(Milestone.status)
-        .limit(10)
-    )
-    rows_status = (await db.execute(stmt_status)).all()
     status_distribution = [{"status": s, "count": c} for s, c in rows_status]
 
     # -------------------------------
     # DELAYS
     # -------------------------------
-    stmt_delays = (
-        select(
-            Project.project_id,
-            Milestone.milestone_name,
-            Milestone.planned_date,
-            Milestone.actual_date,
-        )
-        .join(Project, Project.project_id == Milestone.project_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .where(Agent.agent_name == role)
-        .limit(10)
-    )
-    rows_delays = (await db.execute(stmt_delays)).all()
     delays = []
     for pid, milestone_name, planned, actual in rows_delays:
         delay = (actual - planned).days if planned and actual else None
@@ -106,15 +187,6 @@ async def get_agent_summary(role: str, db: AsyncSession = Depends(get_db)):
     # -------------------------------
     # ANOMALIES
     # -------------------------------
-    stmt_anomalies = (
-        select(Project.project_id, Anomaly.type, Anomaly.severity, Anomaly.description)
-        .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
-        .join(Project, Project.project_id == Milestone.project_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .where(Agent.agent_name == role)
-        .limit(10)
-    )
-    rows_anomalies = (await db.execute(stmt_anomalies)).all()
     anomalies = [
         {"project_id": pid, "type": t, "severity": sev, "description": desc}
         for pid, t, sev, desc in rows_anomalies
@@ -123,26 +195,6 @@ async def get_agent_summary(role: str, db: AsyncSession = Depends(get_db)):
     # -------------------------------
     # IMPACTS
     # -------------------------------
-    stmt_impacts = (
-        select(
-            Project.project_id,
-            Vendor.vendor_name,
-            func.count(Milestone.milestone_id)
-            .filter(Milestone.status == "Delayed")
-            .label("delayed_count"),
-            func.count(Milestone.milestone_id).label("total_count"),
-        )
-        .join(Milestone, Project.project_id == Milestone.project_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .outerjoin(
-            MilestoneVendor, MilestoneVendor.milestone_id == Milestone.milestone_id
-        )
-        .outerjoin(Vendor, Vendor.vendor_id == MilestoneVendor.vendor_id)
-        .where(Agent.agent_name == role)
-        .group_by(Project.project_id, Vendor.vendor_name)
-        .limit(10)
-    )
-    rows_impacts = (await db.execute(stmt_impacts)).all()
     impacts = [
         {
             "project_id": pid,
@@ -156,15 +208,6 @@ async def get_agent_summary(role: str, db: AsyncSession = Depends(get_db)):
     # -------------------------------
     # DEPENDENCIES
     # -------------------------------
-    d = aliased(Dependency)
-    stmt_dependencies = (
-        select(d.prerequisite_id, d.milestone_id)
-        .join(Milestone, Milestone.milestone_id == d.milestone_id)
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .where(Agent.agent_name == role)
-        .limit(10)
-    )
-    rows_dependencies = (await db.execute(stmt_dependencies)).all()
     dependencies = [{"from": pre, "to": suc} for pre, suc in rows_dependencies]
 
     # -------------------------------
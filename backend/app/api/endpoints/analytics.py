@@ -1,23 +1,25 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, case, select
+from backend.app.dependencies.agents import get_agent_id
 from backend.app.dependencies.db import get_db
-from backend.app.models.entities import Milestone, Agent, Project, CycleTime
+from backend.app.models.entities import Milestone
+from backend.app.services.cycle_time_service import CycleTimeService
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
 
 @router.get("/agent/{agent_name}/delay-metrics")
-async def agent_delay_metrics(agent_name: str, db: AsyncSession = Depends(get_db)):
-    stmt = (
-        select(
-            func.count(Milestone.milestone_id),
-            func.avg(Milestone.duration_days),
-            func.sum(case((Milestone.status == "Delayed", 1), else_=0)),
-        )
-        .join(Agent, Agent.agent_id == Milestone.agent_id)
-        .filter(Agent.agent_name == agent_name)
-    )
+async def agent_delay_metrics(
+    agent_name: str,
+    agent_id: int = Depends(get_agent_id),
+    db: AsyncSession = Depends(get_db),
+):
+    stmt = select(
+        func.count(Milestone.milestone_id),
+        func.avg(Milestone.duration_days),
+        func.sum(case((Milestone.status == "Delayed", 1), else_=0)),
+    ).filter(Milestone.agent_id == agent_id)
 
     result = await db.execute(stmt)
     total, avg_duration, delayed = result.one_or_none() or (0, None, 0)
@@ -31,37 +33,20 @@ async def agent_delay_metrics(agent_name: str, db: AsyncSession = Depends(get_db
 
 
 @router.get("/cycles/summary")
-async def cycles_summary(db: AsyncSession = Depends(get_db)):
-    stmt = (
-        select(CycleTime, Project.market)
-        .join(Project, Project.project_id == CycleTime.project_id)
-    )
-    result = await db.execute(stmt)
-    rows = result.all()
-
-    data = {}
-    for c, market in rows:
-        key = getattr(c, "label", "cycle")  # fallback if no "label"
-        data.setdefault(key, {"count": 0, "total_actual": 0, "by_market": {}})
-        if c.actual_duration is not None:
-            data[key]["count"] += 1
-            data[key]["total_actual"] += c.actual_duration
-            data[key]["by_market"].setdefault(market, {"count": 0, "total": 0})
-            data[key]["by_market"][market]["count"] += 1
-            data[key]["by_market"][market]["total"] += c.actual_duration
-
-    out = []
-    for label, v in data.items():
-        avg = (v["total_actual"] / v["count"]) if v["count"] else None
-        by_market = {
-            m: round(d["total"] / d["count"], 2)
-            for m, d in v["by_market"].items()
-            if d["count"]
-        }
-        out.append({
-            "label": label,
-            "avg_actual_days": round(avg, 2) if avg else None,
-            "by_market_avg": by_market,
-        })
-
-    return out
+async def cycles_summary(
+    use_rollup: bool = Query(
+        False, description="Read from the cycle_time_rollup materialized view"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Cycle-time statistics per (agent_start_id, agent_end_id), overall and per
+    market: count, mean/p50/p90 actual days, mean planned days and variance.
+    """
+    return await CycleTimeService(db).summary(use_rollup=use_rollup)
+
+
+@router.post("/cycles/summary/refresh")
+async def refresh_cycles_summary(db: AsyncSession = Depends(get_db)):
+    await CycleTimeService(db).refresh_rollup()
+    return {"refreshed": "cycle_time_rollup"}
@@ -1,11 +1,55 @@
-from fastapi import APIRouter, Depends
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, or_, select, tuple_
 from backend.app.dependencies.db import get_db
 from backend.app.models.entities import Anomaly, Milestone, Project, Agent
+from backend.app.services.agent_index import agent_index
+from backend.app.services.anomaly_detection_service import (
+    AnomalyDetectionService,
+    DetectionInProgress,
+)
 
 router = APIRouter(prefix="/anomalies", tags=["Anomalies"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# Selectable output columns.
+SEARCH_FIELDS = {
+    "anomaly_id": Anomaly.anomaly_id,
+    "project_id": Milestone.project_id,
+    "agent": Agent.agent_name,
+    "milestone_id": Anomaly.milestone_id,
+    "milestone_name": Milestone.milestone_name,
+    "type": Anomaly.type,
+    "severity": Anomaly.severity,
+    "description": Anomaly.description,
+    "detected_on": Anomaly.detected_on,
+}
+# Always returned: together they form the keyset cursor.
+CURSOR_FIELDS = ("detected_on", "anomaly_id")
+
+
+def encode_cursor(detected_on: Optional[datetime], anomaly_id: int) -> str:
+    raw = json.dumps([detected_on.isoformat() if detected_on else None, anomaly_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    try:
+        detected_on, anomaly_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (
+            datetime.fromisoformat(detected_on) if detected_on else None,
+            int(anomaly_id),
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
 
 @router.get("/search")
 async def search_anomalies(
@@ -13,38 +57,90 @@ async def search_anomalies(
     project_id: str | None = None,
     market: str | None = None,
     severity: str | None = None,
+    fields: Optional[List[str]] = Query(
+        None, description=f"Columns to return; any of {', '.join(SEARCH_FIELDS)}"
+    ),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
     db: AsyncSession = Depends(get_db),
 ):
+    """
+    Page through anomalies newest first (``detected_on DESC, anomaly_id DESC``;
+    anomalies without a detection time come first, as in the per-project list).
+    """
+    selected = list(SEARCH_FIELDS) if not fields else list(dict.fromkeys(fields))
+    unknown = [f for f in selected if f not in SEARCH_FIELDS]
+    if unknown:
+        raise HTTPException(
+            status_code=422, detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    selected += [f for f in CURSOR_FIELDS if f not in selected]
+
+    agent_id = None
+    if agent:
+        agent_id = await agent_index.resolve(db, agent)
+        if agent_id is None:
+            return {"items": [], "next_cursor": None, "limit": limit}
+
+    # Always inner-joined, even when no filter or field needs them: anomalies
+    # whose milestone has no project or agent are not part of the search.
     stmt = (
-        select(Anomaly, Milestone, Project, Agent)
+        select(*(SEARCH_FIELDS[f].label(f) for f in selected))
         .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
         .join(Project, Project.project_id == Milestone.project_id)
         .join(Agent, Agent.agent_id == Milestone.agent_id)
     )
 
-    if agent:
-        stmt = stmt.filter(Agent.agent_name == agent)
+    if agent_id is not None:
+        stmt = stmt.filter(Milestone.agent_id == agent_id)
     if project_id:
-        stmt = stmt.filter(Project.project_id == project_id)
+        stmt = stmt.filter(Milestone.project_id == project_id)
     if market:
         stmt = stmt.filter(Project.market == market)
     if severity:
         stmt = stmt.filter(Anomaly.severity == severity)
 
+    if cursor:
+        after_detected_on, after_id = decode_cursor(cursor)
+        if after_detected_on is None:
+            stmt = stmt.filter(
+                or_(
+                    and_(Anomaly.detected_on.is_(None), Anomaly.anomaly_id < after_id),
+                    Anomaly.detected_on.is_not(None),
+                )
+            )
+        else:
+            stmt = stmt.filter(
+                tuple_(Anomaly.detected_on, Anomaly.anomaly_id)
+                < tuple_(after_detected_on, after_id)
+            )
+
+    stmt = stmt.order_by(
+        Anomaly.detected_on.desc(), Anomaly.anomaly_id.desc()
+    ).limit(limit + 1)
+
     result = await db.execute(stmt)
-    rows = result.all()
-
-    return [
-        {
-            "anomaly_id": a.anomaly_id,
-            "project_id": p.project_id,
-            "agent": ag.agent_name,
-            "milestone_id": m.milestone_id,
-            "milestone_name": m.milestone_name,
-            "type": a.type,
-            "severity": a.severity,
-            "description": a.description,
-            "detected_on": a.detected_on,
-        }
-        for (a, m, p, ag) in rows
-    ]
+    rows = result.mappings().all()
+
+    items = [dict(r) for r in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["detected_on"], last["anomaly_id"])
+
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
+
+
+@router.post("/detect")
+async def detect_anomalies(
+    full: bool = Query(False, description="Re-evaluate every milestone, not just changed ones"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Run the rule-based detector (Missing Date, Long Duration, Out-of-Order
+    Dependency, Vendor Delay) over milestones changed since the last run.
+    """
+    try:
+        return await AnomalyDetectionService(db).run(full=full)
+    except DetectionInProgress as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
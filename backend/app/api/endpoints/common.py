@@ -16,18 +16,20 @@ class ProjectSummaryRequest(BaseModel):
 
 
 @router.get("/summary/{project_id}", response_model=ProjectSummaryResult)
-async def summarize_project(project_id: str):
+async def summarize_project(project_id: str, force_refresh: bool = False):
     """
     Run the ProjectSummaryFlow (CrewAI pipeline) to analyze a project.
+    Served from the result cache while the project's data is unchanged.
     """
-    result = await project_summary_generator(project_id)
+    result = await project_summary_generator(project_id, force_refresh=force_refresh)
     return result
 
 
 @router.get("/role/summary/{role:path}", response_model=RoleSummaryResult)
-async def summarize_role(role: str):
+async def summarize_role(role: str, force_refresh: bool = False):
     """
     Run the RoleSummaryFlow (CrewAI pipeline) to analyze a role (status, delays, anomalies, etc.).
+    Served from the result cache while the role's data is unchanged.
     """
-    result = await role_summary_generator(role)
+    result = await role_summary_generator(role, force_refresh=force_refresh)
     return result
@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+from backend.app.db.session import pool_monitor
+
+router = APIRouter(prefix="/health", tags=["Health"])
+
+
+@router.get("/db-pool")
+async def db_pool_metrics():
+    return pool_monitor.snapshot()
@@ -0,0 +1,66 @@
+import uuid
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from urllib.parse import unquote
+
+from backend.app.jobs import FAILED, SUCCEEDED, JobQueue
+from backend.app.schemas import QueryRequest
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+queue = JobQueue()
+
+
+async def _submit(kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    job = await queue.submit(kind, params)
+    return {**job, "status_url": f"/jobs/{job['job_id']}", "result_url": f"/jobs/{job['job_id']}/result"}
+
+
+@router.post("/project-summary/{project_id}", status_code=status.HTTP_202_ACCEPTED)
+async def submit_project_summary(project_id: str, force_refresh: bool = False):
+    """Queue the ProjectSummaryFlow; poll ``status_url`` and fetch ``result_url``."""
+    return await _submit(
+        "project_summary", {"project_id": project_id, "force_refresh": force_refresh}
+    )
+
+
+@router.post("/role-summary/{role:path}", status_code=status.HTTP_202_ACCEPTED)
+async def submit_role_summary(role: str, force_refresh: bool = False):
+    """Queue the RoleSummaryFlow for an agent role."""
+    return await _submit("role_summary", {"role": unquote(role), "force_refresh": force_refresh})
+
+
+@router.post("/query", status_code=status.HTTP_202_ACCEPTED)
+async def submit_query(query: QueryRequest):
+    """Queue the SQL query generator flow."""
+    return await _submit("query", {"user_query": query.user_query})
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: uuid.UUID):
+    job = await queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: uuid.UUID):
+    """
+    The flow's output once the job succeeded (same body as the synchronous
+    endpoint); 202 with the job while it is queued or running, 409 if it failed.
+    """
+    job = await queue.get(job_id, with_result=True)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] == SUCCEEDED:
+        return job["result"]
+    if job["status"] == FAILED:
+        raise HTTPException(status_code=409, detail={"status": FAILED, "error": job["error"]})
+    job.pop("result")
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED, content=jsonable_encoder(job)
+    )
@@ -1,14 +1,66 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
+from sqlalchemy.orm import aliased
 from backend.app.dependencies.db import get_db
-from backend.app.models.entities import Project, Milestone, Anomaly, CycleTime
+from backend.app.models.entities import Agent, Project, Milestone, Anomaly, CycleTime
 from backend.app.schemas.common import Project as ProjectSchema, Milestone as MilestoneSchema, Anomaly as AnomalySchema, CycleTime as CycleSchema
+from backend.app.schemas.schedule import (
+    CriticalPathBatchRequest,
+    ProjectSummaryBatchRequest,
+    WhatIfRequest,
+)
+from backend.app.services.critical_path_service import CriticalPathService
+from backend.app.services.delay_propagation_service import DelayPropagationService
+from backend.app.services.eta_forecast_service import EtaForecastService
+from backend.app.services.project_summary_service import ProjectSummaryService
 from typing import List, Dict
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
 
+@router.post("/critical-path:batch")
+async def critical_path_batch(
+    request: CriticalPathBatchRequest, db: AsyncSession = Depends(get_db)
+):
+    """Critical path of many projects (a list, a market or the whole portfolio) in one pass."""
+    service = CriticalPathService(db)
+    project_ids = await service.resolve_project_ids(request.project_ids, request.market)
+    projects = await service.compute(project_ids, request.include_milestones)
+    return {
+        "projects": [projects[pid] for pid in project_ids if pid in projects],
+        "missing": [pid for pid in project_ids if pid not in projects],
+    }
+
+
+@router.post("/summary:batch")
+async def project_summary_batch(
+    request: ProjectSummaryBatchRequest, db: AsyncSession = Depends(get_db)
+):
+    """
+    Summaries of many projects, each in the shape of ``GET /{project_id}/summary``,
+    from the same single statement run over ``project_id = ANY(:ids)``.
+    """
+    project_ids = list(dict.fromkeys(request.project_ids))
+    summaries = await ProjectSummaryService(db).fetch_summaries(project_ids)
+    return {
+        "projects": [summaries[pid] for pid in project_ids if pid in summaries],
+        "missing": [pid for pid in project_ids if pid not in summaries],
+    }
+
+
+@router.post("/what-if")
+async def what_if_delays(request: WhatIfRequest, db: AsyncSession = Depends(get_db)):
+    """
+    Forecast the effect of proposed slips ("Zoning Approved slips 30 days in
+    NYC") on every downstream milestone and project finish.
+    """
+    slips = [slip.model_dump(exclude_none=True) for slip in request.slips]
+    return await DelayPropagationService(db).what_if(
+        slips, request.project_ids, request.market, request.include_milestones
+    )
+
+
 @router.get("/{project_id}", response_model=ProjectSchema)
 async def get_project(project_id: str, db: AsyncSession = Depends(get_db)):
     result = await db.execute(select(Project).filter(Project.project_id == project_id))
@@ -47,8 +99,50 @@ async def project_cycles(project_id: str, db: AsyncSession = Depends(get_db)):
     return result.scalars().all()
 
 
+@router.get("/{project_id}/critical-path")
+async def project_critical_path(project_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    CPM over the project's dependency graph: topological order, earliest and
+    latest dates, slack, the critical path and any dependency cycles.
+    """
+    result = await CriticalPathService(db).project(project_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="No milestones for project")
+    return result
+
+
+@router.get("/{project_id}/eta-forecast")
+async def project_eta_forecast(
+    project_id: str,
+    scenarios: int | None = Query(None, ge=100, le=50000),
+    force_refresh: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    P50/P80/P95 completion dates from a Monte Carlo run over the dependency
+    graph, cached until the project's milestones change.
+    """
+    result = await EtaForecastService(db).forecast(
+        project_id, scenarios=scenarios, force_refresh=force_refresh
+    )
+    if result is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return result
+
+
 @router.get("/{project_id}/summary")
-async def project_summary(project_id: str, db: AsyncSession = Depends(get_db)):
+async def project_summary(
+    project_id: str,
+    single_query: bool = True,
+    db: AsyncSession = Depends(get_db),
+):
+    if single_query:
+        # Whole payload assembled server-side with CTEs + json_agg: one round trip.
+        summary = await ProjectSummaryService(db).fetch_summary(project_id)
+        if summary is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return summary
+
     # 1. Project
     result = await db.execute(select(Project).filter(Project.project_id == project_id))
     p = result.scalars().first()
@@ -99,18 +193,26 @@ async def project_summary(project_id: str, db: AsyncSession = Depends(get_db)):
     ]
 
     # 4. Cycles (full details)
-    result = await db.execute(select(CycleTime).filter(CycleTime.project_id == project_id))
+    start_agent, end_agent = aliased(Agent), aliased(Agent)
+    result = await db.execute(
+        select(CycleTime, start_agent.agent_name, end_agent.agent_name)
+        .outerjoin(start_agent, start_agent.agent_id == CycleTime.agent_start_id)
+        .outerjoin(end_agent, end_agent.agent_id == CycleTime.agent_end_id)
+        .filter(CycleTime.project_id == project_id)
+    )
     cycles = [
         {
             "cycle_id": c.cycle_id,
             "label": getattr(c, "label", "cycle"),
             "agent_start_id": c.agent_start_id,
             "agent_end_id": c.agent_end_id,
+            "agent_start_name": start_name,
+            "agent_end_name": end_name,
             "planned": c.planned_duration,
             "actual": c.actual_duration,
             "variance": c.variance,
         }
-        for c in result.scalars().all()
+        for c, start_name, end_name in result.all()
     ]
 
     # Final structured response
@@ -1,31 +1,37 @@
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from backend.app.dependencies.db import get_db
-from backend.app.models.entities import Vendor, MilestoneVendor, Milestone, Project
+from backend.app.services.vendor_delay_service import VendorDelayService
 
 router = APIRouter(prefix="/vendors", tags=["Vendors"])
 
 
 @router.get("/top-delays")
-async def vendors_top_delays(db: AsyncSession = Depends(get_db)):
-    stmt = (
-        select(Vendor.vendor_name, Project.market, Project.site_type)
-        .join(MilestoneVendor, MilestoneVendor.vendor_id == Vendor.vendor_id)
-        .join(Milestone, Milestone.milestone_id == MilestoneVendor.milestone_id)
-        .join(Project, Project.project_id == Milestone.project_id)
-        .filter(Milestone.status == "Delayed")
+async def vendors_top_delays(
+    by_market: bool = False,
+    by_site_type: bool = False,
+    top_n: Optional[int] = Query(None, ge=1),
+    use_rollup: bool = Query(
+        False, description="Read from vendor_delay_rollup instead of the live tables"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    return await VendorDelayService(db).top_delays(
+        by_market=by_market,
+        by_site_type=by_site_type,
+        top_n=top_n,
+        use_rollup=use_rollup,
     )
 
-    result = await db.execute(stmt)
-    rows = result.all()
-
-    counts = {}
-    for vendor_name, market, site_type in rows:
-        counts.setdefault(vendor_name, 0)
-        counts[vendor_name] += 1
 
-    return [
-        {"vendor": k, "delayed_milestones": v}
-        for k, v in sorted(counts.items(), key=lambda x: x[1], reverse=True)
-    ]
+@router.post("/top-delays/refresh")
+async def refresh_vendor_delay_rollup(
+    market: Optional[List[str]] = Query(
+        None, description="Only refresh these markets (default: all)"
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """Recompute the vendor delay rollup for the given markets (or all) and write only changed groups."""
+    return await VendorDelayService(db).refresh_rollup(markets=market)
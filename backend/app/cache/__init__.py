@@ -0,0 +1,8 @@
+from .backends import CacheBackend, MemoryCache, RedisCache, build_cache_backend
+
+__all__ = [
+    "CacheBackend",
+    "MemoryCache",
+    "RedisCache",
+    "build_cache_backend",
+]
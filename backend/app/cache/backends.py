@@ -0,0 +1,90 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional: only needed for a shared cache
+    redis = None
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store ``value`` for ``ttl`` seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache with per-entry TTL."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class RedisCache(CacheBackend):
+    """Shared cache across workers. Values must be bytes."""
+
+    def __init__(self, url: str, namespace: str = "verizon-poc:"):
+        if redis is None:
+            raise RuntimeError("RedisCache requires the 'redis' package")
+        self.client = redis.from_url(url)
+        self.namespace = namespace
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.namespace + key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.namespace + key, value, px=int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(self.namespace + key)
+
+    async def clear(self) -> None:
+        async for key in self.client.scan_iter(match=self.namespace + "*"):
+            await self.client.delete(key)
+
+
+def build_cache_backend(url: str = "", max_entries: int = 1024) -> CacheBackend:
+    """``redis://...`` selects the shared backend; anything else stays in-process."""
+    if url.startswith(("redis://", "rediss://")):
+        return RedisCache(url)
+    return MemoryCache(max_entries=max_entries)
@@ -12,6 +12,87 @@ class Settings(BaseSettings):
     DATABASE_NAME: str = Field(default="", description="Database name")
     DATABASE_PORT: int = Field(default=5432, description="Database port")
 
+    DATABASE_ECHO: bool = Field(
+        default=False, description="Log every SQL statement (debugging only)"
+    )
+    DATABASE_POOL_SIZE: int = Field(
+        default=10, description="Connections kept open in the pool"
+    )
+    DATABASE_MAX_OVERFLOW: int = Field(
+        default=20, description="Extra connections allowed above pool size"
+    )
+    DATABASE_POOL_TIMEOUT: int = Field(
+        default=30, description="Seconds to wait for a free connection"
+    )
+    DATABASE_POOL_RECYCLE: int = Field(
+        default=1800, description="Recycle connections older than this (seconds)"
+    )
+    DATABASE_POOL_PRE_PING: bool = Field(
+        default=True, description="Test connections for liveness on checkout"
+    )
+    DATABASE_STATEMENT_CACHE_SIZE: int = Field(
+        default=500,
+        description="Prepared statements cached per connection (0 disables, e.g. behind PgBouncer)",
+    )
+    DATABASE_POOL_SATURATION_WARNING: float = Field(
+        default=0.9,
+        description="Log a warning when this fraction of pool capacity is checked out",
+    )
+
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        default=True, description="Serve hot read-only routes from the response cache"
+    )
+    RESPONSE_CACHE_URL: str = Field(
+        default="",
+        description="redis:// URL for a cache shared across workers (default: in-process)",
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(
+        default=1024, description="Entry limit of the in-process LRU response cache"
+    )
+
+    ALERT_REPORT_BATCH_SIZE: int = Field(
+        default=5000,
+        description="projects_encoded rows fetched and processed per alert report batch",
+    )
+
+    ANOMALY_DETECTION_BATCH_SIZE: int = Field(
+        default=5000, description="Milestones evaluated per anomaly detection batch"
+    )
+
+    ETA_FORECAST_SCENARIOS: int = Field(
+        default=5000, description="Monte Carlo scenarios per project ETA forecast"
+    )
+    ETA_FORECAST_MIN_SAMPLES: int = Field(
+        default=5,
+        description="Historical durations needed before a (agent, milestone, market) pool is used",
+    )
+    ETA_FORECAST_CACHE_TTL: int = Field(
+        default=86400, description="Seconds a forecast is reused for an unchanged project"
+    )
+
+    AGENT_INDEX_CHECK_INTERVAL: float = Field(
+        default=30.0,
+        description="Seconds between checks of the agents table for renamed or added agents",
+    )
+
+    JOB_WORKER_CONCURRENCY: int = Field(
+        default=2,
+        description="Jobs run concurrently by the API process (0: leave them to `python -m backend.app.jobs`)",
+    )
+    JOB_POLL_INTERVAL: float = Field(
+        default=1.0, description="Seconds an idle worker waits before polling the queue again"
+    )
+    JOB_HEARTBEAT_INTERVAL: float = Field(
+        default=15.0, description="Seconds between heartbeats of a running job"
+    )
+    JOB_STALE_AFTER: float = Field(
+        default=120.0,
+        description="Running jobs without a heartbeat for this long are requeued (their worker died)",
+    )
+    JOB_MAX_ATTEMPTS: int = Field(
+        default=3, description="Runs of a job, including retries after a dead worker, before it fails"
+    )
+
     model_config = SettingsConfigDict(
         env_file=".env", extra="ignore", env_file_encoding="utf-8"
     )
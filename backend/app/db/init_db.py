@@ -0,0 +1,18 @@
+from backend.app.db.migrations import MIGRATIONS, MigrationError, pending_revisions
+from backend.app.db.session import engine
+
+
+async def init_db() -> None:
+    """
+    Check that the objects the API owns (rollups, indexes, ...) are at the
+    latest migration. Migrations are applied by a deploy step
+    (``python -m backend.app.db.migrations upgrade``), never at API startup:
+    some build indexes concurrently or fill large rollups. Source tables
+    (projects, milestones, ...) are loaded externally and are never created here.
+    """
+    pending = await pending_revisions(engine, MIGRATIONS)
+    if pending:
+        raise MigrationError(
+            f"Database schema is behind (pending: {', '.join(pending)}); "
+            "run `python -m backend.app.db.migrations upgrade` first"
+        )
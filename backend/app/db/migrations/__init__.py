@@ -0,0 +1,19 @@
+from .runner import (
+    Migration,
+    MigrationError,
+    current_revision,
+    downgrade,
+    pending_revisions,
+    upgrade,
+)
+from .versions import MIGRATIONS
+
+__all__ = [
+    "MIGRATIONS",
+    "Migration",
+    "MigrationError",
+    "current_revision",
+    "downgrade",
+    "pending_revisions",
+    "upgrade",
+]
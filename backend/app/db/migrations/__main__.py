@@ -0,0 +1,65 @@
+"""
+Schema migrations and index checks.
+
+    python -m backend.app.db.migrations upgrade [revision]
+    python -m backend.app.db.migrations downgrade <revision|base>
+    python -m backend.app.db.migrations current
+    python -m backend.app.db.migrations check-scans [--planner-choice]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from backend.app.db.migrations import (
+    MIGRATIONS,
+    MigrationError,
+    current_revision,
+    downgrade,
+    upgrade,
+)
+from backend.app.db.scan_check import find_sequential_scans
+from backend.app.db.session import engine
+
+
+async def main(args: argparse.Namespace) -> int:
+    status = 0
+    try:
+        if args.command == "upgrade":
+            applied = await upgrade(engine, MIGRATIONS, args.revision)
+            print("applied:", ", ".join(applied) or "nothing to do")
+        elif args.command == "downgrade":
+            reverted = await downgrade(engine, MIGRATIONS, args.revision)
+            print("reverted:", ", ".join(reverted) or "nothing to do")
+        elif args.command == "current":
+            print(await current_revision(engine) or "base")
+        elif args.command == "check-scans":
+            async with engine.begin() as conn:
+                report = await find_sequential_scans(conn, strict=not args.planner_choice)
+            for name, tables in report.items():
+                print(f"{'SEQ SCAN' if tables else 'ok':<9} {name:<24} {', '.join(tables)}")
+            status = int(any(report.values()))
+    except MigrationError as exc:
+        print(exc, file=sys.stderr)
+        status = 2
+    finally:
+        await engine.dispose()
+    return status
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Schema migrations and index checks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    up = sub.add_parser("upgrade")
+    up.add_argument("revision", nargs="?")
+    down = sub.add_parser("downgrade")
+    down.add_argument("revision")
+    sub.add_parser("current")
+    scans = sub.add_parser("check-scans")
+    scans.add_argument(
+        "--planner-choice",
+        action="store_true",
+        help="Report the planner's actual choice instead of forcing index paths",
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,135 @@
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary constant: serialises concurrent upgrade runs (several workers starting at once).
+_ADVISORY_LOCK_ID = 7_304_211
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    One schema revision. ``upgrade``/``downgrade`` are SQL statements run in
+    order. Migrations that use ``CREATE INDEX CONCURRENTLY`` (which cannot run
+    inside a transaction) set ``transactional=False`` and run in autocommit.
+    """
+
+    revision: str
+    description: str
+    upgrade: Sequence[str]
+    downgrade: Sequence[str] = field(default_factory=tuple)
+    transactional: bool = True
+
+
+class MigrationError(RuntimeError):
+    pass
+
+
+def _check_target(migrations: Sequence[Migration], target: Optional[str]) -> None:
+    known = {m.revision for m in migrations} | {"base"}
+    if target is not None and target not in known:
+        raise MigrationError(f"Unknown revision {target!r}; expected one of {', '.join(sorted(known))}")
+
+
+_SCHEMA_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        revision VARCHAR(32) PRIMARY KEY,
+        description TEXT NOT NULL,
+        applied_at TIMESTAMP NOT NULL DEFAULT now()
+    )
+"""
+
+
+async def _applied(conn: AsyncConnection) -> List[str]:
+    await conn.execute(text(_SCHEMA_TABLE_DDL))
+    result = await conn.execute(
+        text("SELECT revision FROM schema_migrations ORDER BY revision")
+    )
+    return list(result.scalars().all())
+
+
+async def _run(engine: AsyncEngine, migration: Migration, statements: Sequence[str]) -> None:
+    if migration.transactional:
+        async with engine.begin() as conn:
+            for stmt in statements:
+                await conn.execute(text(stmt))
+    else:
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for stmt in statements:
+                await conn.execute(text(stmt))
+
+
+async def current_revision(engine: AsyncEngine) -> Optional[str]:
+    async with engine.begin() as conn:
+        applied = await _applied(conn)
+    return applied[-1] if applied else None
+
+
+async def pending_revisions(engine: AsyncEngine, migrations: Sequence[Migration]) -> List[str]:
+    async with engine.begin() as conn:
+        applied = set(await _applied(conn))
+    return [m.revision for m in migrations if m.revision not in applied]
+
+
+async def upgrade(
+    engine: AsyncEngine, migrations: Sequence[Migration], target: Optional[str] = None
+) -> List[str]:
+    """Apply pending migrations up to ``target`` (default: latest). Returns applied revisions."""
+    _check_target(migrations, target)
+    done: List[str] = []
+    if target == "base":
+        return done
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.execute(text(f"SELECT pg_advisory_lock({_ADVISORY_LOCK_ID})"))
+        try:
+            async with engine.begin() as conn:
+                applied = set(await _applied(conn))
+            for migration in migrations:
+                if migration.revision not in applied:
+                    logger.info("Applying migration %s: %s", migration.revision, migration.description)
+                    await _run(engine, migration, migration.upgrade)
+                    async with engine.begin() as conn:
+                        await conn.execute(
+                            text(
+                                "INSERT INTO schema_migrations (revision, description) "
+                                "VALUES (:revision, :description)"
+                            ),
+                            {"revision": migration.revision, "description": migration.description},
+                        )
+                    done.append(migration.revision)
+                if migration.revision == target:
+                    break
+        finally:
+            await lock_conn.execute(text(f"SELECT pg_advisory_unlock({_ADVISORY_LOCK_ID})"))
+    return done
+
+
+async def downgrade(
+    engine: AsyncEngine, migrations: Sequence[Migration], target: str
+) -> List[str]:
+    """Revert applied migrations newer than ``target`` ("base" reverts all)."""
+    _check_target(migrations, target)
+    reverted: List[str] = []
+    async with engine.begin() as conn:
+        applied = set(await _applied(conn))
+    for migration in reversed(migrations):
+        if migration.revision == target:
+            break
+        if migration.revision not in applied:
+            continue
+        logger.info("Reverting migration %s", migration.revision)
+        await _run(engine, migration, migration.downgrade)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text("DELETE FROM schema_migrations WHERE revision = :revision"),
+                {"revision": migration.revision},
+            )
+        reverted.append(migration.revision)
+    return reverted
@@ -0,0 +1,16 @@
+from .v0001_derived_rollups import migration as v0001
+from .v0002_join_path_indexes import migration as v0002
+from .v0003_anomaly_detection import migration as v0003
+from .v0004_job_queue import migration as v0004
+from .v0005_cycle_rollup_key import migration as v0005
+
+# Applied in this order; append new revisions at the end.
+MIGRATIONS = [
+    v0001,
+    v0002,
+    v0003,
+    v0004,
+    v0005,
+]
+
+__all__ = ["MIGRATIONS"]
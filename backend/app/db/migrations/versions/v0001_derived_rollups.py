@@ -0,0 +1,46 @@
+from backend.app.db.migrations.runner import Migration
+
+# Idempotent so databases that already got these objects from the pre-migration
+# init_db() are adopted as-is.
+migration = Migration(
+    revision="0001",
+    description="vendor_delay_rollup table and cycle_time_rollup materialized view",
+    upgrade=(
+        """
+        CREATE TABLE IF NOT EXISTS vendor_delay_rollup (
+            vendor_id INTEGER NOT NULL REFERENCES vendors (vendor_id) ON DELETE CASCADE,
+            market VARCHAR(100) NOT NULL,
+            site_type VARCHAR(50) NOT NULL DEFAULT '',
+            delayed_milestones INTEGER NOT NULL,
+            refreshed_at TIMESTAMP NOT NULL,
+            PRIMARY KEY (vendor_id, market, site_type)
+        )
+        """,
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS cycle_time_rollup AS
+        SELECT
+            c.agent_start_id,
+            c.agent_end_id,
+            p.market,
+            count(*) AS cycles,
+            avg(c.actual_duration)::float AS avg_actual_days,
+            percentile_cont(0.5) WITHIN GROUP (ORDER BY c.actual_duration) AS p50_actual_days,
+            percentile_cont(0.9) WITHIN GROUP (ORDER BY c.actual_duration) AS p90_actual_days,
+            avg(c.planned_duration)::float AS avg_planned_days,
+            avg(c.variance)::float AS avg_variance_days
+        FROM cycle_times c
+        JOIN projects p ON p.project_id = c.project_id
+        WHERE c.actual_duration IS NOT NULL
+        GROUP BY GROUPING SETS (
+            (c.agent_start_id, c.agent_end_id, p.market),
+            (c.agent_start_id, c.agent_end_id)
+        )
+        """,
+        "CREATE UNIQUE INDEX IF NOT EXISTS ux_cycle_time_rollup_key "
+        "ON cycle_time_rollup (agent_start_id, agent_end_id, market)",
+    ),
+    downgrade=(
+        "DROP MATERIALIZED VIEW IF EXISTS cycle_time_rollup",
+        "DROP TABLE IF EXISTS vendor_delay_rollup",
+    ),
+)
@@ -0,0 +1,34 @@
+from backend.app.db.migrations.runner import Migration
+
+# (name, table, columns) — shaped after the endpoint queries:
+#   milestones (project_id, planned_date)   project summary / timeline ordering
+#   milestones (agent_id, status)           agent- and role-scoped alerts/analytics
+#   milestones (status)                     vendor delay ranking (status = 'Delayed')
+#   anomalies (milestone_id, detected_on)   per-project anomaly lists
+#   anomalies (detected_on, anomaly_id)     keyset pagination in /anomalies/search
+#   dependencies, milestone_vendors, cycle_times, projects: FK / filter columns
+INDEXES = (
+    ("ix_milestones_project_id_planned_date", "milestones", "project_id, planned_date"),
+    ("ix_milestones_agent_id_status", "milestones", "agent_id, status"),
+    ("ix_milestones_status", "milestones", "status"),
+    ("ix_anomalies_milestone_id_detected_on", "anomalies", "milestone_id, detected_on"),
+    ("ix_anomalies_detected_on_anomaly_id", "anomalies", "detected_on, anomaly_id"),
+    ("ix_dependencies_milestone_id", "dependencies", "milestone_id"),
+    ("ix_dependencies_prerequisite_id", "dependencies", "prerequisite_id"),
+    ("ix_milestone_vendors_vendor_id", "milestone_vendors", "vendor_id"),
+    ("ix_cycle_times_project_id", "cycle_times", "project_id"),
+    ("ix_projects_market", "projects", "market"),
+)
+
+migration = Migration(
+    revision="0002",
+    description="Indexes for FK-heavy join paths",
+    upgrade=tuple(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns})"
+        for name, table, columns in INDEXES
+    ),
+    downgrade=tuple(
+        f"DROP INDEX CONCURRENTLY IF EXISTS {name}" for name, _, _ in INDEXES
+    ),
+    transactional=False,
+)
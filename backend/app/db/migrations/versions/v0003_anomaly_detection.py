@@ -0,0 +1,109 @@
+from backend.app.db.migrations.runner import Migration
+
+# Columns the detection rules read; touching anything else (anomaly_flag, which
+# the engine itself writes) must not mark the milestone as changed.
+_TRACKED_COLUMNS = (
+    "project_id",
+    "agent_id",
+    "milestone_name",
+    "planned_date",
+    "actual_date",
+    "status",
+    "duration_days",
+)
+
+# Non-transactional because of CREATE INDEX CONCURRENTLY; every statement is
+# idempotent so a partially applied run can simply be retried.
+migration = Migration(
+    revision="0003",
+    description="Change tracking and run log for the anomaly detection engine",
+    upgrade=(
+        # now() is not volatile, so the column is added without rewriting the table
+        "ALTER TABLE milestones ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT now()",
+        "ALTER TABLE anomalies ADD COLUMN IF NOT EXISTS source VARCHAR(30)",
+        # The engine inserts anomalies without ids; externally loaded rows come
+        # with explicit ids, so make sure there is a sequence and it is past them.
+        """
+        DO $$
+        DECLARE
+            seq text := pg_get_serial_sequence('anomalies', 'anomaly_id');
+        BEGIN
+            IF seq IS NULL THEN
+                CREATE SEQUENCE IF NOT EXISTS anomalies_anomaly_id_seq OWNED BY anomalies.anomaly_id;
+                ALTER TABLE anomalies ALTER COLUMN anomaly_id SET DEFAULT nextval('anomalies_anomaly_id_seq');
+                seq := 'anomalies_anomaly_id_seq';
+            END IF;
+            PERFORM setval(seq, (SELECT coalesce(max(anomaly_id), 0) + 1 FROM anomalies), false);
+        END
+        $$
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS anomaly_detection_runs (
+            run_id SERIAL PRIMARY KEY,
+            detected_on TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP NOT NULL,
+            full_scan BOOLEAN NOT NULL,
+            milestones_scanned INTEGER NOT NULL,
+            anomalies_inserted INTEGER NOT NULL,
+            anomalies_resolved INTEGER NOT NULL
+        )
+        """,
+        """
+        CREATE OR REPLACE FUNCTION milestones_touch_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = clock_timestamp();
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS trg_milestones_touch_updated_at ON milestones",
+        f"""
+        CREATE TRIGGER trg_milestones_touch_updated_at
+        BEFORE UPDATE ON milestones
+        FOR EACH ROW
+        WHEN (
+            ({", ".join(f"OLD.{c}" for c in _TRACKED_COLUMNS)})
+            IS DISTINCT FROM ({", ".join(f"NEW.{c}" for c in _TRACKED_COLUMNS)})
+        )
+        EXECUTE FUNCTION milestones_touch_updated_at()
+        """,
+        # Dependency and vendor link changes re-trigger detection for the dependent milestone.
+        """
+        CREATE OR REPLACE FUNCTION milestones_touch_linked() RETURNS trigger AS $$
+        BEGIN
+            UPDATE milestones SET updated_at = clock_timestamp()
+            WHERE milestone_id IN (
+                CASE WHEN TG_OP <> 'INSERT' THEN OLD.milestone_id END,
+                CASE WHEN TG_OP <> 'DELETE' THEN NEW.milestone_id END
+            );
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        "DROP TRIGGER IF EXISTS trg_dependencies_touch_milestone ON dependencies",
+        """
+        CREATE TRIGGER trg_dependencies_touch_milestone
+        AFTER INSERT OR UPDATE OR DELETE ON dependencies
+        FOR EACH ROW EXECUTE FUNCTION milestones_touch_linked()
+        """,
+        "DROP TRIGGER IF EXISTS trg_milestone_vendors_touch_milestone ON milestone_vendors",
+        """
+        CREATE TRIGGER trg_milestone_vendors_touch_milestone
+        AFTER INSERT OR UPDATE OR DELETE ON milestone_vendors
+        FOR EACH ROW EXECUTE FUNCTION milestones_touch_linked()
+        """,
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_milestones_updated_at ON milestones (updated_at)",
+    ),
+    downgrade=(
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_milestones_updated_at",
+        "DROP TRIGGER IF EXISTS trg_milestone_vendors_touch_milestone ON milestone_vendors",
+        "DROP TRIGGER IF EXISTS trg_dependencies_touch_milestone ON dependencies",
+        "DROP TRIGGER IF EXISTS trg_milestones_touch_updated_at ON milestones",
+        "DROP FUNCTION IF EXISTS milestones_touch_linked()",
+        "DROP FUNCTION IF EXISTS milestones_touch_updated_at()",
+        "DROP TABLE IF EXISTS anomaly_detection_runs",
+        "ALTER TABLE anomalies DROP COLUMN IF EXISTS source",
+        "ALTER TABLE milestones DROP COLUMN IF EXISTS updated_at",
+    ),
+    transactional=False,
+)
@@ -0,0 +1,34 @@
+from backend.app.db.migrations.runner import Migration
+
+migration = Migration(
+    revision="0004",
+    description="Durable queue for long-running agent jobs",
+    upgrade=(
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id UUID PRIMARY KEY,
+            kind VARCHAR(50) NOT NULL,
+            params JSONB NOT NULL DEFAULT '{}'::jsonb,
+            status VARCHAR(20) NOT NULL DEFAULT 'queued',
+            result JSONB,
+            error TEXT,
+            attempts INTEGER NOT NULL DEFAULT 0,
+            worker VARCHAR(100),
+            created_at TIMESTAMP NOT NULL DEFAULT now(),
+            started_at TIMESTAMP,
+            heartbeat_at TIMESTAMP,
+            finished_at TIMESTAMP
+        )
+        """,
+        # Workers claim the oldest queued job; the index only holds the backlog.
+        """
+        CREATE INDEX IF NOT EXISTS ix_jobs_queued
+        ON jobs (created_at) WHERE status = 'queued'
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS ix_jobs_running_heartbeat
+        ON jobs (heartbeat_at) WHERE status = 'running'
+        """,
+    ),
+    downgrade=("DROP TABLE IF EXISTS jobs",),
+)
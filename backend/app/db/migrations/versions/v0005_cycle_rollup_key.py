@@ -0,0 +1,44 @@
+from backend.app.db.migrations.runner import Migration
+
+_ROLLUP_SQL = """
+    CREATE MATERIALIZED VIEW cycle_time_rollup AS
+    SELECT
+        c.agent_start_id,
+        c.agent_end_id,
+        {market} AS market,
+        count(*) AS cycles,
+        avg(c.actual_duration)::float AS avg_actual_days,
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY c.actual_duration) AS p50_actual_days,
+        percentile_cont(0.9) WITHIN GROUP (ORDER BY c.actual_duration) AS p90_actual_days,
+        avg(c.planned_duration)::float AS avg_planned_days,
+        avg(c.variance)::float AS avg_variance_days
+    FROM cycle_times c
+    JOIN projects p ON p.project_id = c.project_id
+    WHERE c.actual_duration IS NOT NULL
+    GROUP BY GROUPING SETS (
+        (c.agent_start_id, c.agent_end_id, p.market),
+        (c.agent_start_id, c.agent_end_id)
+    )
+"""
+_KEY_SQL = (
+    "CREATE UNIQUE INDEX ux_cycle_time_rollup_key "
+    "ON cycle_time_rollup (agent_start_id, agent_end_id, market)"
+)
+
+# The all-markets rows had market NULL, so the unique key did not identify
+# them (NULLs are distinct) and every concurrent refresh rewrote them. They
+# now carry the '*' sentinel (projects.market is NOT NULL).
+migration = Migration(
+    revision="0005",
+    description="Key the all-markets rows of cycle_time_rollup with a '*' market",
+    upgrade=(
+        "DROP MATERIALIZED VIEW IF EXISTS cycle_time_rollup",
+        _ROLLUP_SQL.format(market="COALESCE(p.market, '*')"),
+        _KEY_SQL,
+    ),
+    downgrade=(
+        "DROP MATERIALIZED VIEW IF EXISTS cycle_time_rollup",
+        _ROLLUP_SQL.format(market="p.market"),
+        _KEY_SQL,
+    ),
+)
@@ -0,0 +1,38 @@
+import asyncio
+from typing import Any, List, Sequence
+
+from sqlalchemy import Executable, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.db.session import AsyncSessionLocal, pool_monitor
+
+
+async def _fetch_all(statement: Executable) -> Sequence[Row[Any]]:
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(statement)
+        return result.all()
+
+
+async def fetch_all_concurrently(*statements: Executable) -> List[Sequence[Row[Any]]]:
+    """
+    Run independent read-only statements concurrently.
+
+    An AsyncSession can only drive one statement at a time, so each statement
+    gets its own short-lived session (and therefore its own pooled
+    connection). Results are returned in the order the statements were given.
+    """
+    return list(await asyncio.gather(*(_fetch_all(stmt) for stmt in statements)))
+
+
+async def fetch_all(db: AsyncSession, *statements: Executable) -> List[Sequence[Row[Any]]]:
+    """
+    Run independent read-only statements concurrently when the pool can spare
+    a connection per statement, else one after another on ``db``.
+
+    The concurrent path costs ``len(statements)`` extra pooled connections per
+    call; under load that multiplies pool pressure, so once the checkouts would
+    cross the saturation warning threshold the request's own session is used.
+    """
+    if len(statements) > 1 and pool_monitor.has_headroom(len(statements)):
+        return await fetch_all_concurrently(*statements)
+    return [(await db.execute(stmt)).all() for stmt in statements]
@@ -0,0 +1,64 @@
+import logging
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMonitor:
+    """
+    Tracks connection-pool saturation: live checked-out count, the peak since
+    start-up, how often a checkout found the pool at or above ``warn_ratio`` of
+    its capacity, and the time of the last such event. The warning is logged
+    at most once per ``log_interval`` seconds.
+    """
+
+    log_interval = 60.0
+
+    def __init__(self, engine: AsyncEngine, capacity: int, warn_ratio: float = 0.9):
+        self.pool = engine.sync_engine.pool
+        self.capacity = max(capacity, 1)
+        self.warn_ratio = warn_ratio
+        self.peak_checked_out = 0
+        self.saturation_events = 0
+        self.last_saturated_at: float | None = None
+        self._last_logged_at = 0.0
+
+        event.listen(engine.sync_engine, "checkout", self._on_checkout)
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        checked_out = self.pool.checkedout()
+        self.peak_checked_out = max(self.peak_checked_out, checked_out)
+        if checked_out / self.capacity >= self.warn_ratio:
+            now = time.time()
+            self.saturation_events += 1
+            self.last_saturated_at = now
+            if now - self._last_logged_at < self.log_interval:
+                return
+            self._last_logged_at = now
+            logger.warning(
+                "DB pool saturation: %s/%s connections checked out",
+                checked_out,
+                self.capacity,
+            )
+
+    def has_headroom(self, connections: int) -> bool:
+        """True if checking out ``connections`` more would stay below ``warn_ratio`` of capacity."""
+        return (self.pool.checkedout() + connections) / self.capacity < self.warn_ratio
+
+    def snapshot(self) -> Dict[str, Any]:
+        checked_out = self.pool.checkedout()
+        return {
+            "pool_size": self.pool.size(),
+            "capacity": self.capacity,
+            "checked_out": checked_out,
+            "checked_in": self.pool.checkedin(),
+            "overflow": self.pool.overflow(),
+            "saturation": round(checked_out / self.capacity, 3),
+            "peak_checked_out": self.peak_checked_out,
+            "saturation_events": self.saturation_events,
+            "last_saturated_at": self.last_saturated_at,
+        }
@@ -0,0 +1,89 @@
+from typing import Any, Dict, List
+
+from sqlalchemy import Executable, String, bindparam, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from backend.app.models.entities import (
+    Agent,
+    Anomaly,
+    CycleTime,
+    Milestone,
+    MilestoneVendor,
+    Project,
+    Vendor,
+)
+from backend.app.services.agent_summary_service import agent_summary_statements
+from backend.app.services.project_summary_service import PROJECT_SUMMARY_SQL
+
+
+def _hot_statements(project_id: str, agent_id: int, market: str) -> Dict[str, Executable]:
+    """Representative statements of the agent- and project-scoped endpoints."""
+    statements: Dict[str, Executable] = {
+        "projects.summary": PROJECT_SUMMARY_SQL.bindparams(
+            bindparam("project_ids", [project_id], type_=postgresql.ARRAY(String))
+        ),
+        "projects.timeline": select(Milestone)
+        .filter(Milestone.project_id == project_id)
+        .order_by(Milestone.planned_date.asc()),
+        "projects.anomalies": select(Anomaly)
+        .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
+        .filter(Milestone.project_id == project_id)
+        .order_by(Anomaly.detected_on.desc()),
+        "projects.cycles": select(CycleTime).filter(CycleTime.project_id == project_id),
+        "agents.projects": select(Project.project_id, Project.market, Project.site_type)
+        .join(Milestone, Milestone.project_id == Project.project_id)
+        .filter(Milestone.agent_id == agent_id)
+        .distinct(),
+        "anomalies.search": select(Anomaly.anomaly_id, Anomaly.detected_on)
+        .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
+        .join(Project, Project.project_id == Milestone.project_id)
+        .filter(Project.market == market)
+        .order_by(Anomaly.detected_on.desc(), Anomaly.anomaly_id.desc())
+        .limit(101),
+        "vendors.top_delays": select(Vendor.vendor_name)
+        .join(MilestoneVendor, MilestoneVendor.vendor_id == Vendor.vendor_id)
+        .join(Milestone, Milestone.milestone_id == MilestoneVendor.milestone_id)
+        .filter(Milestone.status == "Delayed"),
+    }
+    for section, stmt in agent_summary_statements(agent_id).items():
+        statements[f"alerts.{section}"] = stmt
+    return statements
+
+
+def _seq_scans(plan: Dict[str, Any]) -> List[str]:
+    found = []
+    if plan.get("Node Type") == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(_seq_scans(child))
+    return found
+
+
+async def find_sequential_scans(
+    conn: AsyncConnection, strict: bool = True
+) -> Dict[str, List[str]]:
+    """
+    EXPLAIN the hot endpoint queries and return ``{query: [tables seq-scanned]}``.
+
+    With ``strict`` the planner is told to avoid sequential scans, so any that
+    remain mean no usable index exists; this keeps the check meaningful on
+    small development databases where a seq scan would be chosen anyway.
+    """
+    project_id = (await conn.execute(select(Project.project_id).limit(1))).scalar()
+    agent_id = (await conn.execute(select(Agent.agent_id).limit(1))).scalar()
+    market = (await conn.execute(select(Project.market).limit(1))).scalar()
+    if project_id is None or agent_id is None:
+        return {}
+
+    if strict:
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+
+    report: Dict[str, List[str]] = {}
+    dialect = postgresql.dialect()
+    for name, stmt in _hot_statements(project_id, agent_id, market).items():
+        sql = stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+        result = await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"))
+        plan = result.scalar()[0]["Plan"]
+        report[name] = sorted(set(_seq_scans(plan)))
+    return report
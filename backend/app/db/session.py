@@ -1,19 +1,50 @@
-from sqlalchemy import URL
+from sqlalchemy import URL, make_url
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from backend.app.core.config import settings
+from backend.app.db.pool_metrics import PoolMonitor
 
 
-DATABASE_URL = URL.create(
-    drivername="postgresql+asyncpg",
-    username=settings.DATABASE_USERNAME,
-    password=settings.DATABASE_PASSWORD,
-    host=settings.DATABASE_HOST,
-    database=settings.DATABASE_NAME,
-    port=settings.DATABASE_PORT,
+def _database_url() -> URL:
+    # DATABASE_URL wins when set; the individual DATABASE_* fields are the fallback.
+    if settings.DATABASE_URL:
+        url = make_url(settings.DATABASE_URL)
+        if url.drivername in ("postgres", "postgresql"):
+            url = url.set(drivername="postgresql+asyncpg")
+    else:
+        url = URL.create(
+            drivername="postgresql+asyncpg",
+            username=settings.DATABASE_USERNAME,
+            password=settings.DATABASE_PASSWORD,
+            host=settings.DATABASE_HOST,
+            database=settings.DATABASE_NAME,
+            port=settings.DATABASE_PORT,
+        )
+    # SQLAlchemy's asyncpg adapter keeps its own prepared statement cache.
+    return url.update_query_dict(
+        {"prepared_statement_cache_size": str(settings.DATABASE_STATEMENT_CACHE_SIZE)}
+    )
+
+
+DATABASE_URL = _database_url()
+
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=settings.DATABASE_ECHO,
+    future=True,
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+    connect_args={"statement_cache_size": settings.DATABASE_STATEMENT_CACHE_SIZE},
 )
 
-engine = create_async_engine(DATABASE_URL, echo=True, future=True)
+pool_monitor = PoolMonitor(
+    engine,
+    capacity=settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW,
+    warn_ratio=settings.DATABASE_POOL_SATURATION_WARNING,
+)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -0,0 +1,13 @@
+from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.dependencies.db import get_db
+from backend.app.services.agent_index import agent_index
+
+
+async def get_agent_id(agent_name: str, db: AsyncSession = Depends(get_db)) -> int:
+    """Resolve the ``agent_name`` path parameter, 404 for unknown agents."""
+    agent_id = await agent_index.resolve(db, agent_name)
+    if agent_id is None:
+        raise HTTPException(status_code=404, detail=f"Unknown agent: {agent_name}")
+    return agent_id
@@ -0,0 +1,12 @@
+from .queue import FAILED, FINISHED, QUEUED, RUNNING, SUCCEEDED, JobQueue
+from .worker import WorkerPool
+
+__all__ = [
+    "FAILED",
+    "FINISHED",
+    "QUEUED",
+    "RUNNING",
+    "SUCCEEDED",
+    "JobQueue",
+    "WorkerPool",
+]
@@ -0,0 +1,32 @@
+"""
+Standalone job workers, for running agent jobs outside the API process
+(set JOB_WORKER_CONCURRENCY=0 on the API then).
+
+    python -m backend.app.jobs [--concurrency N]
+"""
+import argparse
+import asyncio
+import logging
+
+from backend.app.core.config import settings
+from backend.app.db.session import engine
+from backend.app.jobs.handlers import run_job
+from backend.app.jobs.worker import WorkerPool
+
+
+async def main(args: argparse.Namespace) -> None:
+    try:
+        concurrency = args.concurrency or max(settings.JOB_WORKER_CONCURRENCY, 1)
+        await WorkerPool(run_job, concurrency=concurrency).run_forever()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="Run agent job workers")
+    parser.add_argument("--concurrency", type=int, help="Default: JOB_WORKER_CONCURRENCY")
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,33 @@
+from typing import Any, Awaitable, Callable, Dict
+
+from fastapi.encoders import jsonable_encoder
+
+from agentic_ai import project_summary_generator, role_summary_generator, sql_query_generator
+
+
+async def _project_summary(params: Dict[str, Any]) -> Any:
+    return await project_summary_generator(
+        params["project_id"], force_refresh=params.get("force_refresh", False)
+    )
+
+
+async def _role_summary(params: Dict[str, Any]) -> Any:
+    return await role_summary_generator(
+        params["role"], force_refresh=params.get("force_refresh", False)
+    )
+
+
+async def _query(params: Dict[str, Any]) -> Any:
+    return await sql_query_generator(user_prompt=params["user_query"])
+
+
+# kind -> coroutine running the flow; results are stored as JSON.
+JOB_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Awaitable[Any]]] = {
+    "project_summary": _project_summary,
+    "role_summary": _role_summary,
+    "query": _query,
+}
+
+
+async def run_job(kind: str, params: Dict[str, Any]) -> Any:
+    return jsonable_encoder(await JOB_HANDLERS[kind](params))
@@ -0,0 +1,165 @@
+import json
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.app.core.config import settings
+from backend.app.db.session import AsyncSessionLocal
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+_JOB_COLUMNS = """
+    job_id, kind, params, status, error, attempts, worker,
+    created_at, started_at, heartbeat_at, finished_at
+"""
+
+# Oldest queued job first; SKIP LOCKED lets any number of workers poll the
+# same table without waiting on each other's claims.
+_CLAIM_SQL = text(
+    """
+    UPDATE jobs
+    SET status = 'running', attempts = attempts + 1, worker = :worker,
+        started_at = now(), heartbeat_at = now()
+    WHERE job_id = (
+        SELECT job_id FROM jobs
+        WHERE status = 'queued'
+        ORDER BY created_at
+        FOR UPDATE SKIP LOCKED
+        LIMIT 1
+    )
+    RETURNING job_id, kind, params
+    """
+)
+# Jobs whose worker stopped heartbeating go back to the queue, or fail once
+# they have used up their attempts.
+_REQUEUE_STALE_SQL = text(
+    """
+    UPDATE jobs
+    SET status = CASE WHEN attempts < :max_attempts THEN 'queued' ELSE 'failed' END,
+        error = CASE WHEN attempts < :max_attempts THEN error
+                     ELSE 'Worker stopped responding' END,
+        finished_at = CASE WHEN attempts < :max_attempts THEN NULL ELSE now() END,
+        worker = NULL
+    WHERE status = 'running'
+      AND heartbeat_at < now() - make_interval(secs => :stale_after)
+    """
+)
+
+
+class JobQueue:
+    """
+    Postgres-backed job queue. Every call uses its own short session, so the
+    queue can be shared by request handlers and long-lived workers.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal):
+        self.session_factory = session_factory
+
+    async def _execute(self, statement, params: Optional[Dict[str, Any]] = None):
+        async with self.session_factory() as session:
+            result = await session.execute(statement, params or {})
+            rows = result.mappings().all() if result.returns_rows else None
+            await session.commit()
+            return rows
+
+    async def submit(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        rows = await self._execute(
+            text(
+                f"""
+                INSERT INTO jobs (job_id, kind, params)
+                VALUES (:job_id, :kind, CAST(:params AS JSONB))
+                RETURNING {_JOB_COLUMNS}
+                """
+            ),
+            {"job_id": uuid.uuid4(), "kind": kind, "params": json.dumps(params)},
+        )
+        return dict(rows[0])
+
+    async def get(self, job_id: uuid.UUID, with_result: bool = False) -> Optional[Dict[str, Any]]:
+        columns = _JOB_COLUMNS + (", result" if with_result else "")
+        rows = await self._execute(
+            text(f"SELECT {columns} FROM jobs WHERE job_id = :job_id"), {"job_id": job_id}
+        )
+        return dict(rows[0]) if rows else None
+
+    async def claim(self, worker: str) -> Optional[Tuple[uuid.UUID, str, Dict[str, Any]]]:
+        rows = await self._execute(_CLAIM_SQL, {"worker": worker})
+        if not rows:
+            return None
+        return rows[0]["job_id"], rows[0]["kind"], rows[0]["params"]
+
+    # The calls below only touch a job its worker still owns: after the reaper
+    # requeues a stalled worker's job, that worker must not heartbeat, finish
+    # or release it under the new owner. They return False when the job is lost.
+
+    async def heartbeat(self, job_id: uuid.UUID, worker: str) -> bool:
+        rows = await self._execute(
+            text(
+                """
+                UPDATE jobs SET heartbeat_at = now()
+                WHERE job_id = :job_id AND worker = :worker AND status = 'running'
+                RETURNING job_id
+                """
+            ),
+            {"job_id": job_id, "worker": worker},
+        )
+        return bool(rows)
+
+    async def complete(self, job_id: uuid.UUID, worker: str, result: Any) -> bool:
+        rows = await self._execute(
+            text(
+                """
+                UPDATE jobs
+                SET status = 'succeeded', result = CAST(:result AS JSONB), finished_at = now()
+                WHERE job_id = :job_id AND worker = :worker AND status = 'running'
+                RETURNING job_id
+                """
+            ),
+            {"job_id": job_id, "worker": worker, "result": json.dumps(result, default=str)},
+        )
+        return bool(rows)
+
+    async def fail(self, job_id: uuid.UUID, worker: str, error: str) -> bool:
+        rows = await self._execute(
+            text(
+                """
+                UPDATE jobs SET status = 'failed', error = :error, finished_at = now()
+                WHERE job_id = :job_id AND worker = :worker AND status = 'running'
+                RETURNING job_id
+                """
+            ),
+            {"job_id": job_id, "worker": worker, "error": error},
+        )
+        return bool(rows)
+
+    async def release(self, job_id: uuid.UUID, worker: str) -> bool:
+        """Put a job back in the queue (its worker is shutting down)."""
+        rows = await self._execute(
+            text(
+                """
+                UPDATE jobs SET status = 'queued', worker = NULL
+                WHERE job_id = :job_id AND worker = :worker AND status = 'running'
+                RETURNING job_id
+                """
+            ),
+            {"job_id": job_id, "worker": worker},
+        )
+        return bool(rows)
+
+    async def requeue_stale(self) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                _REQUEUE_STALE_SQL,
+                {
+                    "max_attempts": settings.JOB_MAX_ATTEMPTS,
+                    "stale_after": settings.JOB_STALE_AFTER,
+                },
+            )
+            await session.commit()
+            return result.rowcount
@@ -0,0 +1,120 @@
+import asyncio
+import contextlib
+import logging
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from backend.app.core.config import settings
+from backend.app.jobs.queue import JobQueue
+
+logger = logging.getLogger(__name__)
+
+Runner = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+class WorkerPool:
+    """
+    ``concurrency`` workers polling the job queue, plus a reaper that requeues
+    jobs whose worker died (no heartbeat for ``JOB_STALE_AFTER`` seconds).
+    Workers in several processes or hosts can share one queue.
+    """
+
+    def __init__(
+        self,
+        runner: Runner,
+        concurrency: Optional[int] = None,
+        queue: Optional[JobQueue] = None,
+    ):
+        self.runner = runner
+        self.concurrency = settings.JOB_WORKER_CONCURRENCY if concurrency is None else concurrency
+        self.queue = queue or JobQueue()
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        if self._tasks or self.concurrency <= 0:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work(f"{self.name}:{i}"), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reap(), name="job-reaper"))
+        logger.info("Started %s job workers", self.concurrency)
+
+    async def stop(self) -> None:
+        """Cancel the workers; jobs they were running go back to the queue."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def run_forever(self) -> None:
+        self.start()
+        try:
+            await asyncio.gather(*self._tasks)
+        finally:
+            await self.stop()
+
+    async def _work(self, worker: str) -> None:
+        while True:
+            try:
+                claimed = await self.queue.claim(worker)
+            except Exception:
+                logger.exception("Could not poll the job queue")
+                claimed = None
+            if claimed is None:
+                await asyncio.sleep(settings.JOB_POLL_INTERVAL)
+                continue
+            try:
+                await self._run(worker, *claimed)
+            except Exception:
+                # Recording the outcome failed; the reaper requeues the job.
+                logger.exception("Could not record the outcome of job %s", claimed[0])
+
+    async def _run(self, worker: str, job_id: uuid.UUID, kind: str, params: Dict[str, Any]) -> None:
+        job = asyncio.create_task(self.runner(kind, params))
+        heartbeat = asyncio.create_task(self._heartbeat(worker, job_id, job))
+        try:
+            result = await job
+        except asyncio.CancelledError:
+            if heartbeat.done() and not heartbeat.cancelled():
+                # The heartbeat found the job taken over by another worker.
+                return
+            await self.queue.release(job_id, worker)
+            raise
+        except Exception as exc:
+            logger.exception("Job %s (%s) failed", job_id, kind)
+            if not await self.queue.fail(job_id, worker, f"{type(exc).__name__}: {exc}"):
+                logger.warning("Job %s was taken over by another worker; dropped its error", job_id)
+        else:
+            if not await self.queue.complete(job_id, worker, result):
+                logger.warning("Job %s was taken over by another worker; dropped its result", job_id)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+
+    async def _heartbeat(self, worker: str, job_id: uuid.UUID, job: asyncio.Task) -> None:
+        while True:
+            await asyncio.sleep(settings.JOB_HEARTBEAT_INTERVAL)
+            try:
+                owned = await self.queue.heartbeat(job_id, worker)
+            except Exception:
+                logger.exception("Heartbeat for job %s failed", job_id)
+                continue
+            if not owned:
+                logger.warning("Job %s was taken over by another worker; cancelling this run", job_id)
+                job.cancel()
+                return
+
+    async def _reap(self) -> None:
+        while True:
+            try:
+                requeued = await self.queue.requeue_stale()
+                if requeued:
+                    logger.warning("Requeued or failed %s stale jobs", requeued)
+            except Exception:
+                logger.exception("Could not requeue stale jobs")
+            await asyncio.sleep(settings.JOB_STALE_AFTER / 2)
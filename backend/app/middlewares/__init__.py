@@ -0,0 +1,8 @@
+from .response_cache import CacheRule, ResponseCacheMiddleware, default_key, path_only_key
+
+__all__ = [
+    "CacheRule",
+    "ResponseCacheMiddleware",
+    "default_key",
+    "path_only_key",
+]
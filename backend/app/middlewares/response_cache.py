@@ -0,0 +1,142 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+from urllib.parse import unquote
+
+from starlette.datastructures import Headers, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.app.cache import CacheBackend
+
+# (path params, query params) -> cache key suffix
+KeyFunc = Callable[[Dict[str, str], QueryParams], str]
+
+
+def default_key(path_params: Dict[str, str], query: QueryParams) -> str:
+    return json.dumps([path_params, sorted(query.multi_items())])
+
+
+def path_only_key(path_params: Dict[str, str], query: QueryParams) -> str:
+    """For endpoints without query parameters: stray ``?...`` must not split the cache."""
+    return json.dumps(path_params)
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Cache successful GET responses for ``path`` (a route template) for ``ttl`` seconds."""
+
+    path: str
+    ttl: float
+    key: KeyFunc = field(default=default_key)
+
+    def pattern(self, prefix: str = "") -> Pattern:
+        regex = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(prefix + self.path))
+        return re.compile(regex)
+
+
+class ResponseCacheMiddleware:
+    """
+    Read-through cache for selected read-only routes.
+
+    Responses are cached with a strong ETag derived from the body; a request
+    whose ``If-None-Match`` matches gets ``304 Not Modified`` without a body.
+    Only ``200`` responses are stored. ``X-Cache`` reports HIT or MISS.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: List[CacheRule],
+        backend: CacheBackend,
+        prefix: str = "",
+    ):
+        self.app = app
+        self.backend = backend
+        self.rules: List[Tuple[Pattern, CacheRule]] = [
+            (rule.pattern(prefix), rule) for rule in rules
+        ]
+
+    def _match(self, path: str) -> Optional[Tuple[CacheRule, Dict[str, str]]]:
+        for pattern, rule in self.rules:
+            m = pattern.fullmatch(path)
+            if m:
+                return rule, {k: unquote(v) for k, v in m.groupdict().items()}
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+        # Match on the raw path so an encoded "/" stays inside its segment.
+        raw_path = scope.get("raw_path") or scope["path"].encode()
+        matched = self._match(raw_path.decode("latin-1"))
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        rule, path_params = matched
+        key = f"{rule.path}:{rule.key(path_params, QueryParams(scope['query_string']))}"
+        if_none_match = Headers(scope=scope).get("if-none-match")
+
+        cached = await self.backend.get(key)
+        if cached is not None:
+            etag, content_type, body = cached.split(b"\n", 2)
+            await self._respond(send, rule, etag, content_type, body, if_none_match, b"HIT")
+            return
+
+        start: Optional[Message] = None
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        body = b"".join(chunks)
+        if start is None or start["status"] != 200:
+            if start is not None:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+            return
+
+        content_type = Headers(raw=start["headers"]).get("content-type", "application/json")
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'.encode()
+        await self.backend.set(
+            key, b"\n".join([etag, content_type.encode(), body]), rule.ttl
+        )
+        await self._respond(send, rule, etag, content_type.encode(), body, if_none_match, b"MISS")
+
+    @staticmethod
+    async def _respond(
+        send: Send,
+        rule: CacheRule,
+        etag: bytes,
+        content_type: bytes,
+        body: bytes,
+        if_none_match: Optional[str],
+        cache_status: bytes,
+    ) -> None:
+        headers = [
+            (b"etag", etag),
+            (b"cache-control", f"max-age={int(rule.ttl)}".encode()),
+            (b"x-cache", cache_status),
+        ]
+        not_modified = if_none_match is not None and etag.decode() in (
+            tag.strip() for tag in if_none_match.split(",")
+        )
+        if not_modified:
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        headers += [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -1,10 +1,12 @@
-from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Text, TIMESTAMP
+from sqlalchemy import Column, Integer, String, Date, Boolean, ForeignKey, Index, Text, TIMESTAMP
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
 from ..db.base import Base
 
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (Index("ix_projects_market", "market"),)
 
     project_id = Column(String(50), primary_key=True)
     market = Column(String(100), nullable=False)
@@ -28,6 +30,12 @@ class Agent(Base):
 
 class Milestone(Base):
     __tablename__ = "milestones"
+    __table_args__ = (
+        Index("ix_milestones_project_id_planned_date", "project_id", "planned_date"),
+        Index("ix_milestones_agent_id_status", "agent_id", "status"),
+        Index("ix_milestones_status", "status"),
+        Index("ix_milestones_updated_at", "updated_at"),
+    )
 
     milestone_id = Column(Integer, primary_key=True)
     project_id = Column(String(50), ForeignKey("projects.project_id", ondelete="CASCADE"))
@@ -38,6 +46,9 @@ class Milestone(Base):
     status = Column(String(30))
     duration_days = Column(Integer)
     anomaly_flag = Column(Boolean, default=False)
+    # Maintained by triggers (migration 0003): bumped when a detection input of
+    # the milestone, its dependencies or its vendor links changes.
+    updated_at = Column(TIMESTAMP)
 
     project = relationship("Project", back_populates="milestones")
     agent = relationship("Agent", back_populates="milestones")
@@ -49,6 +60,10 @@ class Milestone(Base):
 
 class Dependency(Base):
     __tablename__ = "dependencies"
+    __table_args__ = (
+        Index("ix_dependencies_milestone_id", "milestone_id"),
+        Index("ix_dependencies_prerequisite_id", "prerequisite_id"),
+    )
 
     dependency_id = Column(Integer, primary_key=True)
     milestone_id = Column(Integer, ForeignKey("milestones.milestone_id", ondelete="CASCADE"))
@@ -68,6 +83,7 @@ class Vendor(Base):
 
 class MilestoneVendor(Base):
     __tablename__ = "milestone_vendors"
+    __table_args__ = (Index("ix_milestone_vendors_vendor_id", "vendor_id"),)
 
     milestone_id = Column(Integer, ForeignKey("milestones.milestone_id", ondelete="CASCADE"), primary_key=True)
     vendor_id = Column(Integer, ForeignKey("vendors.vendor_id", ondelete="CASCADE"), primary_key=True)
@@ -76,6 +92,10 @@ class MilestoneVendor(Base):
 
 class Anomaly(Base):
     __tablename__ = "anomalies"
+    __table_args__ = (
+        Index("ix_anomalies_milestone_id_detected_on", "milestone_id", "detected_on"),
+        Index("ix_anomalies_detected_on_anomaly_id", "detected_on", "anomaly_id"),
+    )
 
     anomaly_id = Column(Integer, primary_key=True)
     milestone_id = Column(Integer, ForeignKey("milestones.milestone_id", ondelete="CASCADE"))
@@ -83,10 +103,46 @@ class Anomaly(Base):
     description = Column(Text)
     severity = Column(String(20))
     detected_on = Column(TIMESTAMP)
+    # NULL for externally loaded anomalies, "engine" for AnomalyDetectionService rows.
+    source = Column(String(30))
+
+
+class AnomalyDetectionRun(Base):
+    """One completed anomaly detection pass; the latest ``detected_on`` is the next watermark."""
+
+    __tablename__ = "anomaly_detection_runs"
+
+    run_id = Column(Integer, primary_key=True)
+    detected_on = Column(TIMESTAMP, nullable=False)
+    finished_at = Column(TIMESTAMP, nullable=False)
+    full_scan = Column(Boolean, nullable=False)
+    milestones_scanned = Column(Integer, nullable=False)
+    anomalies_inserted = Column(Integer, nullable=False)
+    anomalies_resolved = Column(Integer, nullable=False)
+
+
+class Job(Base):
+    """A queued agent run (project summary, role summary, query); see ``backend.app.jobs``."""
+
+    __tablename__ = "jobs"
+
+    job_id = Column(UUID(as_uuid=True), primary_key=True)
+    kind = Column(String(50), nullable=False)
+    params = Column(JSONB, nullable=False)
+    status = Column(String(20), nullable=False)
+    result = Column(JSONB)
+    error = Column(Text)
+    attempts = Column(Integer, nullable=False)
+    worker = Column(String(100))
+    created_at = Column(TIMESTAMP, nullable=False)
+    started_at = Column(TIMESTAMP)
+    heartbeat_at = Column(TIMESTAMP)
+    finished_at = Column(TIMESTAMP)
 
 
 class CycleTime(Base):
     __tablename__ = "cycle_times"
+    __table_args__ = (Index("ix_cycle_times_project_id", "project_id"),)
 
     cycle_id = Column(Integer, primary_key=True)
     project_id = Column(String(50), ForeignKey("projects.project_id", ondelete="CASCADE"))
@@ -95,3 +151,16 @@ class CycleTime(Base):
     planned_duration = Column(Integer)
     actual_duration = Column(Integer)
     variance = Column(Integer)
+
+
+class VendorDelayRollup(Base):
+    """Delayed milestone-vendor links pre-aggregated per vendor, market and site type."""
+
+    __tablename__ = "vendor_delay_rollup"
+
+    vendor_id = Column(Integer, ForeignKey("vendors.vendor_id", ondelete="CASCADE"), primary_key=True)
+    market = Column(String(100), primary_key=True)
+    # '' stands for a project without site_type (primary key columns cannot be NULL)
+    site_type = Column(String(50), primary_key=True, default="")
+    delayed_milestones = Column(Integer, nullable=False)
+    refreshed_at = Column(TIMESTAMP, nullable=False)
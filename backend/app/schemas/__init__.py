@@ -1,5 +1,15 @@
 from .query import QueryRequest
+from .schedule import (
+    CriticalPathBatchRequest,
+    MilestoneSlip,
+    ProjectSummaryBatchRequest,
+    WhatIfRequest,
+)
 
 __all__ = [
     "QueryRequest",
+    "CriticalPathBatchRequest",
+    "MilestoneSlip",
+    "ProjectSummaryBatchRequest",
+    "WhatIfRequest",
 ]
@@ -0,0 +1,46 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class CriticalPathBatchRequest(BaseModel):
+    project_ids: Optional[List[str]] = Field(
+        default=None, description="Projects to solve; all projects (of market) if omitted."
+    )
+    market: Optional[str] = Field(
+        default=None, description="Restrict the portfolio to one market."
+    )
+    include_milestones: bool = Field(
+        default=False, description="Return per-milestone dates and slack, not just the path."
+    )
+
+
+class ProjectSummaryBatchRequest(BaseModel):
+    project_ids: List[str] = Field(
+        min_length=1, max_length=1000, description="Projects to summarize (up to 1000)."
+    )
+
+
+class MilestoneSlip(BaseModel):
+    milestone_id: Optional[int] = Field(default=None, description="Milestone to slip.")
+    milestone_name: Optional[str] = Field(
+        default=None, description="Slip this milestone in every project in scope, e.g. 'Zoning Approved'."
+    )
+    days: int = Field(gt=0, description="Slip in calendar days.")
+
+    @model_validator(mode="after")
+    def one_target(self):
+        if (self.milestone_id is None) == (self.milestone_name is None):
+            raise ValueError("Give exactly one of milestone_id or milestone_name")
+        return self
+
+
+class WhatIfRequest(BaseModel):
+    slips: List[MilestoneSlip] = Field(min_length=1, description="Proposed slips.")
+    project_ids: Optional[List[str]] = Field(
+        default=None, description="Projects to evaluate; defaults to the slipped milestones' projects."
+    )
+    market: Optional[str] = Field(default=None, description="Evaluate a whole market.")
+    include_milestones: bool = Field(
+        default=True, description="List every affected milestone, not only per-project totals."
+    )
@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+
+# The agents table holds a handful of rows; its version is a digest of all of them.
+_VERSION_SQL = text(
+    """
+    SELECT md5(coalesce(string_agg(agent_id || ':' || agent_name, ',' ORDER BY agent_id), ''))
+    FROM agents
+    """
+)
+_AGENTS_SQL = text("SELECT agent_name, agent_id FROM agents")
+
+
+class AgentIndex:
+    """
+    In-memory ``agent_name -> agent_id`` map, so agent-scoped queries can filter
+    on ``milestones.agent_id`` instead of joining ``agents``.
+
+    Loaded at startup. At most once per ``check_interval`` seconds a lookup
+    compares the table digest with the loaded one and reloads on change.
+    """
+
+    def __init__(self, check_interval: Optional[float] = None):
+        self.check_interval = (
+            settings.AGENT_INDEX_CHECK_INTERVAL if check_interval is None else check_interval
+        )
+        self.version: Optional[str] = None
+        self._ids: Dict[str, int] = {}
+        self._checked_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    async def load(self, db: AsyncSession) -> None:
+        async with self._lock:
+            await self._load(db)
+
+    async def _load(self, db: AsyncSession) -> None:
+        version = (await db.execute(_VERSION_SQL)).scalar_one()
+        if version != self.version:
+            rows = (await db.execute(_AGENTS_SQL)).all()
+            self._ids = {name: agent_id for name, agent_id in rows}
+            self.version = version
+        self._checked_at = time.monotonic()
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Reload if the check interval has passed and the table changed."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return
+        async with self._lock:
+            if time.monotonic() - self._checked_at >= self.check_interval:
+                await self._load(db)
+
+    async def resolve(self, db: AsyncSession, agent_name: str) -> Optional[int]:
+        await self.refresh(db)
+        return self._ids.get(agent_name)
+
+
+agent_index = AgentIndex()
@@ -0,0 +1,84 @@
+from typing import Dict
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.orm import aliased
+
+from backend.app.models.entities import (
+    Project,
+    Milestone,
+    Anomaly,
+    Dependency,
+    Vendor,
+    MilestoneVendor,
+)
+
+
+def agent_summary_statements(agent_id: int) -> Dict[str, Select]:
+    """
+    Build the independent section queries for one agent (top 10 each).
+
+    The agent id is resolved once by the caller, so no section needs to join
+    ``agents`` again.
+    """
+    stmt_status = (
+        select(Milestone.status, func.count(Milestone.milestone_id))
+        .join(Project, Project.project_id == Milestone.project_id)
+        .where(Milestone.agent_id == agent_id)
+        .group_by(Milestone.status)
+        .limit(10)
+    )
+
+    stmt_delays = (
+        select(
+            Project.project_id,
+            Milestone.milestone_name,
+            Milestone.planned_date,
+            Milestone.actual_date,
+        )
+        .join(Project, Project.project_id == Milestone.project_id)
+        .where(Milestone.agent_id == agent_id)
+        .limit(10)
+    )
+
+    stmt_anomalies = (
+        select(Project.project_id, Anomaly.type, Anomaly.severity, Anomaly.description)
+        .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
+        .join(Project, Project.project_id == Milestone.project_id)
+        .where(Milestone.agent_id == agent_id)
+        .limit(10)
+    )
+
+    stmt_impacts = (
+        select(
+            Project.project_id,
+            Vendor.vendor_name,
+            func.count(Milestone.milestone_id)
+            .filter(Milestone.status == "Delayed")
+            .label("delayed_count"),
+            func.count(Milestone.milestone_id).label("total_count"),
+        )
+        .join(Milestone, Project.project_id == Milestone.project_id)
+        .outerjoin(
+            MilestoneVendor, MilestoneVendor.milestone_id == Milestone.milestone_id
+        )
+        .outerjoin(Vendor, Vendor.vendor_id == MilestoneVendor.vendor_id)
+        .where(Milestone.agent_id == agent_id)
+        .group_by(Project.project_id, Vendor.vendor_name)
+        .limit(10)
+    )
+
+    d = aliased(Dependency)
+    stmt_dependencies = (
+        select(d.prerequisite_id, d.milestone_id)
+        .join(Milestone, Milestone.milestone_id == d.milestone_id)
+        .where(Milestone.agent_id == agent_id)
+        .limit(10)
+    )
+
+    return {
+        "status": stmt_status,
+        "delays": stmt_delays,
+        "anomalies": stmt_anomalies,
+        "impacts": stmt_impacts,
+        "dependencies": stmt_dependencies,
+    }
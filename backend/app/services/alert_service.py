@@ -1,12 +1,95 @@
 import pandas as pd
 import numpy as np
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from backend.app.core.config import settings
 from backend.app.services.interface.alert_interface import AlertInterface
 
 
+PROJECTS_ENCODED_SELECT = """
+    SELECT 
+        fuze_project_id,
+        site_name,
+        local_market,
+        county,
+        site_candidate_type,
+        structure_owner,
+        vendor_site_acquisition,
+        vendor_construction_manager_company,
+        transport_vendor,
+        project_status,
+        project_started_milestone_a AS project_start,
+        real_estate_completed_rec_milestone_a AS rec,
+        equip_received_a AS rer,
+        ready_to_construct_rtc_milestone_a AS rtc,
+        physical_construction_completed_a AS pcc,
+        transport_awarded_a,
+        transport_completed_a,
+        building_permit_approved_a,
+        nepa_complete_a
+    FROM public.projects_encoded
+"""
+PROJECTS_ENCODED_SQL = text(PROJECTS_ENCODED_SELECT)
+# Columns the portfolio report can be filtered on (equality).
+REPORT_FILTER_COLUMNS = ("local_market", "project_status", "vendor_site_acquisition")
+REPORT_DATE_COLUMNS = (
+    "project_start",
+    "rec",
+    "rer",
+    "rtc",
+    "pcc",
+    "transport_awarded_a",
+    "transport_completed_a",
+    "building_permit_approved_a",
+    "nepa_complete_a",
+)
+
+PROJECT_FIELDS = (
+    "fuze_project_id",
+    "site_name",
+    "local_market",
+    "county",
+    "site_candidate_type",
+    "structure_owner",
+    "vendor_site_acquisition",
+    "vendor_construction_manager_company",
+    "transport_vendor",
+    "project_status",
+)
+DATE_FIELDS = ("project_start", "rec", "rer", "rtc", "pcc")
+# duration name -> (end column, start column)
+DURATION_PAIRS = {
+    "start_to_rer": ("rer", "project_start"),
+    "rec_to_rer": ("rer", "rec"),
+    "rec_to_rtc": ("rtc", "rec"),
+    "rtc_to_pcc": ("pcc", "rtc"),
+    "transport_awarded_to_completed": ("transport_completed_a", "transport_awarded_a"),
+}
+START_TO_RER_THRESHOLD_DAYS = 365
+REPORT_THRESHOLDS = {"start_to_rer_days": START_TO_RER_THRESHOLD_DAYS}
+RISK_FLAGS = (
+    "Missing Building Permit Approval",
+    "NEPA Compliance Missing",
+    "Duration exceeds threshold for market",
+)
+# percentile -> key in the per-vendor aggregate; 0.5 keeps the original name.
+VENDOR_PERCENTILES = (0.5, 0.25, 0.75, 0.9)
+VENDOR_PERCENTILE_KEYS = (
+    "median_start_to_rer",
+    "p25_start_to_rer",
+    "p75_start_to_rer",
+    "p90_start_to_rer",
+)
+VENDOR_STAT_KEYS = VENDOR_PERCENTILE_KEYS + ("count_start_to_rer", "projects")
+# Bit i of the index set <=> RISK_FLAGS[i] applies; precomputed so rows only index into it.
+_RISK_FLAG_COMBINATIONS = [
+    tuple(flag for bit, flag in enumerate(RISK_FLAGS) if code & (1 << bit))
+    for code in range(1 << len(RISK_FLAGS))
+]
+
+
 class AlertService(AlertInterface):
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -20,154 +103,210 @@ class AlertService(AlertInterface):
             return None
         return int((end - start).days)
 
-    async def fetch_projects(self) -> pd.DataFrame:
-        query = text(
-            """
-            SELECT 
-                fuze_project_id,
-                site_name,
-                local_market,
-                county,
-                site_candidate_type,
-                structure_owner,
-                vendor_site_acquisition,
-                vendor_construction_manager_company,
-                transport_vendor,
-                project_status,
-                project_started_milestone_a AS project_start,
-                real_estate_completed_rec_milestone_a AS rec,
-                equip_received_a AS rer,
-                ready_to_construct_rtc_milestone_a AS rtc,
-                physical_construction_completed_a AS pcc,
-                transport_awarded_a,
-                transport_completed_a,
-                building_permit_approved_a,
-                nepa_complete_a
-            FROM public.projects_encoded
-            """
-        )
-
-        result = await self.db.execute(query)
-        rows = result.fetchall()
-        columns = result.keys()
-
-        df = pd.DataFrame(rows, columns=columns)
+    @staticmethod
+    def prepare_frame(rows: Sequence[Any], columns: Sequence[str]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=list(columns))
 
         # Convert date-like columns into datetime
-        date_cols = [
-            "project_start",
-            "rec",
-            "rer",
-            "rtc",
-            "pcc",
-            "transport_awarded_a",
-            "transport_completed_a",
-            "building_permit_approved_a",
-            "nepa_complete_a",
-        ]
-        for col in date_cols:
+        for col in REPORT_DATE_COLUMNS:
             if col in df.columns:
                 df[col] = pd.to_datetime(df[col], errors="coerce")
 
         # Replace NaN and NaT with None to ensure JSON-compliant values downstream
-        df = df.replace({np.nan: None})
+        return df.replace({np.nan: None})
+
+    async def fetch_projects(self) -> pd.DataFrame:
+        result = await self.db.execute(PROJECTS_ENCODED_SQL)
+        return self.prepare_frame(result.fetchall(), result.keys())
 
-        return df
+    @staticmethod
+    def projects_query(filters: Optional[Mapping[str, Any]] = None) -> TextClause:
+        """``PROJECTS_ENCODED_SQL`` restricted by equality on ``REPORT_FILTER_COLUMNS``."""
+        active = {k: v for k, v in (filters or {}).items() if v is not None}
+        unknown = set(active) - set(REPORT_FILTER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unsupported report filters: {', '.join(sorted(unknown))}")
+        if not active:
+            return PROJECTS_ENCODED_SQL
+        where = " AND ".join(f"{column} = :{column}" for column in active)
+        return text(f"{PROJECTS_ENCODED_SELECT} WHERE {where}").bindparams(**active)
+
+    async def iter_project_frames(
+        self,
+        batch_size: Optional[int] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[pd.DataFrame]:
+        """
+        ``fetch_projects`` in frames of at most ``batch_size`` rows, read through a
+        server-side cursor so only one batch of the table is held at a time.
+        """
+        batch_size = batch_size or settings.ALERT_REPORT_BATCH_SIZE
+        result = await self.db.stream(
+            self.projects_query(filters).execution_options(yield_per=batch_size)
+        )
+        columns = list(result.keys())
+        async for rows in result.partitions(batch_size):
+            yield self.prepare_frame(rows, columns)
+
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str) -> pd.Series:
+        if name in df.columns:
+            return df[name]
+        return pd.Series(None, index=df.index, dtype=object)
+
+    @classmethod
+    def _datetime_column(cls, df: pd.DataFrame, name: str) -> pd.Series:
+        # fetch_projects leaves object columns of Timestamp/None; cache=False skips
+        # the unique-value pass that dominates to_datetime on wide-spread dates.
+        return pd.to_datetime(cls._column(df, name), errors="coerce", cache=False)
+
+    @staticmethod
+    def days_between(end: pd.Series, start: pd.Series) -> pd.Series:
+        """Column-wise ``safe_days``: whole days from start to end, <NA> if either is missing."""
+        return (end - start).dt.days.astype("Int64")
+
+    @staticmethod
+    def format_dates(values: pd.Series) -> np.ndarray:
+        """``YYYY-MM-DD`` strings (None for NaT) as an object array."""
+        if values.dt.tz is not None:
+            values = values.dt.tz_localize(None)  # keep wall-clock dates, like strftime
+        days = values.to_numpy(dtype="datetime64[ns]").astype("datetime64[D]")
+        out = days.astype(str).astype(object)
+        out[np.isnat(days)] = None
+        return out
 
     def build_report(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
-        projects_json: List[Dict[str, Any]] = []
+        if df.empty:
+            return []
+        projects_json, start_to_rer = self.build_records(df)
+        vendors = self._column(df, "vendor_site_acquisition")
+        self.attach_vendor_aggregates(
+            projects_json, vendors, self.vendor_aggregates(vendors, start_to_rer)
+        )
+        return projects_json
+
+    def build_records(self, df: pd.DataFrame) -> Tuple[List[Dict[str, Any]], pd.Series]:
+        """Report records without vendor aggregates, plus the start_to_rer column."""
+        # Whole-column computations; the only per-row work left is assembling the JSON records.
+        needed = set(DATE_FIELDS).union(*DURATION_PAIRS.values())
+        datetimes = {name: self._datetime_column(df, name) for name in needed}
+        durations = {
+            key: self.days_between(datetimes[end], datetimes[start])
+            for key, (end, start) in DURATION_PAIRS.items()
+        }
 
-        for _, row in df.iterrows():
-            durations = {
-                "start_to_rer": self.safe_days(
-                    row.get("rer"), row.get("project_start")
-                ),
-                "rec_to_rer": self.safe_days(row.get("rer"), row.get("rec")),
-                "rec_to_rtc": self.safe_days(row.get("rtc"), row.get("rec")),
-                "rtc_to_pcc": self.safe_days(row.get("pcc"), row.get("rtc")),
-                "transport_awarded_to_completed": self.safe_days(
-                    row.get("transport_completed_a"), row.get("transport_awarded_a")
-                ),
-            }
-
-            risk_flags: List[str] = []
-            if row.get("building_permit_approved_a") is None:
-                risk_flags.append("Missing Building Permit Approval")
-            if row.get("nepa_complete_a") is None:
-                risk_flags.append("NEPA Compliance Missing")
-            if (
-                durations["start_to_rer"] is not None
-                and durations["start_to_rer"] > 365
-            ):
-                risk_flags.append("Duration exceeds threshold for market")
-
-            def fmt_date(val):
-                if isinstance(val, pd.Timestamp) and not pd.isna(val):
-                    return val.strftime("%Y-%m-%d")
-                return None
-
-            project_data: Dict[str, Any] = {
-                "fuze_project_id": row.get("fuze_project_id"),
-                "site_name": row.get("site_name"),
-                "local_market": row.get("local_market"),
-                "county": row.get("county"),
-                "site_candidate_type": row.get("site_candidate_type"),
-                "structure_owner": row.get("structure_owner"),
-                "vendor_site_acquisition": row.get("vendor_site_acquisition"),
-                "vendor_construction_manager_company": row.get(
-                    "vendor_construction_manager_company"
-                ),
-                "transport_vendor": row.get("transport_vendor"),
-                "project_status": row.get("project_status"),
-                "dates": {
-                    "project_start": fmt_date(row.get("project_start")),
-                    "rec": fmt_date(row.get("rec")),
-                    "rer": fmt_date(row.get("rer")),
-                    "rtc": fmt_date(row.get("rtc")),
-                    "pcc": fmt_date(row.get("pcc")),
-                },
-                "durations": durations,
-                "risk_flags": risk_flags,
-                "aggregates": {},
-            }
+        flag_codes = (
+            self._column(df, "building_permit_approved_a").isna().to_numpy(dtype=int)
+            + self._column(df, "nepa_complete_a").isna().to_numpy(dtype=int) * 2
+            + (durations["start_to_rer"] > START_TO_RER_THRESHOLD_DAYS).fillna(False).to_numpy(dtype=int) * 4
+        )
+
+        dates = [self.format_dates(datetimes[name]) for name in DATE_FIELDS]
+        duration_values = [
+            series.to_numpy(dtype=object, na_value=None) for series in durations.values()
+        ]
+        fields = [self._column(df, name).to_numpy(dtype=object) for name in PROJECT_FIELDS]
 
+        projects_json: List[Dict[str, Any]] = []
+        for row, row_dates, row_durations, code in zip(
+            zip(*fields), zip(*dates), zip(*duration_values), flag_codes
+        ):
+            project_data: Dict[str, Any] = dict(zip(PROJECT_FIELDS, row))
+            project_data["dates"] = dict(zip(DATE_FIELDS, row_dates))
+            project_data["durations"] = dict(zip(DURATION_PAIRS, row_durations))
+            project_data["risk_flags"] = list(_RISK_FLAG_COMBINATIONS[code])
+            project_data["aggregates"] = {}
             projects_json.append(project_data)
 
-        # Vendor-level aggregate: median of start_to_rer, cast to int or None
-        def median_safe(series: pd.Series) -> Optional[int]:
-            med = series.median()
-            if pd.isna(med):
-                return None
-            try:
-                return int(med)
-            except Exception:
-                return None
-
-        # Recompute per group using safe_days to ensure JSON-safe values
-        vendor_agg = (
-            df.groupby("vendor_site_acquisition", dropna=False)
-            .apply(
-                lambda g: {
-                    "median_start_to_rer": median_safe(
-                        g.apply(
-                            lambda x: self.safe_days(
-                                x.get("rer"), x.get("project_start")
-                            ),
-                            axis=1,
-                        )
-                    )
-                }
-            )
-            .to_dict()
-        )
+        return projects_json, durations["start_to_rer"]
 
-        for p in projects_json:
-            vendor = p.get("vendor_site_acquisition")
-            if vendor in vendor_agg:
-                p["aggregates"]["vendor"] = vendor_agg[vendor]
+    @staticmethod
+    def attach_vendor_aggregates(
+        projects: List[Dict[str, Any]],
+        vendors: pd.Series,
+        vendor_stats: Dict[Any, Dict[str, Optional[int]]],
+    ) -> None:
+        """Set ``aggregates.vendor`` on each project; ``vendors`` is aligned with ``projects``."""
+        for project, vendor_agg in zip(
+            projects, vendors.map(vendor_stats).to_numpy(dtype=object, na_value=None)
+        ):
+            project["aggregates"] = {"vendor": vendor_agg} if vendor_agg else {}
 
-        return projects_json
+    @staticmethod
+    def vendor_aggregates(
+        vendors: pd.Series, start_to_rer: pd.Series
+    ) -> Dict[Any, Dict[str, Optional[int]]]:
+        """
+        start_to_rer statistics per vendor from a single groupby: ``projects`` per
+        vendor, ``count_start_to_rer`` with both dates present and the
+        median/p25/p75/p90 of those durations (linear interpolation like
+        ``percentile_cont``, truncated to whole days, None when there are none).
+        """
+        grouped = start_to_rer.astype("float64").groupby(vendors, dropna=True)
+        if grouped.ngroups == 0:
+            return {}
+        stats = grouped.quantile(VENDOR_PERCENTILES).unstack()
+        stats.columns = list(VENDOR_PERCENTILE_KEYS)
+        stats = stats.apply(np.trunc).astype("Int64")
+        stats.insert(0, "count_start_to_rer", grouped.count())
+        stats.insert(0, "projects", grouped.size())
+        records = stats[list(VENDOR_STAT_KEYS)].astype(object).where(stats.notna(), None)
+        return records.to_dict(orient="index")
+
+    async def iter_report_batches(
+        self,
+        vendor_durations: Optional["VendorDurations"] = None,
+        batch_size: Optional[int] = None,
+        filters: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Report records one batch at a time. Vendor statistics need every row, so
+        batches carry empty ``aggregates``; pass ``vendor_durations`` to collect
+        what is needed to compute them once the stream is exhausted.
+        """
+        async for df in self.iter_project_frames(batch_size, filters):
+            if df.empty:
+                continue
+            projects, start_to_rer = self.build_records(df)
+            if vendor_durations is not None:
+                vendor_durations.add(
+                    self._column(df, "vendor_site_acquisition"), start_to_rer
+                )
+            yield projects
 
     async def get_full_report(self) -> List[Dict[str, Any]]:
-        df = await self.fetch_projects()
-        return self.build_report(df)
+        vendor_durations = VendorDurations()
+        projects_json: List[Dict[str, Any]] = []
+        async for batch in self.iter_report_batches(vendor_durations):
+            projects_json.extend(batch)
+        self.attach_vendor_aggregates(
+            projects_json, vendor_durations.vendors(), vendor_durations.aggregates()
+        )
+        return projects_json
+
+
+class VendorDurations:
+    """
+    Vendor and start_to_rer of every streamed project: two narrow columns instead
+    of the wide rows, enough for exact report-wide percentiles.
+    """
+
+    def __init__(self):
+        self._vendors: List[pd.Series] = []
+        self._start_to_rer: List[pd.Series] = []
+
+    def add(self, vendors: pd.Series, start_to_rer: pd.Series) -> None:
+        self._vendors.append(vendors.astype(object).reset_index(drop=True))
+        self._start_to_rer.append(start_to_rer.astype("Int32").reset_index(drop=True))
+
+    def vendors(self) -> pd.Series:
+        if not self._vendors:
+            return pd.Series([], dtype=object)
+        return pd.concat(self._vendors, ignore_index=True)
+
+    def aggregates(self) -> Dict[Any, Dict[str, Optional[int]]]:
+        if not self._vendors:
+            return {}
+        return AlertService.vendor_aggregates(
+            self.vendors(), pd.concat(self._start_to_rer, ignore_index=True)
+        )
@@ -0,0 +1,343 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import pandas as pd
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.core.config import settings
+from backend.app.models.entities import (
+    Anomaly,
+    AnomalyDetectionRun,
+    Dependency,
+    Milestone,
+    MilestoneVendor,
+    Vendor,
+)
+
+DETECTION_SOURCE = "engine"
+# Arbitrary constant: only one detection pass at a time.
+_ADVISORY_LOCK_ID = 7_304_212
+# Rescan a little before the previous pass started: rows committed by
+# transactions that were still open at that point carry older timestamps.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# (minimum duration_days, severity), checked in order
+LONG_DURATION_THRESHOLDS = ((500, "High"), (365, "Medium"), (180, "Low"))
+# Delayed milestones that slipped more than this many days past plan are High.
+VENDOR_DELAY_HIGH_DAYS = 30
+
+FINDING_COLUMNS = ["milestone_id", "type", "severity", "description"]
+
+
+def _findings(frame: pd.DataFrame, type_: str, severity, description) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "milestone_id": frame["milestone_id"].to_numpy(),
+            "type": type_,
+            "severity": severity,
+            "description": description,
+        },
+        columns=FINDING_COLUMNS,
+    )
+
+
+def _fmt(dates: pd.Series) -> pd.Series:
+    return dates.dt.strftime("%Y-%m-%d")
+
+
+def missing_dates(milestones: pd.DataFrame) -> pd.DataFrame:
+    no_plan = milestones[milestones["planned_date"].isna()]
+    completed_no_actual = milestones[
+        (milestones["status"] == "Completed") & milestones["actual_date"].isna()
+    ]
+    return pd.concat(
+        [
+            _findings(
+                no_plan, "Missing Date", "High", no_plan["milestone_name"] + " has no planned date"
+            ),
+            _findings(
+                completed_no_actual,
+                "Missing Date",
+                "Medium",
+                completed_no_actual["milestone_name"]
+                + " is marked Completed but has no actual date",
+            ),
+        ],
+        ignore_index=True,
+    )
+
+
+def long_durations(milestones: pd.DataFrame) -> pd.DataFrame:
+    duration = milestones["duration_days"].astype("float64")
+    out = []
+    upper = float("inf")
+    for threshold, severity in LONG_DURATION_THRESHOLDS:
+        hit = milestones[(duration >= threshold) & (duration < upper)]
+        out.append(
+            _findings(
+                hit,
+                "Long Duration",
+                severity,
+                hit["milestone_name"]
+                + " took "
+                + hit["duration_days"].astype("Int64").astype(str)
+                + f" days (threshold {threshold})",
+            )
+        )
+        upper = threshold
+    return pd.concat(out, ignore_index=True)
+
+
+def out_of_order_dependencies(
+    milestones: pd.DataFrame, prerequisites: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    A milestone dated before one of its prerequisites. Actual dates are used
+    where present, planned otherwise; severity rises with the number of
+    actual (not just planned) dates involved.
+    """
+    pairs = milestones.merge(prerequisites, on="milestone_id", suffixes=("", "_pre"))
+    own = pairs["actual_date"].fillna(pairs["planned_date"])
+    pre = pairs["actual_date_pre"].fillna(pairs["planned_date_pre"])
+    bad = own.notna() & pre.notna() & (pre > own)
+    pairs, own, pre = pairs[bad], own[bad], pre[bad]
+    actuals = pairs["actual_date"].notna().astype(int) + pairs["actual_date_pre"].notna().astype(int)
+    severity = actuals.map({0: "Low", 1: "Medium", 2: "High"})
+    return _findings(
+        pairs,
+        "Out-of-Order Dependency",
+        severity.to_numpy(),
+        pairs["milestone_name"]
+        + " ("
+        + _fmt(own)
+        + ") is dated before its prerequisite "
+        + pairs["milestone_name_pre"]
+        + " ("
+        + _fmt(pre)
+        + ")",
+    )
+
+
+def vendor_delays(milestones: pd.DataFrame, vendor_links: pd.DataFrame) -> pd.DataFrame:
+    delayed = milestones[milestones["status"] == "Delayed"]
+    if delayed.empty or vendor_links.empty:
+        return pd.DataFrame(columns=FINDING_COLUMNS)
+    vendors = (
+        vendor_links.sort_values("vendor_name")
+        .groupby("milestone_id")["vendor_name"]
+        .agg(", ".join)
+    )
+    delayed = delayed.join(vendors, on="milestone_id", how="inner")
+    slip = (delayed["actual_date"] - delayed["planned_date"]).dt.days
+    severity = (slip > VENDOR_DELAY_HIGH_DAYS).map({True: "High", False: "Medium"})
+    return _findings(
+        delayed,
+        "Vendor Delay",
+        severity.to_numpy(),
+        delayed["milestone_name"] + " delayed with vendor(s): " + delayed["vendor_name"],
+    )
+
+
+def detect(
+    milestones: pd.DataFrame, prerequisites: pd.DataFrame, vendor_links: pd.DataFrame
+) -> pd.DataFrame:
+    """Every rule over one batch; one row per finding in ``FINDING_COLUMNS``."""
+    findings = pd.concat(
+        [
+            missing_dates(milestones),
+            long_durations(milestones),
+            out_of_order_dependencies(milestones, prerequisites),
+            vendor_delays(milestones, vendor_links),
+        ],
+        ignore_index=True,
+    )
+    findings = findings.astype({"milestone_id": "int64"})
+    return findings.drop_duplicates(FINDING_COLUMNS, ignore_index=True)
+
+
+class DetectionInProgress(RuntimeError):
+    pass
+
+
+class AnomalyDetectionService:
+    """
+    Rule-based anomaly detection over milestones, their dependencies and vendor
+    links. Findings are written to ``anomalies`` with ``source = 'engine'``;
+    a finding that still holds keeps its original row (and ``detected_on``),
+    one that no longer holds is removed. Externally loaded anomalies are never
+    touched.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def last_watermark(self) -> Optional[datetime]:
+        result = await self.db.execute(select(func.max(AnomalyDetectionRun.detected_on)))
+        return result.scalar_one_or_none()
+
+    async def changed_milestone_ids(self, since: Optional[datetime]) -> List[int]:
+        """Milestones changed after ``since`` plus their dependents (all milestones if None)."""
+        if since is None:
+            stmt = select(Milestone.milestone_id)
+        else:
+            prerequisite = Milestone.__table__.alias("prerequisite")
+            stmt = select(Milestone.milestone_id).where(Milestone.updated_at > since).union(
+                select(Dependency.milestone_id)
+                .join(prerequisite, prerequisite.c.milestone_id == Dependency.prerequisite_id)
+                .where(prerequisite.c.updated_at > since)
+            )
+        result = await self.db.execute(stmt)
+        return sorted(mid for mid in result.scalars().all() if mid is not None)
+
+    async def _frame(self, stmt, date_columns: Sequence[str] = ()) -> pd.DataFrame:
+        result = await self.db.execute(stmt)
+        df = pd.DataFrame(result.all(), columns=list(result.keys()))
+        for col in date_columns:
+            df[col] = pd.to_datetime(df[col])
+        return df
+
+    async def load_batch(self, milestone_ids: Sequence[int]) -> Dict[str, pd.DataFrame]:
+        ids = list(milestone_ids)
+        m = Milestone
+        prerequisite = Milestone.__table__.alias("prerequisite")
+        return {
+            "milestones": await self._frame(
+                select(
+                    m.milestone_id,
+                    m.milestone_name,
+                    m.planned_date,
+                    m.actual_date,
+                    m.status,
+                    m.duration_days,
+                ).where(m.milestone_id.in_(ids)),
+                ("planned_date", "actual_date"),
+            ),
+            "prerequisites": await self._frame(
+                select(
+                    Dependency.milestone_id,
+                    prerequisite.c.milestone_name,
+                    prerequisite.c.planned_date,
+                    prerequisite.c.actual_date,
+                )
+                .join(prerequisite, prerequisite.c.milestone_id == Dependency.prerequisite_id)
+                .where(Dependency.milestone_id.in_(ids)),
+                ("planned_date", "actual_date"),
+            ),
+            "vendor_links": await self._frame(
+                select(MilestoneVendor.milestone_id, Vendor.vendor_name)
+                .join(Vendor, Vendor.vendor_id == MilestoneVendor.vendor_id)
+                .where(MilestoneVendor.milestone_id.in_(ids))
+            ),
+            "existing": await self._frame(
+                select(
+                    Anomaly.anomaly_id,
+                    Anomaly.milestone_id,
+                    Anomaly.type,
+                    Anomaly.severity,
+                    Anomaly.description,
+                ).where(
+                    Anomaly.source == DETECTION_SOURCE, Anomaly.milestone_id.in_(ids)
+                )
+            ),
+        }
+
+    async def _apply(
+        self,
+        milestone_ids: Sequence[int],
+        findings: pd.DataFrame,
+        existing: pd.DataFrame,
+        detected_on: datetime,
+    ) -> Dict[str, int]:
+        existing = existing.astype({"milestone_id": "int64"})
+        merged = existing.merge(findings, on=FINDING_COLUMNS, how="outer", indicator=True)
+        resolved = merged.loc[merged["_merge"] == "left_only", "anomaly_id"]
+        new = merged.loc[merged["_merge"] == "right_only", FINDING_COLUMNS]
+
+        if not resolved.empty:
+            await self.db.execute(
+                delete(Anomaly).where(Anomaly.anomaly_id.in_(resolved.astype(int).tolist()))
+            )
+        if not new.empty:
+            rows = new.astype(object).to_dict(orient="records")
+            for row in rows:
+                row["milestone_id"] = int(row["milestone_id"])
+                row["detected_on"] = detected_on
+                row["source"] = DETECTION_SOURCE
+            await self.db.execute(insert(Anomaly), rows)
+
+        # anomaly_flag mirrors "has any anomaly", whatever its source.
+        has_anomaly = (
+            select(Anomaly.anomaly_id)
+            .where(Anomaly.milestone_id == Milestone.milestone_id)
+            .exists()
+        )
+        await self.db.execute(
+            update(Milestone)
+            .where(
+                Milestone.milestone_id.in_(list(milestone_ids)),
+                Milestone.anomaly_flag.is_distinct_from(has_anomaly),
+            )
+            .values(anomaly_flag=has_anomaly)
+            .execution_options(synchronize_session=False)
+        )
+        return {"inserted": len(new), "resolved": len(resolved)}
+
+    async def run(
+        self, full: bool = False, batch_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Detect anomalies for milestones changed since the last completed run
+        (every milestone when ``full`` or on the first run), committing batch
+        by batch. Raises ``DetectionInProgress`` if another run holds the lock.
+        """
+        batch_size = batch_size or settings.ANOMALY_DETECTION_BATCH_SIZE
+        # The session hands its connection back on every commit, so the lock
+        # lives on a connection of its own for the whole run.
+        async with self.db.bind.connect() as lock_conn:
+            lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+            locked = (
+                await lock_conn.execute(
+                    text(f"SELECT pg_try_advisory_lock({_ADVISORY_LOCK_ID})")
+                )
+            ).scalar_one()
+            if not locked:
+                raise DetectionInProgress("Another anomaly detection run is in progress")
+            try:
+                return await self._run(full, batch_size)
+            finally:
+                await lock_conn.execute(
+                    text(f"SELECT pg_advisory_unlock({_ADVISORY_LOCK_ID})")
+                )
+
+    async def _run(self, full: bool, batch_size: int) -> Dict[str, Any]:
+        detected_on = (await self.db.execute(select(func.localtimestamp()))).scalar_one()
+        watermark = None if full else await self.last_watermark()
+        since = watermark - WATERMARK_OVERLAP if watermark else None
+        milestone_ids = await self.changed_milestone_ids(since)
+        await self.db.commit()
+
+        totals = {"inserted": 0, "resolved": 0}
+        for start in range(0, len(milestone_ids), batch_size):
+            batch = milestone_ids[start : start + batch_size]
+            frames = await self.load_batch(batch)
+            findings = detect(
+                frames["milestones"], frames["prerequisites"], frames["vendor_links"]
+            )
+            counts = await self._apply(batch, findings, frames["existing"], detected_on)
+            await self.db.commit()
+            for key, value in counts.items():
+                totals[key] += value
+
+        summary = {
+            "detected_on": detected_on,
+            "full_scan": since is None,
+            "milestones_scanned": len(milestone_ids),
+            "anomalies_inserted": totals["inserted"],
+            "anomalies_resolved": totals["resolved"],
+        }
+        await self.db.execute(
+            insert(AnomalyDetectionRun).values(finished_at=func.localtimestamp(), **summary)
+        )
+        await self.db.commit()
+        return {**summary, "watermark": since}
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.entities import Project
+from backend.app.services.schedule_graph import (
+    critical_path,
+    load_schedule_graph,
+    summarize_projects,
+    topological_levels,
+)
+
+
+class CriticalPathService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def resolve_project_ids(
+        self, project_ids: Optional[Sequence[str]] = None, market: Optional[str] = None
+    ) -> List[str]:
+        """Explicit ids win; otherwise every project (of ``market`` if given)."""
+        if project_ids:
+            return list(dict.fromkeys(project_ids))
+        stmt = select(Project.project_id).order_by(Project.project_id)
+        if market:
+            stmt = stmt.where(Project.market == market)
+        return list((await self.db.execute(stmt)).scalars().all())
+
+    async def compute(
+        self, project_ids: Sequence[str], include_milestones: bool = True
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        CPM schedule per project id (projects without milestones are absent).
+        All projects are solved together in one set of array passes.
+        """
+        if not project_ids:
+            return {}
+        graph = await load_schedule_graph(self.db, project_ids)
+        levels = topological_levels(graph)
+        result = critical_path(graph, levels)
+        return summarize_projects(graph, levels, result, include_milestones)
+
+    async def project(self, project_id: str) -> Optional[Dict[str, Any]]:
+        return (await self.compute([project_id])).get(project_id)
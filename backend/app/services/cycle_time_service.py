@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# Per (agent_start_id, agent_end_id) and per market; the grouping set without
+# market yields the all-markets row (market = ALL_MARKETS, so the rollup's
+# unique key covers it). Only cycles with an actual duration are counted.
+# cycle_time_rollup (migrations 0001, 0005) materializes the same query.
+ALL_MARKETS = "*"
+CYCLE_TIME_AGGREGATE_SQL = """
+    SELECT
+        c.agent_start_id,
+        c.agent_end_id,
+        COALESCE(p.market, '*') AS market,
+        count(*) AS cycles,
+        avg(c.actual_duration)::float AS avg_actual_days,
+        percentile_cont(0.5) WITHIN GROUP (ORDER BY c.actual_duration) AS p50_actual_days,
+        percentile_cont(0.9) WITHIN GROUP (ORDER BY c.actual_duration) AS p90_actual_days,
+        avg(c.planned_duration)::float AS avg_planned_days,
+        avg(c.variance)::float AS avg_variance_days
+    FROM cycle_times c
+    JOIN projects p ON p.project_id = c.project_id
+    WHERE c.actual_duration IS NOT NULL
+    GROUP BY GROUPING SETS (
+        (c.agent_start_id, c.agent_end_id, p.market),
+        (c.agent_start_id, c.agent_end_id)
+    )
+"""
+
+_SUMMARY_SQL = """
+    SELECT r.*, s.agent_name AS agent_start_name, e.agent_name AS agent_end_name
+    FROM ({source}) r
+    LEFT JOIN agents s ON s.agent_id = r.agent_start_id
+    LEFT JOIN agents e ON e.agent_id = r.agent_end_id
+    ORDER BY r.agent_start_id, r.agent_end_id, r.market = '*' DESC, r.market
+"""
+
+_STAT_KEYS = (
+    "avg_actual_days",
+    "p50_actual_days",
+    "p90_actual_days",
+    "avg_planned_days",
+    "avg_variance_days",
+)
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    return round(value, 2) if value is not None else None
+
+
+class CycleTimeService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def summary(self, use_rollup: bool = False) -> List[Dict[str, Any]]:
+        source = "SELECT * FROM cycle_time_rollup" if use_rollup else CYCLE_TIME_AGGREGATE_SQL
+        result = await self.db.execute(text(_SUMMARY_SQL.format(source=source)))
+
+        out: Dict[tuple, Dict[str, Any]] = {}
+        for row in result.mappings():
+            key = (row["agent_start_id"], row["agent_end_id"])
+            entry = out.get(key)
+            if entry is None:
+                entry = out[key] = {
+                    "agent_start_id": row["agent_start_id"],
+                    "agent_end_id": row["agent_end_id"],
+                    "label": f"{row['agent_start_name']} → {row['agent_end_name']}",
+                    **dict.fromkeys(("count",) + _STAT_KEYS),
+                    "by_market": {},
+                    "by_market_avg": {},
+                }
+            stats = {"count": row["cycles"], **{k: _round(row[k]) for k in _STAT_KEYS}}
+            if row["market"] == ALL_MARKETS:
+                entry.update(stats)
+            else:
+                entry["by_market"][row["market"]] = stats
+                entry["by_market_avg"][row["market"]] = stats["avg_actual_days"]
+        return list(out.values())
+
+    async def refresh_rollup(self) -> None:
+        """Rebuild cycle_time_rollup without blocking readers."""
+        await self.db.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY cycle_time_rollup")
+        )
+        await self.db.commit()
@@ -0,0 +1,125 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.entities import Milestone, Project
+from backend.app.services.schedule_graph import (
+    day_numbers_to_dates,
+    load_schedule_graph,
+    project_nodes,
+    propagate_delays,
+    topological_levels,
+)
+
+
+class DelayPropagationService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def scope(
+        self,
+        slips: Sequence[Dict[str, Any]],
+        project_ids: Optional[Sequence[str]] = None,
+        market: Optional[str] = None,
+    ) -> List[str]:
+        """
+        Projects the what-if runs over: the explicit ids or market, otherwise
+        the projects owning the slipped milestones (named slips without a scope
+        apply to the whole portfolio).
+        """
+        if project_ids:
+            return list(dict.fromkeys(project_ids))
+        stmt = select(Project.project_id).order_by(Project.project_id)
+        if market:
+            return list((await self.db.execute(stmt.where(Project.market == market))).scalars())
+        if any(s.get("milestone_name") for s in slips):
+            return list((await self.db.execute(stmt)).scalars())
+        ids = [s["milestone_id"] for s in slips if s.get("milestone_id") is not None]
+        owners = select(Milestone.project_id).where(Milestone.milestone_id.in_(ids)).distinct()
+        return sorted((await self.db.execute(owners)).scalars())
+
+    async def what_if(
+        self,
+        slips: Sequence[Dict[str, Any]],
+        project_ids: Optional[Sequence[str]] = None,
+        market: Optional[str] = None,
+        include_milestones: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Apply each slip (``{"milestone_id" | "milestone_name", "days"}``; a name
+        matches that milestone in every project in scope) and return the new
+        forecast of every milestone and project that moves.
+        """
+        graph = await load_schedule_graph(
+            self.db, await self.scope(slips, project_ids, market)
+        )
+        slip_days = np.zeros(graph.size)
+        matched = []
+        for slip in slips:
+            if slip.get("milestone_id") is not None:
+                nodes = graph.node_index([slip["milestone_id"]])
+                nodes = nodes[nodes >= 0]
+            else:
+                nodes = np.flatnonzero(graph.names == slip["milestone_name"])
+            np.maximum.at(slip_days, nodes, slip["days"])
+            matched.append(nodes)
+
+        levels = topological_levels(graph)
+        result = propagate_delays(graph, slip_days, levels)
+        baseline = day_numbers_to_dates(result.baseline)
+        forecast = day_numbers_to_dates(result.forecast)
+
+        projects = []
+        affected_milestones: List[Dict[str, Any]] = []
+        for p, nodes in enumerate(project_nodes(graph)):
+            moved = nodes[result.delay[nodes] > 0]
+            if not moved.size:
+                continue
+            base_finish = np.nanmax(result.baseline[nodes])
+            new_finish = np.nanmax(result.forecast[nodes])
+            projects.append(
+                {
+                    "project_id": graph.project_ids[p],
+                    "baseline_finish": day_numbers_to_dates(np.array([base_finish]))[0],
+                    "forecast_finish": day_numbers_to_dates(np.array([new_finish]))[0],
+                    "delay_days": int(new_finish - base_finish),
+                    "affected_milestones": int(moved.size),
+                }
+            )
+            if include_milestones:
+                moved = moved[np.argsort(result.forecast[moved], kind="stable")]
+                affected_milestones.extend(
+                    {
+                        "milestone_id": int(graph.milestone_ids[i]),
+                        "project_id": graph.project_ids[p],
+                        "name": graph.names[i],
+                        "baseline_date": baseline[i],
+                        "forecast_date": forecast[i],
+                        "delay_days": int(result.delay[i]),
+                        "slipped": bool(result.slip_applied[i]),
+                    }
+                    for i in moved
+                )
+
+        response: Dict[str, Any] = {
+            "slips": [
+                {
+                    **slip,
+                    "matched_milestones": int(nodes.size),
+                    "applied_milestones": int(result.slip_applied[nodes].sum()),
+                }
+                for slip, nodes in zip(slips, matched)
+            ],
+            "summary": {
+                "projects_in_scope": len(graph.project_ids),
+                "affected_projects": len(projects),
+                "affected_milestones": int((result.delay > 0).sum()),
+                "delayed_finishes": sum(1 for p in projects if p["delay_days"] > 0),
+            },
+            "projects": projects,
+        }
+        if include_milestones:
+            response["milestones"] = affected_milestones
+        return response
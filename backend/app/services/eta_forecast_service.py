@@ -0,0 +1,245 @@
+import hashlib
+import json
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.cache import CacheBackend, build_cache_backend
+from backend.app.core.config import settings
+from backend.app.services.schedule_graph import (
+    ScheduleGraph,
+    TopologicalLevels,
+    load_schedule_graph,
+    topological_levels,
+)
+
+PERCENTILES = (50, 80, 95)
+# Most recent completions kept per pool; older history adds little and costs memory.
+MAX_POOL_SIZE = 500
+
+# Everything the forecast reads: milestones, the project's dates and its
+# dependency edges (which carry no updated_at, so the edge list is hashed).
+_VERSION_SQL = text(
+    """
+    SELECT ms.count, ms.updated_at, dep.count, dep.edges, p.start_date, p.end_date_planned
+    FROM projects p
+    CROSS JOIN LATERAL (
+        SELECT count(*) AS count, max(m.updated_at) AS updated_at
+        FROM milestones m
+        WHERE m.project_id = p.project_id
+    ) ms
+    CROSS JOIN LATERAL (
+        SELECT
+            count(*) AS count,
+            md5(string_agg(d.prerequisite_id || '>' || d.milestone_id, ','
+                           ORDER BY d.milestone_id, d.prerequisite_id)) AS edges
+        FROM dependencies d
+        JOIN milestones m ON m.milestone_id = d.milestone_id
+        WHERE m.project_id = p.project_id
+    ) dep
+    WHERE p.project_id = :project_id
+    """
+)
+# Completed durations pooled three ways: (agent, milestone, market), then
+# (agent, milestone) across markets, then the milestone alone.
+_HISTORY_SQL = text(
+    """
+    SELECT
+        GROUPING(m.agent_id, p.market) AS pooled,
+        m.agent_id,
+        m.milestone_name,
+        p.market,
+        (array_agg(m.duration_days ORDER BY m.milestone_id DESC))[1:%d] AS durations
+    FROM milestones m
+    JOIN projects p ON p.project_id = m.project_id
+    WHERE m.actual_date IS NOT NULL
+      AND m.duration_days >= 0
+      AND m.milestone_name = ANY(:names)
+    GROUP BY GROUPING SETS (
+        (m.agent_id, m.milestone_name, p.market),
+        (m.agent_id, m.milestone_name),
+        (m.milestone_name)
+    )
+    """
+    % MAX_POOL_SIZE
+)
+# GROUPING(agent_id, market) bit pattern -> pool level
+_POOL_LEVELS = {0: "agent_milestone_market", 1: "agent_milestone", 3: "milestone"}
+
+_cache: CacheBackend = build_cache_backend(settings.RESPONSE_CACHE_URL, max_entries=2048)
+
+
+class EtaForecastService:
+    """
+    Monte Carlo completion forecast: every unfinished milestone's duration is
+    drawn from completed milestones of the same agent, name and market, and
+    the draws are pushed through the dependency graph for thousands of
+    scenarios at once.
+    """
+
+    def __init__(self, db: AsyncSession, cache: Optional[CacheBackend] = None):
+        self.db = db
+        self.cache = cache or _cache
+
+    async def data_version(self, project_id: str) -> Optional[Tuple[str, Optional[date]]]:
+        """Fingerprint of the project's milestones (None if the project does not exist)."""
+        row = (await self.db.execute(_VERSION_SQL, {"project_id": project_id})).first()
+        if row is None:
+            return None
+        *fingerprint, end_date_planned = row
+        version = hashlib.sha1(
+            ":".join(map(str, [*fingerprint, end_date_planned])).encode()
+        ).hexdigest()[:12]
+        return version, end_date_planned
+
+    async def _pools(self, graph: ScheduleGraph) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict[str, int]]:
+        """Per node: offset and size of its duration pool in one flat array."""
+        names = sorted({n for n in graph.names if n is not None})
+        rows = (await self.db.execute(_HISTORY_SQL, {"names": names})).all()
+        pools: Dict[Tuple[str, Any, Any, Any], List[int]] = {
+            (_POOL_LEVELS[pooled], agent_id, name, market): durations
+            for pooled, agent_id, name, market, durations in rows
+            if pooled in _POOL_LEVELS
+        }
+
+        values: List[int] = []
+        offsets = np.zeros(graph.size, dtype=np.int64)
+        sizes = np.zeros(graph.size, dtype=np.int64)
+        coverage = dict.fromkeys([*_POOL_LEVELS.values(), "planned_duration"], 0)
+        placed: Dict[Any, Tuple[int, int]] = {}
+        for i in range(graph.size):
+            agent_id = None if graph.agent_ids[i] < 0 else int(graph.agent_ids[i])
+            candidates = (
+                ("agent_milestone_market", agent_id, graph.names[i], graph.markets[i]),
+                ("agent_milestone", agent_id, graph.names[i], None),
+                ("milestone", None, graph.names[i], None),
+            )
+            key = next(
+                (
+                    k
+                    for k in candidates
+                    if len(pools.get(k) or ()) >= settings.ETA_FORECAST_MIN_SAMPLES
+                ),
+                None,
+            )
+            level = key[0] if key else "planned_duration"
+            coverage[level] += 1
+            if key is None:
+                key = ("planned_duration", i)
+                pool = [int(graph.durations[i])]
+            else:
+                pool = pools[key]
+            if key not in placed:
+                placed[key] = (len(values), len(pool))
+                values.extend(pool)
+            offsets[i], sizes[i] = placed[key]
+        return np.asarray(values, dtype=np.float64), offsets, sizes, coverage
+
+    @staticmethod
+    def simulate(
+        graph: ScheduleGraph,
+        levels: TopologicalLevels,
+        pool_values: np.ndarray,
+        pool_offsets: np.ndarray,
+        pool_sizes: np.ndarray,
+        as_of: date,
+        scenarios: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """
+        Completion day number per scenario for the first project of ``graph``.
+
+        Completed milestones keep their actual date. Others start once all
+        prerequisites are done (or at the project anchor), take a sampled
+        duration, and cannot finish before ``as_of``.
+        """
+        n = graph.size
+        src, dst = graph.src, graph.dst
+        today = float(np.datetime64(as_of, "D").astype(np.int64))
+        anchor = graph.anchors[0]
+        floor = today if np.isnat(anchor) else float(anchor.astype(np.int64))
+
+        actual = graph.actual.astype(np.int64).astype(np.float64)
+        done = ~np.isnat(graph.actual)
+        draws = pool_values[
+            pool_offsets[:, None]
+            + (rng.random((n, scenarios)) * pool_sizes[:, None]).astype(np.int64)
+        ]
+
+        finish = np.full((n, scenarios), np.nan)
+        ready = np.full((n, scenarios), floor)
+        for depth in range(levels.depth):
+            v = levels.nodes_at(depth)
+            sampled = np.maximum(ready[v] + draws[v], today)
+            finish[v] = np.where(done[v, None], actual[v, None], sampled)
+            e = levels.edges_from(depth)
+            np.maximum.at(ready, dst[e], finish[src[e]])
+        return np.nanmax(finish, axis=0)
+
+    async def forecast(
+        self,
+        project_id: str,
+        scenarios: Optional[int] = None,
+        as_of: Optional[date] = None,
+        force_refresh: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        scenarios = scenarios or settings.ETA_FORECAST_SCENARIOS
+        as_of = as_of or date.today()
+        versioned = await self.data_version(project_id)
+        if versioned is None:
+            return None
+        version, end_date_planned = versioned
+
+        key = f"eta:{project_id}:{version}:{as_of.isoformat()}:{scenarios}"
+        if not force_refresh:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return {**json.loads(cached), "cached": True}
+
+        graph = await load_schedule_graph(self.db, [project_id])
+        result: Dict[str, Any] = {
+            "project_id": project_id,
+            "as_of": as_of.isoformat(),
+            "data_version": version,
+            "scenarios": scenarios,
+            "end_date_planned": end_date_planned.isoformat() if end_date_planned else None,
+        }
+        if not graph.size:
+            result.update(status="no_milestones")
+        else:
+            values, offsets, sizes, coverage = await self._pools(graph)
+            levels = topological_levels(graph)
+            # Seeded from the cache key: the same data and day give the same forecast.
+            seed = int(hashlib.sha1(key.encode()).hexdigest()[:8], 16)
+            completion = self.simulate(
+                graph, levels, values, offsets, sizes, as_of, scenarios, np.random.default_rng(seed)
+            )
+            days = np.ceil(np.percentile(completion, PERCENTILES)).astype(np.int64)
+            result.update(
+                status="complete" if not np.isnat(graph.actual).any() else "in_progress",
+                **{
+                    f"p{q}": str(np.datetime64(int(day), "D"))
+                    for q, day in zip(PERCENTILES, days)
+                },
+                on_time_probability=(
+                    round(
+                        float(
+                            np.mean(
+                                completion
+                                <= np.datetime64(end_date_planned, "D").astype(np.int64)
+                            )
+                        ),
+                        3,
+                    )
+                    if end_date_planned
+                    else None
+                ),
+                has_cycle=bool(levels.on_cycle.any()),
+                duration_sources=coverage,
+            )
+
+        await self.cache.set(key, json.dumps(result).encode(), settings.ETA_FORECAST_CACHE_TTL)
+        return {**result, "cached": False}
@@ -0,0 +1,146 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+# One statement per call: every section of the summary is aggregated into JSON
+# by Postgres, so the endpoint pays a single round trip and never hydrates ORM
+# objects. Dates are rendered exactly like ``str(date)`` / ``str(datetime)``.
+PROJECT_SUMMARY_SQL = text(
+    """
+    WITH p AS (
+        SELECT project_id, market, site_type, start_date, end_date_planned, end_date_actual
+        FROM projects
+        WHERE project_id = ANY(:project_ids)
+    ),
+    ms AS (
+        SELECT
+            m.project_id,
+            count(*) AS total,
+            count(*) FILTER (WHERE m.status = 'Delayed') AS delayed,
+            json_agg(
+                json_build_object(
+                    'milestone_id', m.milestone_id,
+                    'name', m.milestone_name,
+                    'planned_date', to_char(m.planned_date, 'YYYY-MM-DD'),
+                    'actual_date', to_char(m.actual_date, 'YYYY-MM-DD'),
+                    'status', m.status,
+                    'duration_days', m.duration_days,
+                    'description', m.milestone_name || ' for ' || p.market
+                )
+                ORDER BY m.planned_date, m.milestone_id
+            ) FILTER (WHERE m.status IS DISTINCT FROM 'Delayed') AS healthy_milestones,
+            json_agg(
+                json_build_object(
+                    'milestone_id', m.milestone_id,
+                    'name', m.milestone_name,
+                    'planned_date', to_char(m.planned_date, 'YYYY-MM-DD'),
+                    'actual_date', to_char(m.actual_date, 'YYYY-MM-DD'),
+                    'status', m.status,
+                    'duration_days', m.duration_days,
+                    'description', m.milestone_name || ' for ' || p.market
+                )
+                ORDER BY m.planned_date, m.milestone_id
+            ) FILTER (WHERE m.status = 'Delayed') AS delayed_milestones
+        FROM milestones m
+        JOIN p ON p.project_id = m.project_id
+        GROUP BY m.project_id
+    ),
+    an AS (
+        SELECT
+            m.project_id,
+            count(*) AS count,
+            json_agg(
+                json_build_object(
+                    'anomaly_id', a.anomaly_id,
+                    'milestone_id', a.milestone_id,
+                    'type', a.type,
+                    'severity', a.severity,
+                    'description', a.description,
+                    'detected_on', to_char(a.detected_on, 'YYYY-MM-DD HH24:MI:SS')
+                        || CASE
+                               WHEN a.detected_on <> date_trunc('second', a.detected_on)
+                               THEN to_char(a.detected_on, '.US')
+                               ELSE ''
+                           END
+                )
+                ORDER BY a.detected_on DESC, a.anomaly_id
+            ) AS details
+        FROM anomalies a
+        JOIN milestones m ON m.milestone_id = a.milestone_id
+        JOIN p ON p.project_id = m.project_id
+        GROUP BY m.project_id
+    ),
+    cy AS (
+        SELECT
+            c.project_id,
+            json_agg(
+                json_build_object(
+                    'cycle_id', c.cycle_id,
+                    'label', 'cycle',
+                    'agent_start_id', c.agent_start_id,
+                    'agent_end_id', c.agent_end_id,
+                    'agent_start_name', s.agent_name,
+                    'agent_end_name', e.agent_name,
+                    'planned', c.planned_duration,
+                    'actual', c.actual_duration,
+                    'variance', c.variance
+                )
+                ORDER BY c.cycle_id
+            ) AS cycles
+        FROM cycle_times c
+        JOIN p ON p.project_id = c.project_id
+        LEFT JOIN agents s ON s.agent_id = c.agent_start_id
+        LEFT JOIN agents e ON e.agent_id = c.agent_end_id
+        GROUP BY c.project_id
+    )
+    SELECT
+        p.project_id,
+        json_build_object(
+            'project', json_build_object(
+                'project_id', p.project_id,
+                'market', p.market,
+                'site_type', p.site_type,
+                'start_date', to_char(p.start_date, 'YYYY-MM-DD'),
+                'end_date_planned', to_char(p.end_date_planned, 'YYYY-MM-DD'),
+                'end_date_actual', to_char(p.end_date_actual, 'YYYY-MM-DD')
+            ),
+            'milestones', json_build_object(
+                'total', coalesce(ms.total, 0),
+                'delayed', coalesce(ms.delayed, 0),
+                'healthy_milestones', coalesce(ms.healthy_milestones, '[]'::json),
+                'delayed_milestones', coalesce(ms.delayed_milestones, '[]'::json)
+            ),
+            'anomalies', json_build_object(
+                'count', coalesce(an.count, 0),
+                'details', coalesce(an.details, '[]'::json)
+            ),
+            'cycles', coalesce(cy.cycles, '[]'::json)
+        ) AS summary
+    FROM p
+    LEFT JOIN ms ON ms.project_id = p.project_id
+    LEFT JOIN an ON an.project_id = p.project_id
+    LEFT JOIN cy ON cy.project_id = p.project_id
+    """
+)
+
+
+class ProjectSummaryService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def fetch_summaries(
+        self, project_ids: Sequence[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Return ``{project_id: summary}`` for every id that exists."""
+        if not project_ids:
+            return {}
+        result = await self.db.execute(
+            PROJECT_SUMMARY_SQL, {"project_ids": list(project_ids)}
+        )
+        return {project_id: summary for project_id, summary in result.all()}
+
+    async def fetch_summary(self, project_id: str) -> Optional[Dict[str, Any]]:
+        summaries = await self.fetch_summaries([project_id])
+        return summaries.get(project_id)
@@ -0,0 +1,386 @@
+"""
+Milestone dependency graphs in array form, for many projects at once.
+
+Nodes are milestones (indexed 0..n-1 in ``milestone_id`` order), edges are
+``Dependency`` rows pointing from the prerequisite to the dependent milestone
+and treated as finish-to-start. Every pass below works level by level over the
+topological levels of the whole graph, so the Python loop runs once per level
+(the depth of the deepest project), never once per node or per project.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_NODES_SQL = text(
+    """
+    SELECT m.milestone_id, m.project_id, m.agent_id, m.milestone_name,
+           m.duration_days, m.planned_date, m.actual_date, m.status, p.market
+    FROM milestones m
+    JOIN projects p ON p.project_id = m.project_id
+    WHERE m.project_id = ANY(:project_ids)
+    ORDER BY m.milestone_id
+    """
+)
+_EDGES_SQL = text(
+    """
+    SELECT d.prerequisite_id, d.milestone_id
+    FROM dependencies d
+    JOIN milestones m ON m.milestone_id = d.milestone_id
+    WHERE m.project_id = ANY(:project_ids)
+    """
+)
+_ANCHORS_SQL = text(
+    "SELECT project_id, start_date FROM projects WHERE project_id = ANY(:project_ids)"
+)
+
+
+@dataclass
+class ScheduleGraph:
+    project_ids: List[str]
+    project_index: np.ndarray  # (n,) int -> project_ids
+    anchors: np.ndarray  # (p,) datetime64[D], project start (NaT if unknown)
+    milestone_ids: np.ndarray  # (n,) int64, ascending
+    names: np.ndarray  # (n,) object
+    agent_ids: np.ndarray  # (n,) int64, -1 if unknown
+    markets: np.ndarray  # (n,) object
+    statuses: np.ndarray  # (n,) object
+    durations: np.ndarray  # (n,) int64, missing/negative -> 0
+    planned: np.ndarray  # (n,) datetime64[D]
+    actual: np.ndarray  # (n,) datetime64[D]
+    src: np.ndarray  # (m,) prerequisite node
+    dst: np.ndarray  # (m,) dependent node
+    ignored_edges: np.ndarray  # (p,) dependencies leaving the project (not modelled)
+
+    @property
+    def size(self) -> int:
+        return len(self.milestone_ids)
+
+    def node_index(self, milestone_ids: Sequence[int]) -> np.ndarray:
+        """Node index per milestone id, -1 for ids not in the graph."""
+        ids = np.asarray(milestone_ids, dtype=np.int64)
+        if not self.size:
+            return np.full(len(ids), -1, dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.milestone_ids, ids), self.size - 1)
+        return np.where(self.milestone_ids[pos] == ids, pos, -1)
+
+
+def _dates(values: Sequence[Any]) -> np.ndarray:
+    return np.array([v if v is not None else "NaT" for v in values], dtype="datetime64[D]")
+
+
+async def load_schedule_graph(db: AsyncSession, project_ids: Sequence[str]) -> ScheduleGraph:
+    params = {"project_ids": list(project_ids)}
+    nodes = (await db.execute(_NODES_SQL, params)).all()
+    edges = (await db.execute(_EDGES_SQL, params)).all()
+    anchors = dict((await db.execute(_ANCHORS_SQL, params)).all())
+
+    ordered_projects = sorted({row.project_id for row in nodes})
+    project_pos = {pid: i for i, pid in enumerate(ordered_projects)}
+    cols = list(zip(*nodes)) if nodes else [()] * 9
+    milestone_ids = np.array(cols[0], dtype=np.int64)
+    project_index = np.array([project_pos[p] for p in cols[1]], dtype=np.int64)
+
+    graph = ScheduleGraph(
+        project_ids=ordered_projects,
+        project_index=project_index,
+        anchors=_dates([anchors.get(pid) for pid in ordered_projects]),
+        milestone_ids=milestone_ids,
+        names=np.array(cols[3], dtype=object),
+        agent_ids=np.array([a if a is not None else -1 for a in cols[2]], dtype=np.int64),
+        markets=np.array(cols[8], dtype=object),
+        statuses=np.array(cols[7], dtype=object),
+        durations=np.array([max(d or 0, 0) for d in cols[4]], dtype=np.int64),
+        planned=_dates(cols[5]),
+        actual=_dates(cols[6]),
+        src=np.empty(0, dtype=np.int64),
+        dst=np.empty(0, dtype=np.int64),
+        ignored_edges=np.zeros(len(ordered_projects), dtype=np.int64),
+    )
+
+    if edges:
+        pre_ids, dep_ids = (np.array(c, dtype=np.int64) for c in zip(*((p or -1, d) for p, d in edges)))
+        src, dst = graph.node_index(pre_ids), graph.node_index(dep_ids)
+        keep = (src >= 0) & (dst >= 0)
+        keep[keep] &= project_index[src[keep]] == project_index[dst[keep]]
+        known = dst >= 0
+        np.add.at(graph.ignored_edges, project_index[dst[known & ~keep]], 1)
+        graph.src, graph.dst = src[keep], dst[keep]
+    return graph
+
+
+def _peel(n: int, src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Kahn's algorithm a level at a time; nodes never released keep level -1."""
+    level = np.full(n, -1, dtype=np.int64)
+    indegree = np.bincount(dst, minlength=n)
+    order = np.argsort(src, kind="stable")
+    successors = dst[order]
+    indptr = np.concatenate(([0], np.cumsum(np.bincount(src, minlength=n))))
+
+    frontier = np.flatnonzero(indegree == 0)
+    depth = 0
+    while frontier.size:
+        level[frontier] = depth
+        starts = indptr[frontier]
+        counts = indptr[frontier + 1] - starts
+        total = int(counts.sum())
+        if not total:
+            break
+        # Gather every outgoing edge of the frontier without a Python loop.
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        released = np.bincount(successors[offsets], minlength=n)
+        indegree -= released
+        frontier = np.flatnonzero((released > 0) & (indegree == 0))
+        depth += 1
+    return level
+
+
+@dataclass
+class TopologicalLevels:
+    level: np.ndarray  # (n,) -1 for nodes on or behind a cycle
+    on_cycle: np.ndarray  # (n,) bool, nodes that are part of a cycle
+    edge_order: np.ndarray  # indices into src/dst of acyclic edges, by level of src
+    edge_bounds: np.ndarray  # edge_order[edge_bounds[l]:edge_bounds[l+1]] leave level l
+    node_order: np.ndarray  # acyclic nodes by level
+    node_bounds: np.ndarray  # node_order[node_bounds[l]:node_bounds[l+1]] are at level l
+
+    @property
+    def depth(self) -> int:
+        return len(self.edge_bounds) - 1
+
+    def edges_from(self, depth: int) -> np.ndarray:
+        return self.edge_order[self.edge_bounds[depth] : self.edge_bounds[depth + 1]]
+
+    def nodes_at(self, depth: int) -> np.ndarray:
+        return self.node_order[self.node_bounds[depth] : self.node_bounds[depth + 1]]
+
+
+def topological_levels(graph: ScheduleGraph) -> TopologicalLevels:
+    n, src, dst = graph.size, graph.src, graph.dst
+    level = _peel(n, src, dst)
+
+    # Peeling the unresolved rest from the sink side leaves the cycle members
+    # (and anything wedged between two cycles); what it removes merely sits
+    # downstream of a cycle.
+    rest = (level[src] < 0) & (level[dst] < 0)
+    back = _peel(n, dst[rest], src[rest])
+    on_cycle = (level < 0) & (back < 0)
+
+    acyclic = np.flatnonzero((level[src] >= 0) & (level[dst] >= 0))
+    edge_order = acyclic[np.argsort(level[src[acyclic]], kind="stable")]
+    depth = int(level.max()) + 1 if n else 0
+    edge_bounds = np.searchsorted(level[src[edge_order]], np.arange(depth + 1))
+    acyclic_nodes = np.flatnonzero(level >= 0)
+    node_order = acyclic_nodes[np.argsort(level[acyclic_nodes], kind="stable")]
+    node_bounds = np.searchsorted(level[node_order], np.arange(depth + 1))
+    return TopologicalLevels(
+        level, on_cycle, edge_order, edge_bounds, node_order, node_bounds
+    )
+
+
+@dataclass
+class CriticalPathResult:
+    earliest_start: np.ndarray  # (n,) float days from the project anchor, NaN on cycles
+    earliest_finish: np.ndarray
+    latest_start: np.ndarray
+    latest_finish: np.ndarray
+    slack: np.ndarray
+    project_finish: np.ndarray  # (p,) float days
+    critical: np.ndarray  # (n,) bool
+
+
+def critical_path(graph: ScheduleGraph, levels: Optional[TopologicalLevels] = None) -> CriticalPathResult:
+    """Forward/backward CPM pass over every project of ``graph`` at once."""
+    levels = levels or topological_levels(graph)
+    src, dst = graph.src, graph.dst
+    duration = graph.durations.astype(np.float64)
+    valid = levels.level >= 0
+
+    es = np.where(valid, 0.0, np.nan)
+    for depth in range(levels.depth):
+        e = levels.edges_from(depth)
+        np.maximum.at(es, dst[e], es[src[e]] + duration[src[e]])
+    ef = es + duration
+
+    finish = np.zeros(len(graph.project_ids))
+    np.maximum.at(finish, graph.project_index[valid], ef[valid])
+    lf = np.where(valid, finish[graph.project_index], np.nan)
+    # Backward: edges grouped by the level of their dependent, deepest first.
+    by_dst = levels.edge_order[np.argsort(levels.level[dst[levels.edge_order]], kind="stable")]
+    bounds = np.searchsorted(levels.level[dst[by_dst]], np.arange(levels.depth + 1))
+    for depth in range(levels.depth - 1, -1, -1):
+        e = by_dst[bounds[depth] : bounds[depth + 1]]
+        np.minimum.at(lf, src[e], lf[dst[e]] - duration[dst[e]])
+    ls = lf - duration
+    slack = ls - es
+
+    return CriticalPathResult(
+        earliest_start=es,
+        earliest_finish=ef,
+        latest_start=ls,
+        latest_finish=lf,
+        slack=slack,
+        project_finish=finish,
+        critical=valid & np.isclose(slack, 0.0),
+    )
+
+
+def _day_numbers(dates: np.ndarray) -> np.ndarray:
+    """datetime64[D] -> float days since the epoch, NaN for NaT."""
+    out = dates.astype(np.int64).astype(np.float64)
+    out[np.isnat(dates)] = np.nan
+    return out
+
+
+@dataclass
+class PropagationResult:
+    baseline: np.ndarray  # (n,) float day numbers, NaN if unknown or on a cycle
+    forecast: np.ndarray
+    delay: np.ndarray  # (n,) forecast - baseline, 0 where unknown
+    slip_applied: np.ndarray  # (n,) bool, a requested slip was applied here
+
+
+def propagate_delays(
+    graph: ScheduleGraph,
+    slip_days: np.ndarray,
+    levels: Optional[TopologicalLevels] = None,
+) -> PropagationResult:
+    """
+    Push ``slip_days`` (per node, 0 for no slip) through every transitive
+    successor, finish-to-start.
+
+    Baseline finish is the actual date if the milestone is done, else the
+    planned date, else what its prerequisites imply. A successor only moves by
+    how far the new prerequisite finish (plus its own duration) overshoots
+    the later of its baseline and what its prerequisites already required, so
+    existing float absorbs slips and inconsistent baselines are not reported
+    as delays. Completed milestones never move.
+    """
+    levels = levels or topological_levels(graph)
+    src, dst, n = graph.src, graph.dst, graph.size
+    duration = graph.durations.astype(np.float64)
+    actual = _day_numbers(graph.actual)
+    known = np.where(np.isnan(actual), _day_numbers(graph.planned), actual)
+    done = ~np.isnan(actual)
+    slip = np.where(done, 0.0, slip_days.astype(np.float64))
+
+    baseline = np.full(n, np.nan)
+    forecast = np.full(n, np.nan)
+    baseline_req = np.full(n, -np.inf)  # latest prerequisite finish + own duration
+    forecast_req = np.full(n, -np.inf)
+    for depth in range(levels.depth):
+        v = levels.nodes_at(depth)
+        b_req, f_req = baseline_req[v], forecast_req[v]
+        base = np.where(np.isnan(known[v]), np.where(np.isinf(b_req), np.nan, b_req), known[v])
+        with np.errstate(invalid="ignore"):  # -inf - -inf for nodes without prerequisites
+            pushed = base + (f_req - np.fmax(base, b_req))
+        fc = np.fmax(base + slip[v], np.where(np.isinf(f_req), np.nan, pushed))
+        baseline[v] = base
+        forecast[v] = np.where(done[v], base, fc)
+
+        e = levels.edges_from(depth)
+        ok = ~np.isnan(baseline[src[e]])
+        e = e[ok]
+        np.maximum.at(baseline_req, dst[e], baseline[src[e]] + duration[dst[e]])
+        np.maximum.at(forecast_req, dst[e], forecast[src[e]] + duration[dst[e]])
+
+    delay = np.nan_to_num(forecast - baseline, nan=0.0)
+    return PropagationResult(
+        baseline=baseline,
+        forecast=forecast,
+        delay=np.maximum(delay, 0.0),
+        slip_applied=(slip > 0) & (levels.level >= 0) & ~np.isnan(baseline),
+    )
+
+
+def day_numbers_to_dates(values: np.ndarray) -> List[Optional[str]]:
+    return [None if np.isnan(v) else str(np.datetime64(int(v), "D")) for v in values]
+
+
+def project_nodes(graph: ScheduleGraph) -> List[np.ndarray]:
+    """Node indices of each project, in ``graph.project_ids`` order."""
+    order = np.argsort(graph.project_index, kind="stable")
+    bounds = np.searchsorted(graph.project_index[order], np.arange(len(graph.project_ids) + 1))
+    return [order[bounds[i] : bounds[i + 1]] for i in range(len(graph.project_ids))]
+
+
+def offsets_to_dates(anchor: np.datetime64, offsets: np.ndarray) -> List[Optional[str]]:
+    if np.isnat(anchor):
+        return [None] * len(offsets)
+    return [
+        None if np.isnan(v) else str(anchor + np.timedelta64(int(v), "D")) for v in offsets
+    ]
+
+
+def default_anchors(graph: ScheduleGraph) -> np.ndarray:
+    """
+    Project start per project: ``projects.start_date`` or, failing that, the
+    earliest ``planned_date - duration_days`` among its milestones.
+    """
+    implied = graph.planned - graph.durations.astype("timedelta64[D]")
+    earliest = np.full(len(graph.project_ids), np.datetime64("NaT"), dtype="datetime64[D]")
+    has = ~np.isnat(implied)
+    if has.any():
+        days = implied[has].astype(np.int64)
+        best = np.full(len(graph.project_ids), np.iinfo(np.int64).max)
+        np.minimum.at(best, graph.project_index[has], days)
+        found = best != np.iinfo(np.int64).max
+        earliest[found] = best[found].astype("datetime64[D]")
+    return np.where(np.isnat(graph.anchors), earliest, graph.anchors)
+
+
+def summarize_projects(
+    graph: ScheduleGraph,
+    levels: TopologicalLevels,
+    result: CriticalPathResult,
+    include_milestones: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    anchors = default_anchors(graph)
+    out: Dict[str, Dict[str, Any]] = {}
+    for p, nodes in enumerate(project_nodes(graph)):
+        # Topological order within the project; ties broken by earliest start.
+        nodes = nodes[np.lexsort((result.earliest_start[nodes], levels.level[nodes]))]
+        anchor = anchors[p]
+        cycle = nodes[levels.on_cycle[nodes]]
+        critical = nodes[result.critical[nodes]]
+        critical = critical[np.argsort(result.earliest_start[critical], kind="stable")]
+        acyclic = bool(not (levels.level[nodes] < 0).any())
+        summary: Dict[str, Any] = {
+            "project_id": graph.project_ids[p],
+            "anchor_date": None if np.isnat(anchor) else str(anchor),
+            "finish_date": offsets_to_dates(anchor, result.project_finish[p : p + 1])[0]
+            if acyclic
+            else None,
+            "duration_days": int(result.project_finish[p]) if acyclic else None,
+            "has_cycle": bool(cycle.size),
+            "cycle_milestones": graph.milestone_ids[cycle].tolist(),
+            "ignored_dependencies": int(graph.ignored_edges[p]),
+            "critical_path": [
+                {"milestone_id": int(graph.milestone_ids[i]), "name": graph.names[i]}
+                for i in critical
+            ],
+        }
+        if include_milestones:
+            es = offsets_to_dates(anchor, result.earliest_start[nodes])
+            ef = offsets_to_dates(anchor, result.earliest_finish[nodes])
+            ls = offsets_to_dates(anchor, result.latest_start[nodes])
+            lf = offsets_to_dates(anchor, result.latest_finish[nodes])
+            summary["milestones"] = [
+                {
+                    "milestone_id": int(graph.milestone_ids[i]),
+                    "name": graph.names[i],
+                    "duration_days": int(graph.durations[i]),
+                    "level": int(levels.level[i]),
+                    "earliest_start": es[k],
+                    "earliest_finish": ef[k],
+                    "latest_start": ls[k],
+                    "latest_finish": lf[k],
+                    "slack_days": None if np.isnan(result.slack[i]) else int(result.slack[i]),
+                    "critical": bool(result.critical[i]),
+                }
+                for k, i in enumerate(nodes)
+            ]
+        out[graph.project_ids[p]] = summary
+    return out
@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, delete, exists, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app.models.entities import (
+    Milestone,
+    MilestoneVendor,
+    Project,
+    Vendor,
+    VendorDelayRollup,
+)
+
+
+class VendorDelayService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def top_delays(
+        self,
+        by_market: bool = False,
+        by_site_type: bool = False,
+        top_n: Optional[int] = None,
+        use_rollup: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Rank vendors by delayed milestones, optionally per market and/or site type."""
+        if use_rollup:
+            r = VendorDelayRollup
+            count = func.sum(r.delayed_milestones)
+            keys = [Vendor.vendor_name]
+            if by_market:
+                keys.append(r.market)
+            if by_site_type:
+                keys.append(func.nullif(r.site_type, "").label("site_type"))
+            stmt = select(*keys, count).join(Vendor, Vendor.vendor_id == r.vendor_id)
+        else:
+            count = func.count()
+            keys = [Vendor.vendor_name]
+            if by_market:
+                keys.append(Project.market)
+            if by_site_type:
+                keys.append(Project.site_type)
+            stmt = (
+                select(*keys, count)
+                .join(MilestoneVendor, MilestoneVendor.vendor_id == Vendor.vendor_id)
+                .join(Milestone, Milestone.milestone_id == MilestoneVendor.milestone_id)
+                .filter(Milestone.status == "Delayed")
+            )
+            if by_market or by_site_type:
+                stmt = stmt.join(Project, Project.project_id == Milestone.project_id)
+
+        stmt = stmt.group_by(*keys).order_by(count.desc(), *keys)
+        if top_n:
+            stmt = stmt.limit(top_n)
+
+        result = await self.db.execute(stmt)
+        out = []
+        for row in result.all():
+            item = {"vendor": row[0], "delayed_milestones": int(row[-1])}
+            if by_market:
+                item["market"] = row[1]
+            if by_site_type:
+                item["site_type"] = row[-2]
+            out.append(item)
+        return out
+
+    async def refresh_rollup(
+        self, markets: Optional[Sequence[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Bring ``vendor_delay_rollup`` up to date, optionally only for ``markets``.
+
+        This is a full recompute of the scope, not a change-driven refresh:
+        every delayed milestone-vendor link in the scope is re-aggregated. What
+        it saves is writes: only groups whose count changed are updated, and
+        groups that no longer have delayed milestones are removed. (A watermark
+        on ``milestones.updated_at`` would miss vendor links, project
+        market/site-type changes and deleted milestones, none of which are
+        tracked.) Pass ``markets`` to bound the recompute to the markets that
+        changed.
+        """
+        r = VendorDelayRollup
+        site_type = func.coalesce(Project.site_type, "")
+        fresh = (
+            select(
+                MilestoneVendor.vendor_id.label("vendor_id"),
+                Project.market.label("market"),
+                site_type.label("site_type"),
+                func.count().label("delayed_milestones"),
+                func.now().label("refreshed_at"),
+            )
+            .join(Milestone, Milestone.milestone_id == MilestoneVendor.milestone_id)
+            .join(Project, Project.project_id == Milestone.project_id)
+            .filter(Milestone.status == "Delayed")
+            .group_by(MilestoneVendor.vendor_id, Project.market, site_type)
+        )
+        if markets:
+            fresh = fresh.filter(Project.market.in_(markets))
+
+        upsert = insert(r).from_select(
+            ["vendor_id", "market", "site_type", "delayed_milestones", "refreshed_at"],
+            fresh,
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[r.vendor_id, r.market, r.site_type],
+            set_={
+                "delayed_milestones": upsert.excluded.delayed_milestones,
+                "refreshed_at": upsert.excluded.refreshed_at,
+            },
+            where=r.delayed_milestones.is_distinct_from(
+                upsert.excluded.delayed_milestones
+            ),
+        )
+        upserted = (await self.db.execute(upsert)).rowcount
+
+        current = fresh.subquery()
+        stale = delete(r).where(
+            ~exists().where(
+                and_(
+                    current.c.vendor_id == r.vendor_id,
+                    current.c.market == r.market,
+                    current.c.site_type == r.site_type,
+                )
+            )
+        )
+        if markets:
+            stale = stale.where(r.market.in_(markets))
+        deleted = (await self.db.execute(stale)).rowcount
+
+        await self.db.commit()
+        return {"upserted": upserted, "deleted": deleted}
@@ -0,0 +1,169 @@
+"""
+Latency benchmark for the role alert summary (``GET /alerts/{role}``).
+
+Times three variants of the five section queries, so the two changes can be
+told apart:
+
+- baseline:   the original queries, each re-joining ``agents`` by name, run
+              back to back on one session
+- by_id:      the same sections filtered on the resolved ``agent_id``, still
+              back to back on one session
+- concurrent: the ``agent_id`` queries, each on its own pooled connection (what
+              the endpoint does while the pool has headroom)
+
+The concurrent variant checks out five connections per call. With a local
+database and tiny tables the per-connection overhead outweighs the overlap;
+``--rtt-ms`` adds an emulated network round trip before every statement to
+show the case the concurrency targets. Requires a populated database
+configured through the usual ``DATABASE_*`` settings.
+
+    python -m backend.benchmarks.agent_summary --role "Construction" --iterations 50 [--rtt-ms 5]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, Dict, List, Sequence
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import aliased
+
+from backend.app.db.session import AsyncSessionLocal, engine
+from backend.app.models.entities import (
+    Agent,
+    Anomaly,
+    Dependency,
+    Milestone,
+    MilestoneVendor,
+    Project,
+    Vendor,
+)
+from backend.app.services.agent_summary_service import agent_summary_statements
+
+
+def baseline_statements(role: str) -> List[Select]:
+    """The section queries as the endpoint originally ran them: every one joins agents by name."""
+    d = aliased(Dependency)
+    return [
+        select(Milestone.status, func.count(Milestone.milestone_id))
+        .join(Project, Project.project_id == Milestone.project_id)
+        .join(Agent, Agent.agent_id == Milestone.agent_id)
+        .where(Agent.agent_name == role)
+        .group_by(Milestone.status)
+        .limit(10),
+        select(
+            Project.project_id,
+            Milestone.milestone_name,
+            Milestone.planned_date,
+            Milestone.actual_date,
+        )
+        .join(Project, Project.project_id == Milestone.project_id)
+        .join(Agent, Agent.agent_id == Milestone.agent_id)
+        .where(Agent.agent_name == role)
+        .limit(10),
+        select(Project.project_id, Anomaly.type, Anomaly.severity, Anomaly.description)
+        .join(Milestone, Milestone.milestone_id == Anomaly.milestone_id)
+        .join(Project, Project.project_id == Milestone.project_id)
+        .join(Agent, Agent.agent_id == Milestone.agent_id)
+        .where(Agent.agent_name == role)
+        .limit(10),
+        select(
+            Project.project_id,
+            Vendor.vendor_name,
+            func.count(Milestone.milestone_id)
+            .filter(Milestone.status == "Delayed")
+            .label("delayed_count"),
+            func.count(Milestone.milestone_id).label("total_count"),
+        )
+        .join(Milestone, Project.project_id == Milestone.project_id)
+        .join(Agent, Agent.agent_id == Milestone.agent_id)
+        .outerjoin(MilestoneVendor, MilestoneVendor.milestone_id == Milestone.milestone_id)
+        .outerjoin(Vendor, Vendor.vendor_id == MilestoneVendor.vendor_id)
+        .where(Agent.agent_name == role)
+        .group_by(Project.project_id, Vendor.vendor_name)
+        .limit(10),
+        select(d.prerequisite_id, d.milestone_id)
+        .join(Milestone, Milestone.milestone_id == d.milestone_id)
+        .join(Agent, Agent.agent_id == Milestone.agent_id)
+        .where(Agent.agent_name == role)
+        .limit(10),
+    ]
+
+
+async def _sequential(statements: Sequence[Select], rtt: float) -> None:
+    async with AsyncSessionLocal() as session:
+        for stmt in statements:
+            await asyncio.sleep(rtt)
+            (await session.execute(stmt)).all()
+
+
+async def _one(stmt: Select, rtt: float) -> None:
+    async with AsyncSessionLocal() as session:
+        await asyncio.sleep(rtt)
+        (await session.execute(stmt)).all()
+
+
+async def _concurrent(statements: Sequence[Select], rtt: float) -> None:
+    await asyncio.gather(*(_one(stmt, rtt) for stmt in statements))
+
+
+async def _measure(fn: Callable[[], Awaitable[None]], iterations: int) -> List[float]:
+    await fn()  # warm up the pool and the statement cache
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def _report(label: str, timings: List[float]) -> None:
+    ordered = sorted(timings)
+    p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+    print(
+        f"{label:<12} mean={statistics.mean(timings):8.2f}ms "
+        f"p50={statistics.median(timings):8.2f}ms p95={p95:8.2f}ms"
+    )
+
+
+async def main(role: str, iterations: int, rtt_ms: float) -> None:
+    async with AsyncSessionLocal() as session:
+        agent_id = (
+            await session.execute(select(Agent.agent_id).where(Agent.agent_name == role))
+        ).scalar_one_or_none()
+    if agent_id is None:
+        raise SystemExit(f"Unknown role: {role}")
+
+    rtt = rtt_ms / 1000
+    by_name = baseline_statements(role)
+    by_id = list(agent_summary_statements(agent_id).values())
+    variants: Dict[str, Callable[[], Awaitable[None]]] = {
+        "baseline": lambda: _sequential(by_name, rtt),
+        "by_id": lambda: _sequential(by_id, rtt),
+        "concurrent": lambda: _concurrent(by_id, rtt),
+    }
+    timings = {label: await _measure(fn, iterations) for label, fn in variants.items()}
+    await engine.dispose()
+
+    if rtt_ms:
+        print(f"emulated round trip: {rtt_ms}ms per statement")
+    for label, values in timings.items():
+        _report(label, values)
+    p50 = {label: statistics.median(values) for label, values in timings.items()}
+    print(f"id resolution (baseline -> by_id):   {p50['baseline'] / p50['by_id']:.2f}x")
+    print(f"concurrency (by_id -> concurrent):   {p50['by_id'] / p50['concurrent']:.2f}x")
+    print(f"overall (baseline -> concurrent):    {p50['baseline'] / p50['concurrent']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--role", required=True)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--rtt-ms",
+        type=float,
+        default=0.0,
+        help="Emulated network round trip added before every statement",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.role, args.iterations, args.rtt_ms))
@@ -0,0 +1,179 @@
+"""
+CPU benchmark for ``AlertService.build_report`` on synthetic
+``projects_encoded`` rows (no database needed).
+
+Runs the original row-wise implementation (kept here as the reference) and
+the columnar one on the same frame, checks the output is identical (the
+extra vendor statistics aside) and reports the timings.
+
+    python -m backend.benchmarks.alert_report --rows 100000
+"""
+import argparse
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from backend.app.services.alert_service import AlertService
+
+DATE_COLUMNS = [
+    "project_start",
+    "rec",
+    "rer",
+    "rtc",
+    "pcc",
+    "transport_awarded_a",
+    "transport_completed_a",
+    "building_permit_approved_a",
+    "nepa_complete_a",
+]
+
+
+def synthetic_projects(rows: int, seed: int = 7) -> pd.DataFrame:
+    """A frame shaped like ``AlertService.fetch_projects`` output, ~15% missing dates."""
+    rng = np.random.default_rng(seed)
+    base = pd.Timestamp("2021-01-01")
+    vendors = np.array([f"Vendor {i}" for i in range(40)] + [None], dtype=object)
+    data: Dict[str, Any] = {
+        "fuze_project_id": np.arange(rows) + 100000,
+        "site_name": [f"SITE-{i}" for i in range(rows)],
+        "local_market": rng.choice(["NYC", "LA", "DAL", "CHI", None], rows),
+        "county": rng.choice(["Kings", "Orange", "Dallas", "Cook"], rows),
+        "site_candidate_type": rng.choice(["Raw Land", "Colocation"], rows),
+        "structure_owner": rng.choice(["Crown", "AT", "SBA", None], rows),
+        "vendor_site_acquisition": vendors[rng.integers(0, len(vendors), rows)],
+        "vendor_construction_manager_company": rng.choice(["CM1", "CM2"], rows),
+        "transport_vendor": rng.choice(["T1", "T2", None], rows),
+        "project_status": rng.choice(["Active", "Complete", "On Hold"], rows),
+    }
+    offset = rng.integers(0, 400, rows)
+    for step, col in enumerate(DATE_COLUMNS):
+        days = offset + step * rng.integers(10, 120, rows)
+        values = pd.Series(base + pd.to_timedelta(days, unit="D"))
+        values[rng.random(rows) < 0.15] = pd.NaT
+        data[col] = values
+    df = pd.DataFrame(data)
+    return df.replace({np.nan: None})
+
+
+def build_report_rowwise(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """The original ``iterrows`` implementation, verbatim apart from ``safe_days``."""
+    safe_days = AlertService.safe_days
+    projects_json: List[Dict[str, Any]] = []
+
+    for _, row in df.iterrows():
+        durations = {
+            "start_to_rer": safe_days(row.get("rer"), row.get("project_start")),
+            "rec_to_rer": safe_days(row.get("rer"), row.get("rec")),
+            "rec_to_rtc": safe_days(row.get("rtc"), row.get("rec")),
+            "rtc_to_pcc": safe_days(row.get("pcc"), row.get("rtc")),
+            "transport_awarded_to_completed": safe_days(
+                row.get("transport_completed_a"), row.get("transport_awarded_a")
+            ),
+        }
+
+        risk_flags: List[str] = []
+        if row.get("building_permit_approved_a") is None:
+            risk_flags.append("Missing Building Permit Approval")
+        if row.get("nepa_complete_a") is None:
+            risk_flags.append("NEPA Compliance Missing")
+        if durations["start_to_rer"] is not None and durations["start_to_rer"] > 365:
+            risk_flags.append("Duration exceeds threshold for market")
+
+        def fmt_date(val):
+            if isinstance(val, pd.Timestamp) and not pd.isna(val):
+                return val.strftime("%Y-%m-%d")
+            return None
+
+        projects_json.append(
+            {
+                "fuze_project_id": row.get("fuze_project_id"),
+                "site_name": row.get("site_name"),
+                "local_market": row.get("local_market"),
+                "county": row.get("county"),
+                "site_candidate_type": row.get("site_candidate_type"),
+                "structure_owner": row.get("structure_owner"),
+                "vendor_site_acquisition": row.get("vendor_site_acquisition"),
+                "vendor_construction_manager_company": row.get(
+                    "vendor_construction_manager_company"
+                ),
+                "transport_vendor": row.get("transport_vendor"),
+                "project_status": row.get("project_status"),
+                "dates": {
+                    "project_start": fmt_date(row.get("project_start")),
+                    "rec": fmt_date(row.get("rec")),
+                    "rer": fmt_date(row.get("rer")),
+                    "rtc": fmt_date(row.get("rtc")),
+                    "pcc": fmt_date(row.get("pcc")),
+                },
+                "durations": durations,
+                "risk_flags": risk_flags,
+                "aggregates": {},
+            }
+        )
+
+    def median_safe(series: pd.Series) -> Optional[int]:
+        med = series.median()
+        if pd.isna(med):
+            return None
+        try:
+            return int(med)
+        except Exception:
+            return None
+
+    vendor_agg = (
+        df.groupby("vendor_site_acquisition", dropna=False)
+        .apply(
+            lambda g: {
+                "median_start_to_rer": median_safe(
+                    g.apply(lambda x: safe_days(x.get("rer"), x.get("project_start")), axis=1)
+                )
+            }
+        )
+        .to_dict()
+    )
+    for p in projects_json:
+        vendor = p.get("vendor_site_acquisition")
+        if vendor in vendor_agg:
+            p["aggregates"]["vendor"] = vendor_agg[vendor]
+    return projects_json
+
+
+def _reference_view(report: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop the vendor statistics the row-wise version never computed."""
+    view = []
+    for project in report:
+        vendor = project["aggregates"].get("vendor")
+        aggregates = (
+            {"vendor": {"median_start_to_rer": vendor["median_start_to_rer"]}} if vendor else {}
+        )
+        view.append({**project, "aggregates": aggregates})
+    return view
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - started
+
+
+def main(rows: int, skip_reference: bool) -> None:
+    df = synthetic_projects(rows)
+    columnar, t_columnar = _timed(AlertService(db=None).build_report, df)
+    print(f"columnar   {rows:>8} rows  {t_columnar:8.3f}s")
+    if skip_reference:
+        return
+    rowwise, t_rowwise = _timed(build_report_rowwise, df)
+    print(f"row-wise   {rows:>8} rows  {t_rowwise:8.3f}s")
+    print(f"identical output: {rowwise == _reference_view(columnar)}   speedup: {t_rowwise / t_columnar:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument(
+        "--skip-reference", action="store_true", help="Only time the columnar implementation"
+    )
+    args = parser.parse_args()
+    main(args.rows, args.skip_reference)
@@ -5,15 +5,30 @@ from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 
 from agentic_ai.config.langfuse import setup_langfuse
-from backend.app.api import init_routers
+from backend.app.api import RESPONSE_CACHE_RULES, init_routers
+from backend.app.cache import build_cache_backend
+from backend.app.core.config import settings
+from backend.app.db.init_db import init_db
+from backend.app.db.session import AsyncSessionLocal
+from backend.app.jobs import WorkerPool
+from backend.app.jobs.handlers import run_job
+from backend.app.middlewares import ResponseCacheMiddleware
+from backend.app.services.agent_index import agent_index
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_langfuse()
+    await init_db()
+    async with AsyncSessionLocal() as session:
+        await agent_index.load(session)
 
     mlflow_crewai.autolog()
+    # Agent flows submitted through /jobs run here (or in `python -m backend.app.jobs`).
+    workers = WorkerPool(run_job)
+    workers.start()
     yield
+    await workers.stop()
 
 
 app = FastAPI(
@@ -22,6 +37,18 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
 )
+API_PREFIX = "/api/v1"
+
+# Added before CORS so that cached responses still pass through CORSMiddleware.
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        rules=RESPONSE_CACHE_RULES,
+        backend=build_cache_backend(
+            settings.RESPONSE_CACHE_URL, settings.RESPONSE_CACHE_MAX_ENTRIES
+        ),
+        prefix=API_PREFIX,
+    )
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -30,7 +57,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-router = APIRouter(prefix="/api/v1")
+router = APIRouter(prefix=API_PREFIX)
 init_routers(router)
 app.include_router(router)
 
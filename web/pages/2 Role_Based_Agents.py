@@ -10,6 +10,7 @@ load_dotenv()
 # add src to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from agentic_ai.src.role_based_agents.crews.role_summary.config.mapper import get_agent_details, get_task_details
+from utils.jobs import run_job
 
 BASE_URL = os.getenv("BASE_URL")
 API_BASE = f"{BASE_URL}/api/v1"
@@ -73,13 +74,15 @@ def render_agent_breakdown(task_key, task_title, agents_list, captured_output):
 if run_clicked and role:
     with st.spinner("⏳ Hold on... Processing role data. This may take up to a minute."):
         role_resp = requests.get(f"{API_BASE}/alerts/{role}")
-        summary_resp = requests.get(f"{API_BASE}/common/role/summary/{role}")
+        try:
+            summary_data = run_job(API_BASE, f"/jobs/role-summary/{role}")
+        except Exception:
+            summary_data = None
 
-    if role_resp.status_code != 200 or summary_resp.status_code != 200:
+    if role_resp.status_code != 200 or summary_data is None:
         st.error("⚠️ Could not fetch role data from backend.")
     else:
         role_data = role_resp.json()
-        summary_data = summary_resp.json()
 
         # Convert sections into DataFrames
         status_df = pd.DataFrame(role_data.get("status", {}).get("distribution", []))
@@ -11,6 +11,7 @@ import altair as alt
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from agentic_ai.mapper import TASKS, AGENTS
+from utils.jobs import run_job
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -570,8 +571,7 @@ if run_btn:
         # Step 2: Run pipeline
         st.write("Step 2/2 — Running agentic pipeline (crew)…")
         try:
-            common_url = f"{API_BASE}/common/summary/{project_id}"
-            result = call_json(common_url)
+            result = run_job(API_BASE, f"/jobs/project-summary/{project_id}")
             st.session_state["result"] = result
             status.update(label="Agentic pipeline complete.", state="complete")
         except Exception as e:
@@ -1,6 +1,5 @@
 # Agentic_AI.py
 
-import requests
 import streamlit as st
 import os
 import pandas as pd
@@ -8,6 +7,7 @@ import altair as alt
 from utils.response_builder import display_response
 from dotenv import load_dotenv
 from utils.sidebar_logo import add_sidebar_logo
+from utils.jobs import run_job
 from dotenv import load_dotenv
 load_dotenv()
 # =========================
@@ -15,8 +15,8 @@ load_dotenv()
 # =========================
 load_dotenv()
 BASE_URL = os.getenv("BASE_URL")
-API_URL=f"{BASE_URL}/api/v1/query"
-# API_URL = "http://localhost:8000/api/v1/query"  # fallback to localhost for dev
+API_BASE = f"{BASE_URL}/api/v1"
+# API_BASE = "http://localhost:8000/api/v1"  # fallback to localhost for dev
 
 # =========================
 # Sidebar Logo
@@ -28,11 +28,7 @@ add_sidebar_logo()
 # =========================
 @st.cache_data(ttl=300)
 def fetch_data(user_query: str = ""):
-    payload = {"user_query": user_query}
-    headers = {"Content-Type": "application/json"}
-    r = requests.post(API_URL, json=payload, headers=headers, timeout=300)
-    r.raise_for_status()
-    return r.json()
+    return run_job(API_BASE, "/jobs/query", json={"user_query": user_query})
 
 
 # =========================
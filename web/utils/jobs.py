@@ -0,0 +1,26 @@
+import time
+
+import requests
+
+POLL_INTERVAL = 2.0
+
+
+def run_job(api_base: str, submit_path: str, json=None, timeout: float = 900):
+    """
+    Submit an agent job and poll until it finishes. Each request is short, so
+    a slow crew run no longer hits the HTTP timeout, and a finished result can
+    still be fetched later from its job id.
+    """
+    r = requests.post(f"{api_base}{submit_path}", json=json, timeout=30)
+    r.raise_for_status()
+    result_url = f"{api_base}{r.json()['result_url']}"
+
+    deadline = time.monotonic() + timeout
+    while True:
+        r = requests.get(result_url, timeout=30)
+        if r.status_code != 202:
+            r.raise_for_status()
+            return r.json()
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Job still {r.json()['status']} after {timeout:.0f}s: {result_url}")
+        time.sleep(POLL_INTERVAL)